@@ -0,0 +1,84 @@
+"""
+Lab 1
+Concordances of many keywords in one pass over the tokens
+"""
+
+from collections import deque
+from heapq import heappop, heappush
+from itertools import islice
+
+
+def _is_size(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+def _check_contexts(contexts) -> bool:
+    if not isinstance(contexts, dict) or not contexts:
+        return False
+    for word, sizes in contexts.items():
+        if not isinstance(word, str) or not word or not isinstance(sizes, tuple) or len(sizes) != 2:
+            return False
+        if not _is_size(sizes[0]) or not _is_size(sizes[1]) or sizes == (0, 0):
+            return False
+    return True
+
+
+def iter_concordances(tokens, contexts: dict):
+    """
+    Streams concordances of several keywords found in one pass over the tokens
+    A line is yielded as soon as its right context is read, so only the longest left context
+    and the unfinished lines are kept in memory; the tokens can be any iterable, e.g. a generator
+    The lines are not grouped by keyword: lines of different keywords are interleaved
+    in the order their right contexts end, and lines of one keyword come in the text order,
+    so a caller groups the pairs by keyword itself, as get_concordances does;
+    a group is complete only when the generator is exhausted
+    :param tokens: an iterable of tokens
+    :param contexts: a dictionary of keywords with (left_context_size, right_context_size)
+    :return: a generator of (keyword, concordance line) pairs
+    e.g. tokens = ['the', 'man', 'is', 'happy', 'the', 'dog', 'is', 'sad']
+    contexts = {'happy': (1, 1), 'dog': (0, 2)}
+    --> ('happy', ['is', 'happy', 'the']), ('dog', ['dog', 'is', 'sad'])
+    """
+    if isinstance(tokens, (str, bytes, dict)) or not hasattr(tokens, '__iter__') or \
+            not _check_contexts(contexts):
+        return
+    history = deque(maxlen=max(left for left, _ in contexts.values()))
+    pending = []
+    for position, token in enumerate(tokens):
+        for _, _, _, window in pending:
+            window.append(token)
+        while pending and pending[0][0] == position:
+            _, _, word, window = heappop(pending)
+            yield word, window
+        if token in contexts:
+            left_context_size, right_context_size = contexts[token]
+            window = list(islice(history, len(history) - min(left_context_size, len(history)), None))
+            window.append(token)
+            if right_context_size:
+                heappush(pending, (position + right_context_size, position, token, window))
+            else:
+                yield token, window
+        history.append(token)
+    while pending:
+        _, _, word, window = heappop(pending)
+        yield word, window
+
+
+def get_concordances(tokens, contexts: dict) -> dict:
+    """
+    Gets concordances of several keywords in one pass over the tokens,
+    grouping the streamed lines of iter_concordances by keyword
+    Context windows are clipped at the borders of the text
+    :param tokens: an iterable of tokens
+    :param contexts: a dictionary of keywords with (left_context_size, right_context_size)
+    :return: a dictionary of keywords with their concordances
+    e.g. tokens = ['the', 'man', 'is', 'happy', 'the', 'dog', 'is', 'happy']
+    contexts = {'happy': (1, 1), 'dog': (0, 1)}
+    --> {'happy': [['is', 'happy', 'the'], ['is', 'happy']], 'dog': [['dog', 'is']]}
+    """
+    if not _check_contexts(contexts):
+        return {}
+    concordances = {word: [] for word in contexts}
+    for word, window in iter_concordances(tokens, contexts):
+        concordances[word].append(window)
+    return concordances
@@ -0,0 +1,72 @@
+# pylint: skip-file
+"""
+Checks the first lab batch concordance functions
+"""
+
+import unittest
+from main import get_concordance
+from main import tokenize
+from main import read_from_file
+from concordance_index import ConcordanceIndex
+from batch_concordance import get_concordances
+from batch_concordance import iter_concordances
+
+
+class BatchConcordanceTest(unittest.TestCase):
+    """
+    Tests get_concordances and iter_concordances functions
+    """
+
+    tokens = ['the', 'weather', 'is', 'sunny', 'the', 'man', 'is', 'happy',
+              'the', 'dog', 'is', 'happy', 'but', 'the', 'cat', 'is', 'sad']
+
+    def test_get_concordances_ideal(self):
+        """
+        Ideal batch concordance scenario
+        """
+        contexts = {'happy': (2, 3), 'dog': (1, 0), 'sunny': (0, 1), 'unknown': (1, 1)}
+        expected = {'happy': get_concordance(self.tokens, 'happy', 2, 3),
+                    'dog': [['the', 'dog']],
+                    'sunny': [['sunny', 'the']],
+                    'unknown': []}
+        self.assertEqual(expected, get_concordances(self.tokens, contexts))
+
+    def test_iter_concordances_streaming(self):
+        """
+        Checks that lines are streamed from a generator as soon as their right context is read
+        """
+        contexts = {'happy': (1, 4), 'dog': (1, 1)}
+        expected = [('dog', ['the', 'dog', 'is']),
+                    ('happy', ['is', 'happy', 'the', 'dog', 'is', 'happy']),
+                    ('happy', ['is', 'happy', 'but', 'the', 'cat', 'is'])]
+        self.assertEqual(expected, list(iter_concordances(iter(self.tokens), contexts)))
+
+    def test_get_concordances_borders(self):
+        """
+        Checks that context windows are clipped at the borders of the text
+        """
+        contexts = {'happy': (1000, 1000)}
+        self.assertEqual({'happy': [['one', 'happy', 'man']]}, get_concordances(['one', 'happy', 'man'], contexts))
+
+    def test_get_concordances_bad_inputs(self):
+        """
+        Checks that batch concordance functions handle incorrect inputs
+        """
+        bad_contexts = [{}, [], None, 'happy', {'happy': (0, 0)}, {'happy': (-1, 2)},
+                        {'happy': (True, 2)}, {'happy': 2}, {None: (1, 1)}, {'': (1, 1)}]
+        for bad_input in bad_contexts:
+            self.assertEqual({}, get_concordances(self.tokens, bad_input))
+            self.assertEqual([], list(iter_concordances(self.tokens, bad_input)))
+        for bad_input in ['string', None, 9]:
+            self.assertEqual([], list(iter_concordances(bad_input, {'happy': (1, 1)})))
+
+    def test_big_text_get_concordances(self):
+        """
+        Checks that one pass gives the same concordances as separate queries
+        """
+        tokens = tokenize(read_from_file('lab_1/data.txt'))
+        index = ConcordanceIndex(tokens)
+        contexts = {'tex': (4, 14), 'sodium': (1, 1), 'world': (3, 0), 'happy': (0, 5), 'the': (2, 2)}
+        actual = get_concordances(tokens, contexts)
+        for word, (left_context_size, right_context_size) in contexts.items():
+            self.assertEqual(index.get_concordance(word, left_context_size, right_context_size), actual[word])
@@ -0,0 +1,476 @@
+"""
+Performance benchmarks for the concordance pipeline
+Run: python lab_1/benchmark.py [benchmark name]
+"""
+
+import argparse
+import os
+import re
+import tempfile
+import timeit
+import tracemalloc
+from array import array
+from collections import Counter
+from fnmatch import fnmatchcase
+import main
+from frequencies import FrequencyCounter, SpaceSaving
+from concordance_index import ConcordanceIndex
+from batch_concordance import get_concordances
+from collocations import Collocations
+from compressed_postings import CompressedPostings
+from count_min import CountMinSketch
+from concordance_windows import get_concordance_windows, iter_concordance_windows
+from concordance_writer import write_concordance
+from sorted_concordance import ConcordanceSorter
+from suffix_array import SuffixArrayIndex
+from text_offsets import TextTokens
+from token_cache import TokenCache
+from wildcard_index import WildcardIndex
+from disk_index import DiskConcordanceIndex, build_disk_index_from_file
+from stop_word_filter import StopWordFilter
+from tokenizer import BACKENDS, tokenize_file, tokenize_text
+from parallel import calculate_frequencies_parallel
+from vocabulary import Vocabulary
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(CURRENT_DIR, 'data.txt')
+
+
+def legacy_calculate_frequencies(tokens: list) -> dict:
+    """
+    The former set + list.count implementation kept as a baseline, O(N * V)
+    """
+    return {word: tokens.count(word) for word in set(tokens)}
+
+
+def measure(function, *args) -> float:
+    """
+    Runs the function once and returns the elapsed time in seconds
+    """
+    start_time = timeit.default_timer()
+    function(*args)
+    return timeit.default_timer() - start_time
+
+
+def measure_peak_memory(function, *args) -> float:
+    """
+    Runs the function once and returns the peak of traced allocations in megabytes
+    """
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2 ** 20
+
+
+def benchmark_frequencies(tokens: list):
+    """
+    Compares the legacy frequency counting with the single-pass one
+    """
+    print(f'Tokens: {len(tokens)}, vocabulary: {len(set(tokens))}')
+    single_pass = measure(main.calculate_frequencies, tokens)
+    print(f'calculate_frequencies (Counter): {single_pass:.4f} s')
+    chunked = measure(lambda: FrequencyCounter().update_from_file(DATA_PATH))
+    print(f'FrequencyCounter.update_from_file: {chunked:.4f} s')
+    legacy = measure(legacy_calculate_frequencies, tokens)
+    print(f'legacy set + count: {legacy:.4f} s ({legacy / single_pass:.0f}x slower)')
+
+
+def benchmark_top_words(tokens: list, top_n=100):
+    """
+    Compares full sorting, heap selection and the fixed-memory Space-Saving sketch
+    """
+    freq_dict = main.calculate_frequencies(tokens)
+    full_sort = measure(lambda: sorted(freq_dict, key=freq_dict.get, reverse=True)[:top_n])
+    print(f'sorted: {full_sort:.4f} s')
+    print(f'get_top_n_words (heap): {measure(main.get_top_n_words, freq_dict, top_n):.4f} s')
+    for capacity in (1000, 5000):
+        sketch = SpaceSaving(capacity)
+        streamed = measure(sketch.update, tokens)
+        exact = sketch.get_top_n_words(top_n) == main.get_top_n_words(freq_dict, top_n)
+        print(f'SpaceSaving({capacity}): {streamed:.4f} s, error bound {sketch.error_bound:.1f}, '
+              f'guaranteed {sketch.is_guaranteed(top_n)}, same top {exact}')
+
+
+def benchmark_concordance(tokens: list, n_words=200):
+    """
+    Compares repeated main.get_concordance scans with queries to a ConcordanceIndex
+    """
+    # main.get_concordance widens every window to a text border when some hit is that close to it
+    borders = set(tokens[:3] + tokens[-3:])
+    words = [word for word in main.get_top_n_words(main.calculate_frequencies(tokens), n_words)
+             if word not in borders]
+    scans = measure(lambda: [len(main.get_concordance(tokens, word, 3, 3)) for word in words])
+    print(f'main.get_concordance x {len(words)}: {scans:.4f} s')
+    index = None
+
+    def build():
+        nonlocal index
+        index = ConcordanceIndex(tokens)
+
+    print(f'ConcordanceIndex build: {measure(build):.4f} s')
+    queries = measure(lambda: [index.get_concordance(word, 3, 3) for word in words])
+    print(f'ConcordanceIndex.get_concordance x {len(words)}: {queries:.4f} s')
+    batch = measure(get_concordances, tokens, {word: (3, 3) for word in words})
+    print(f'get_concordances of {len(words)} words in one pass: {batch:.4f} s')
+
+
+def benchmark_disk_index(tokens: list, n_words=200):
+    """
+    Measures building, opening and querying the memory-mapped index of data.txt
+    """
+    words = main.get_top_n_words(main.calculate_frequencies(tokens), n_words)
+    with tempfile.TemporaryDirectory() as path_to_dir:
+        print(f'build_disk_index_from_file: {measure(build_disk_index_from_file, DATA_PATH, path_to_dir):.4f} s')
+        print(f'DiskConcordanceIndex open: {measure(lambda: DiskConcordanceIndex(path_to_dir).close()):.6f} s')
+        with DiskConcordanceIndex(path_to_dir) as index:
+            queries = measure(lambda: [index.get_concordance(word, 3, 3) for word in words])
+            print(f'DiskConcordanceIndex.get_concordance x {len(words)}: {queries:.4f} s')
+
+
+def benchmark_stop_words(tokens: list):
+    """
+    Compares stop word removal against a list, a frozenset and an id byte table
+    """
+    stop_words = main.read_from_file(os.path.join(CURRENT_DIR, 'stop_words.txt')).split('\n')
+    legacy = measure(lambda: [word for word in tokens if word not in stop_words])
+    print(f'list membership: {legacy:.4f} s')
+    print(f'remove_stop_words (frozenset): {measure(main.remove_stop_words, tokens, stop_words):.4f} s')
+    word_ids = {word: word_id for word_id, word in enumerate(dict.fromkeys(tokens))}
+    stop_word_filter = StopWordFilter(stop_words, word_ids)
+    print(f'StopWordFilter.filter: {measure(stop_word_filter.filter, tokens):.4f} s')
+    ids = array('I', [word_ids[word] for word in tokens])
+    print(f'StopWordFilter.filter_ids: {measure(stop_word_filter.filter_ids, ids):.4f} s')
+
+
+def benchmark_tokenize(tokens: list):
+    """
+    Compares whole-file tokenization with the streaming tokenizer by time and peak memory,
+    the tokens are only counted so that the result itself is not kept
+    """
+    print(f'Tokens: {len(tokens)}')
+
+    def whole_file():
+        return len(main.tokenize(main.read_from_file(DATA_PATH)))
+
+    def streaming():
+        return sum(1 for _ in tokenize_file(DATA_PATH))
+
+    for name, function in (('read_from_file + tokenize', whole_file), ('tokenize_file', streaming)):
+        print(f'{name}: {measure(function):.4f} s, peak {measure_peak_memory(function):.1f} MB')
+
+
+def benchmark_parallel(tokens: list, copies=8):
+    """
+    Measures the scaling of parallel counting over 1, 2, 4 and 8 workers on a replicated data.txt
+    """
+    with tempfile.TemporaryDirectory() as path_to_dir:
+        path_to_file = os.path.join(path_to_dir, 'data.txt')
+        data = main.read_from_file(DATA_PATH)
+        with open(path_to_file, 'w', encoding='utf-8') as file:
+            for _ in range(copies):
+                file.write(data + '\n')
+        print(f'Tokens: {len(tokens) * copies}, cpu cores: {os.cpu_count()}')
+        serial = measure(lambda: FrequencyCounter().update_from_file(path_to_file))
+        print(f'serial FrequencyCounter.update_from_file: {serial:.4f} s')
+        expected = FrequencyCounter().update_from_file(path_to_file).to_dict()
+        for workers in (1, 2, 4, 8):
+            elapsed = measure(calculate_frequencies_parallel, path_to_file, workers)
+            same = calculate_frequencies_parallel(path_to_file, workers) == expected
+            print(f'calculate_frequencies_parallel, {workers} workers: {elapsed:.4f} s '
+                  f'({serial / elapsed:.2f}x), same result {same}')
+
+
+def benchmark_encoded(tokens: list):
+    """
+    Compares memory per token and main functions on token lists and on encoded tokens
+    """
+    text = main.read_from_file(DATA_PATH)
+    tracemalloc.start()
+    tokens_list = main.tokenize(text)
+    list_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    vocabulary = Vocabulary()
+    tracemalloc.start()
+    encoded = vocabulary.encode(tokens_list)
+    encoded_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del tokens_list
+    print(f'token list: {list_memory / len(encoded):.1f} bytes per token, '
+          f'encoded: {encoded.ids.itemsize} bytes per token in the id array, '
+          f'{encoded_memory / len(encoded):.1f} with the vocabulary')
+    words = [word for word in main.get_top_n_words(main.calculate_frequencies(tokens), 200)[100:]
+             if word not in tokens[:3] + tokens[-3:]]
+
+    def query_words(text_tokens):
+        return [main.get_concordance(text_tokens, word, 3, 3) for word in words]
+
+    for name, text_tokens in (('list', tokens), ('encoded', encoded)):
+        frequencies = measure(main.calculate_frequencies, text_tokens)
+        concordances = measure(query_words, text_tokens)
+        print(f'{name}: calculate_frequencies {frequencies:.4f} s, '
+              f'get_concordance x {len(words)} {concordances:.4f} s')
+
+
+def legacy_tokenize(text: str) -> list:
+    """
+    The former tokenizer compiling its pattern on every call, kept as a baseline
+    """
+    return re.sub('[^a-z \n]', '', text.lower()).split()
+
+
+def benchmark_tokenizer_backends(tokens: list, repeats=5):
+    """
+    Compares tokenizer backends on the whole data.txt and on its lines
+    """
+    text = main.read_from_file(DATA_PATH)
+    lines = text.split('\n')
+    print(f'Tokens: {len(tokens)}, lines: {len(lines)}')
+
+    def by_lines(tokenize_line, *args):
+        return [tokenize_line(line, *args) for line in lines]
+
+    candidates = [('legacy re.sub', legacy_tokenize, ())]
+    candidates += [(name, tokenize_text, (name,)) for name in BACKENDS]
+    candidates += [('auto', tokenize_text, ())]
+    for name, function, args in candidates:
+        whole = min(measure(function, text, *args) for _ in range(repeats))
+        per_line = min(measure(by_lines, function, *args) for _ in range(repeats))
+        print(f'{name}: whole text {whole:.4f} s, line by line {per_line:.4f} s')
+    data = text.encode('utf-8')
+    print(f'auto on utf-8 bytes: {min(measure(tokenize_text, data) for _ in range(repeats)):.4f} s')
+
+
+def benchmark_windows(tokens: list, n_words=20, context_size=10):
+    """
+    Compares time and peak memory of copied concordance lines and lazy windows
+    """
+    borders = set(tokens[:context_size] + tokens[-context_size:])
+    words = [word for word in main.get_top_n_words(main.calculate_frequencies(tokens), n_words)
+             if word not in borders]
+
+    def query_words(function, text_tokens):
+        return [function(text_tokens, word, context_size, context_size) for word in words]
+
+    encoded = Vocabulary().encode(tokens)
+    for name, function, text_tokens in (('main.get_concordance', main.get_concordance, tokens),
+                                        ('get_concordance_windows', get_concordance_windows, tokens),
+                                        ('get_concordance_windows encoded', get_concordance_windows,
+                                         encoded)):
+        seconds = measure(query_words, function, text_tokens)
+        peak = measure_peak_memory(query_words, function, text_tokens)
+        print(f'{name} x {len(words)}: {seconds:.4f} s, peak {peak:.1f} MiB')
+
+
+def benchmark_sorting(tokens: list):
+    """
+    Compares main.sort_concordance with multi-word keys sorted in memory and with runs spilled to disk
+    """
+    borders = set(tokens[:3] + tokens[-3:])
+    word = next(word for word in main.get_top_n_words(main.calculate_frequencies(tokens), 100)
+                if word not in borders)
+    sorter = ConcordanceSorter(3, 3, False)
+    print(f'main.sort_concordance of {word!r}: {measure(main.sort_concordance, tokens, word, 3, 3, False):.4f} s, '
+          f'{len(main.sort_concordance(tokens, word, 3, 3, False))} lines kept')
+    print(f'ConcordanceSorter.sort: {measure(sorter.sort, tokens, word):.4f} s, '
+          f'{len(sorter.sort(tokens, word))} lines kept')
+    sorter.run_size = 1000
+
+    def sort_externally():
+        return sum(1 for _ in sorter.iter_sorted(tokens, word))
+
+    seconds = measure(sort_externally)
+    peak = measure_peak_memory(sort_externally)
+    print(f'ConcordanceSorter.iter_sorted by runs of {sorter.run_size}: {seconds:.4f} s, peak {peak:.1f} MiB')
+
+
+def benchmark_writer(tokens: list, context_size=5):
+    """
+    Compares peak memory of main.write_to_file and of the streaming writer for a report of every word
+    """
+    index = ConcordanceIndex(tokens)
+    words = sorted(index.positions)
+
+    def iter_report():
+        for word in words:
+            yield from iter_concordance_windows(tokens, index.get_positions(word), context_size, context_size)
+
+    with tempfile.TemporaryDirectory() as path_to_dir:
+        path_to_file = os.path.join(path_to_dir, 'report.txt')
+        peak = measure_peak_memory(lambda: main.write_to_file(list(iter_report()), path_to_file))
+        print(f'main.write_to_file: peak {peak:.1f} MiB, {os.path.getsize(path_to_file) / 2 ** 20:.1f} MiB report')
+        for compression in (None, 'gzip'):
+            seconds = measure(write_concordance, iter_report(), path_to_file, compression)
+            peak = measure_peak_memory(write_concordance, iter_report(), path_to_file, compression)
+            print(f'write_concordance {compression}: {seconds:.4f} s, peak {peak:.1f} MiB, '
+                  f'{os.path.getsize(path_to_file) / 2 ** 20:.1f} MiB report')
+
+
+def benchmark_suffix_array(tokens: list, phrases=('of the', 'the man', 'in the world', 'it is a')):
+    """
+    Compares phrase lookups in a suffix array with scans of the tokens
+    """
+    index = None
+
+    def build():
+        nonlocal index
+        index = SuffixArrayIndex(tokens)
+
+    print(f'SuffixArrayIndex build of {len(tokens)} tokens: {measure(build):.4f} s')
+    def scan(phrase_words):
+        return [position for position in range(len(tokens) - len(phrase_words) + 1)
+                if tokens[position:position + len(phrase_words)] == phrase_words]
+
+    for phrase in phrases:
+        print(f'{phrase!r}: scan {measure(scan, phrase.split()):.4f} s, '
+              f'suffix array {measure(index.get_positions, phrase):.6f} s, {index.count(phrase)} hits')
+
+
+def benchmark_wildcard(tokens: list, patterns=('happ*', 'co*', 's*', '*ness')):
+    """
+    Compares wildcard concordances with a vocabulary scan and a get_concordance call per matching word
+    """
+    index = ConcordanceIndex(tokens)
+    wildcard_index = WildcardIndex(index)
+
+    def scan(pattern):
+        words = [word for word in index.positions if fnmatchcase(word, pattern)]
+        return [index.get_concordance(word, 3, 3) for word in words]
+
+    for pattern in patterns:
+        print(f'{pattern!r}: {len(wildcard_index.match(pattern))} words, '
+              f'vocabulary scan {measure(scan, pattern):.4f} s, '
+              f'wildcard index {measure(wildcard_index.get_concordance, pattern, 3, 3):.4f} s')
+
+
+def benchmark_compressed(tokens: list, n_words=200):
+    """
+    Compares the sizes of plain and compressed posting lists with data.txt and their query times
+    """
+    index = ConcordanceIndex(tokens)
+    compressed = ConcordanceIndex(tokens, CompressedPostings(index.positions))
+    plain_size = sum(positions.itemsize * len(positions) for positions in index.positions.values())
+    text_size = os.path.getsize(DATA_PATH)
+    print(f'data.txt: {text_size} bytes, plain postings: {plain_size} bytes ({plain_size / text_size:.0%}), '
+          f'compressed postings: {compressed.positions.nbytes} bytes ({compressed.positions.nbytes / text_size:.0%})')
+    frequencies = main.calculate_frequencies(tokens)
+    top_words = main.get_top_n_words(frequencies, n_words * 2)
+    words = top_words[n_words:]
+
+    def query_words(query_index):
+        return [query_index.get_concordance(word, 3, 3) for word in words]
+
+    for name, query_index in (('plain', index), ('compressed', compressed)):
+        seconds = measure(query_words, query_index)
+        print(f'{name}: get_concordance {seconds / len(words) * 1000:.3f} ms per word '
+              f'of {sum(frequencies[word] for word in words) // len(words)} hits on average, '
+              f'positions of {top_words[0]!r} {measure(query_index.get_positions, top_words[0]) * 1000:.3f} ms')
+
+
+def benchmark_cache(tokens: list):
+    """
+    Compares reading and tokenizing data.txt with cold and warm token cache requests
+    """
+    print(f'main.tokenize of {len(tokens)} tokens with reading: '
+          f'{measure(lambda: main.tokenize(main.read_from_file(DATA_PATH))):.4f} s')
+    with tempfile.TemporaryDirectory() as path_to_dir:
+        cache = TokenCache(path_to_dir)
+        print(f'cold cache: {measure(cache.load_tokens, DATA_PATH):.4f} s, entry {cache.total_size} bytes')
+        print(f'warm cache: {measure(cache.load_tokens, DATA_PATH):.4f} s tokens, '
+              f'{measure(cache.load_encoded, DATA_PATH):.4f} s encoded tokens')
+
+
+def benchmark_offsets(tokens: list, word='world'):
+    """
+    Compares tokenization with and without offsets and renders a concordance from a mapped file
+    """
+    text = main.read_from_file(DATA_PATH)
+    print(f'main.tokenize: {measure(main.tokenize, text):.4f} s, '
+          f'TextTokens: {measure(TextTokens, text):.4f} s, '
+          f'TextTokens.from_file: {measure(lambda: TextTokens.from_file(DATA_PATH).close()):.4f} s')
+    with TextTokens.from_file(DATA_PATH) as text_tokens:
+        offsets_size = text_tokens.starts.itemsize * (len(text_tokens.starts) + len(text_tokens.ends))
+        print(f'offsets of {len(tokens)} tokens: {offsets_size} bytes')
+        index = ConcordanceIndex(text_tokens)
+        windows = index.get_windows(word, 3, 3)
+        print(f'rendering {len(windows)} windows of {word!r}: {measure(text_tokens.render_windows, windows):.4f} s')
+        for line in text_tokens.render_windows(windows[:3]):
+            print('\t', line)
+
+
+def benchmark_collocations(tokens: list, window=5, n_words=20):
+    """
+    Compares collocation counts of all words with NumPy and the neighbours of a few words counted in Python
+    """
+    words = main.get_top_n_words(main.calculate_frequencies(tokens), n_words)
+    borders = set(tokens[:window] + tokens[-window:])
+    words = [word for word in words if word not in borders]
+
+    def count_neighbours():
+        return {word: Counter(neighbour for context in main.get_concordance(tokens, word, window, window)
+                              for neighbour in context) for word in words}
+
+    print(f'main.get_concordance neighbour counts of {len(words)} words: {measure(count_neighbours):.4f} s')
+    collocations = None
+
+    def build():
+        nonlocal collocations
+        collocations = Collocations(tokens, window)
+
+    print(f'Collocations of all words: {measure(build):.4f} s, {len(collocations.counts)} pairs')
+    for name in ('pmi', 't_score', 'log_likelihood'):
+        print(f'{name} of all pairs: {measure(collocations.score, name):.4f} s, '
+              f'{words[0]!r}: {collocations.get_collocates(words[0], name, 5, 5)}')
+
+
+def benchmark_count_min(tokens: list, top_n=100):
+    """
+    Compares exact counting with Count-Min sketches of several widths, with and without the conservative update
+    """
+    freq_dict = main.calculate_frequencies(tokens)
+    print(f'calculate_frequencies: {measure(main.calculate_frequencies, tokens):.4f} s')
+    exact_top = set(main.get_top_n_words(freq_dict, top_n))
+    for width in (1 << 12, 1 << 14):
+        for conservative in (False, True):
+            sketch = CountMinSketch(width, 4, conservative, top_n)
+            streamed = measure(sketch.update, tokens)
+            errors = [sketch[word] - count for word, count in freq_dict.items()]
+            print(f'CountMinSketch({width}, 4, conservative={conservative}): {streamed:.4f} s, '
+                  f'{sketch.table.nbytes / 2 ** 10:.0f} KiB, mean error {sum(errors) / len(errors):.2f}, '
+                  f'max error {max(errors)}, bound {sketch.error_bound:.1f}, '
+                  f'same top {len(exact_top & set(sketch.get_top_n_words(top_n)))}/{top_n}')
+
+
+BENCHMARKS = {
+    'frequencies': benchmark_frequencies,
+    'top_words': benchmark_top_words,
+    'concordance': benchmark_concordance,
+    'disk_index': benchmark_disk_index,
+    'stop_words': benchmark_stop_words,
+    'tokenize': benchmark_tokenize,
+    'parallel': benchmark_parallel,
+    'encoded': benchmark_encoded,
+    'tokenizer_backends': benchmark_tokenizer_backends,
+    'windows': benchmark_windows,
+    'sorting': benchmark_sorting,
+    'writer': benchmark_writer,
+    'suffix_array': benchmark_suffix_array,
+    'wildcard': benchmark_wildcard,
+    'compressed': benchmark_compressed,
+    'cache': benchmark_cache,
+    'offsets': benchmark_offsets,
+    'collocations': benchmark_collocations,
+    'count_min': benchmark_count_min,
+}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Runs lab_1 performance benchmarks on data.txt')
+    parser.add_argument('names', nargs='*', default=list(BENCHMARKS), help='benchmarks to run')
+    parser.add_argument('--limit', type=int, default=None, help='use only the first N tokens')
+    options = parser.parse_args()
+
+    data_tokens = main.tokenize(main.read_from_file(DATA_PATH))[:options.limit]
+    for benchmark_name in options.names:
+        print(f'--- {benchmark_name} ---')
+        BENCHMARKS[benchmark_name](data_tokens)
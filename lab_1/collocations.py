@@ -0,0 +1,134 @@
+"""
+Lab 1
+Collocation statistics of all the words counted with NumPy over token ids
+"""
+
+import numpy as np
+from vocabulary import EncodedTokens, Vocabulary
+
+
+def _pmi(observed, expected, _):
+    return np.log2(observed / expected)
+
+
+def _t_score(observed, expected, _):
+    return (observed - expected) / np.sqrt(observed)
+
+
+def _log_likelihood(observed, expected, table):
+    # 2 * sum of O * ln(O / E) over the four cells of the contingency table
+    score = np.zeros(len(observed))
+    for cell_observed, cell_expected in table:
+        positive = cell_observed > 0
+        score[positive] += cell_observed[positive] * np.log(cell_observed[positive] / cell_expected[positive])
+    return np.sign(observed - expected) * 2 * score
+
+
+MEASURES = {
+    'pmi': _pmi,
+    't_score': _t_score,
+    'log_likelihood': _log_likelihood,
+}
+
+
+class Collocations:
+    """
+    Counts how often every pair of words occurs within a window of words on each side
+    and scores the pairs with pointwise mutual information, t-score or log-likelihood
+    The pairs of all positions and distances are counted at once as sorted pair keys,
+    so the whole data.txt takes a fraction of a second
+    A pair (keyword, collocate) is a cell of a contingency table, where the marginals are the numbers
+    of pairs with the keyword and with the collocate and the sample is the number of all pairs;
+    log-likelihood is signed, so collocates occurring less than expected get negative scores
+    e.g. collocations = Collocations(['the', 'man', 'is', 'happy', 'the', 'man', 'is', 'sad'], 1)
+    collocations.get_collocates('man', 't_score', 2)
+    --> [('the', 0.80...), ('is', 0.60...)]
+    """
+
+    def __init__(self, tokens, window=5):
+        if isinstance(tokens, (str, bytes, dict)) or not hasattr(tokens, '__iter__'):
+            raise ValueError
+        if not isinstance(window, int) or isinstance(window, bool) or window < 1:
+            raise ValueError
+        if not isinstance(tokens, EncodedTokens):
+            tokens = Vocabulary().encode(tokens)
+        self.tokens = tokens
+        self.window = window
+        ids = np.frombuffer(tokens.ids, dtype=np.uint32).astype(np.int64) if len(tokens) else \
+            np.zeros(0, dtype=np.int64)
+        n_words = len(tokens.vocabulary)
+        keys = []
+        for distance in range(1, min(window, len(ids) - 1) + 1):
+            left, right = ids[:-distance], ids[distance:]
+            keys.append(left * n_words + right)
+            keys.append(right * n_words + left)
+        keys = np.concatenate(keys) if keys else np.zeros(0, dtype=np.int64)
+        pair_keys, counts = np.unique(keys, return_counts=True)
+        self.keywords, self.collocates = np.divmod(pair_keys, max(n_words, 1))
+        self.counts = counts
+        # pairs are counted in both directions, so the keyword and the collocate marginals are equal
+        self.totals = np.bincount(self.keywords, weights=counts, minlength=n_words)
+        self.n_pairs = int(counts.sum())
+
+    def count(self, keyword: str, collocate: str) -> int:
+        """
+        Returns the number of times the words occur within the window of each other
+        """
+        vocabulary = self.tokens.vocabulary
+        if not isinstance(keyword, str) or not isinstance(collocate, str) or \
+                keyword not in vocabulary or collocate not in vocabulary:
+            return 0
+        first, last = self._rows(vocabulary.ids[keyword])
+        position = first + np.searchsorted(self.collocates[first:last], vocabulary.ids[collocate])
+        if position < last and self.collocates[position] == vocabulary.ids[collocate]:
+            return int(self.counts[position])
+        return 0
+
+    def _rows(self, keyword_id: int) -> tuple:
+        # the range of the pairs of a keyword, pairs are sorted by keyword and collocate ids
+        return (int(np.searchsorted(self.keywords, keyword_id)),
+                int(np.searchsorted(self.keywords, keyword_id, side='right')))
+
+    def score(self, measure='pmi', pairs=slice(None)) -> np.ndarray:
+        """
+        Scores word pairs
+        :param measure: 'pmi', 't_score' or 'log_likelihood'
+        :param pairs: a slice or an index array of the pairs, all the pairs by default
+        :return: an array of scores
+        """
+        if measure not in MEASURES:
+            raise ValueError
+        observed = self.counts[pairs].astype(np.float64)
+        row = self.totals[self.keywords[pairs]]
+        column = self.totals[self.collocates[pairs]]
+        total = self.n_pairs
+        expected = row * column / total
+        table = ((observed, expected),
+                 (row - observed, row * (total - column) / total),
+                 (column - observed, (total - row) * column / total),
+                 (total - row - column + observed, (total - row) * (total - column) / total))
+        return MEASURES[measure](observed, expected, table)
+
+    def get_collocates(self, keyword: str, measure='pmi', top_n=10, min_count=1) -> list:
+        """
+        Ranks the collocates of a keyword
+        :param keyword: a word
+        :param measure: 'pmi', 't_score' or 'log_likelihood'
+        :param top_n: the number of collocates
+        :param min_count: the minimal number of co-occurrences, as pmi overrates rare pairs
+        :return: a list of (collocate, score) pairs by descending score, ties in the order of word ids
+        """
+        if measure not in MEASURES:
+            raise ValueError
+        for value in (top_n, min_count):
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                raise ValueError
+        vocabulary = self.tokens.vocabulary
+        if not isinstance(keyword, str) or keyword not in vocabulary:
+            return []
+        first, last = self._rows(vocabulary.ids[keyword])
+        pairs = first + np.flatnonzero(self.counts[first:last] >= min_count)
+        scores = self.score(measure, pairs)
+        order = np.argsort(-scores, kind='stable')[:top_n]
+        return [(vocabulary.words[collocate], float(score))
+                for collocate, score in zip(self.collocates[pairs[order]].tolist(), scores[order].tolist())]
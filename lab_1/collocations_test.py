@@ -0,0 +1,106 @@
+# pylint: skip-file
+"""
+Checks the first lab collocation statistics
+"""
+
+import math
+import unittest
+from collections import Counter
+from main import tokenize
+from main import read_from_file
+from collocations import Collocations
+from vocabulary import Vocabulary
+
+
+class CollocationsTest(unittest.TestCase):
+    """
+    Tests Collocations class
+    """
+
+    tokens = ['the', 'weather', 'is', 'sunny', 'the', 'man', 'is', 'happy',
+              'the', 'dog', 'is', 'happy', 'but', 'the', 'cat', 'is', 'sad']
+
+    def _count_pairs(self, tokens, window):
+        pairs = Counter()
+        for position, keyword in enumerate(tokens):
+            for other in range(max(position - window, 0), min(position + window + 1, len(tokens))):
+                if other != position:
+                    pairs[keyword, tokens[other]] += 1
+        return pairs
+
+    def test_collocations_counts(self):
+        """
+        Checks co-occurrence counts against a loop over all windows
+        """
+        for window in [1, 2, 5, 100]:
+            collocations = Collocations(self.tokens, window)
+            pairs = self._count_pairs(self.tokens, window)
+            for keyword in set(self.tokens):
+                for collocate in set(self.tokens):
+                    self.assertEqual(pairs[keyword, collocate], collocations.count(keyword, collocate))
+            self.assertEqual(sum(pairs.values()), collocations.n_pairs)
+        self.assertEqual(0, collocations.count('unknown', 'the'))
+
+    def test_collocations_scores(self):
+        """
+        Checks the measures against their formulas
+        """
+        collocations = Collocations(self.tokens, 2)
+        pairs = self._count_pairs(self.tokens, 2)
+        total = sum(pairs.values())
+        row = sum(count for (keyword, _), count in pairs.items() if keyword == 'happy')
+        column = sum(count for (_, collocate), count in pairs.items() if collocate == 'is')
+        observed = pairs['happy', 'is']
+        expected = row * column / total
+        scores = dict(collocations.get_collocates('happy', 'pmi', 100))
+        self.assertAlmostEqual(math.log2(observed / expected), scores['is'])
+        scores = dict(collocations.get_collocates('happy', 't_score', 100))
+        self.assertAlmostEqual((observed - expected) / math.sqrt(observed), scores['is'])
+        table = [(observed, expected), (row - observed, row * (total - column) / total),
+                 (column - observed, (total - row) * column / total),
+                 (total - row - column + observed, (total - row) * (total - column) / total)]
+        log_likelihood = 2 * sum(cell * math.log(cell / cell_expected) for cell, cell_expected in table if cell)
+        scores = dict(collocations.get_collocates('happy', 'log_likelihood', 100))
+        self.assertAlmostEqual(log_likelihood, scores['is'])
+
+    def test_collocations_ranking(self):
+        """
+        Checks that collocates are ranked by descending score and filtered by count
+        """
+        collocations = Collocations(Vocabulary().encode(self.tokens), 2)
+        for measure in ['pmi', 't_score', 'log_likelihood']:
+            collocates = collocations.get_collocates('is', measure, 100)
+            scores = [score for _, score in collocates]
+            self.assertEqual(sorted(scores, reverse=True), scores)
+            self.assertEqual(3, len(collocations.get_collocates('is', measure, 3)))
+        self.assertEqual(['the', 'happy'], [word for word, _ in collocations.get_collocates('is', 'pmi', 10, 2)])
+
+    def test_collocations_big_text(self):
+        """
+        Checks counts of a big text against the neighbours of main.get_adjacent_words
+        """
+        tokens = tokenize(read_from_file('lab_1/data.txt'))
+        collocations = Collocations(tokens, 3)
+        neighbours = Counter()
+        for position, token in enumerate(tokens):
+            if token == 'sodium':
+                neighbours.update(tokens[max(position - 3, 0):position] + tokens[position + 1:position + 4])
+        self.assertEqual(dict(neighbours), {word: collocations.count('sodium', word) for word in neighbours})
+        self.assertEqual(len(neighbours), len(collocations.get_collocates('sodium', 'pmi', 100)))
+        self.assertEqual('war', collocations.get_collocates('world', 'log_likelihood', 1)[0][0])
+
+    def test_collocations_bad_inputs(self):
+        """
+        Checks that incorrect arguments are rejected
+        """
+        for bad_input in ['string', {}, None, 9]:
+            self.assertRaises(ValueError, Collocations, bad_input)
+        for bad_input in [0, -1, 1.5, None, True]:
+            self.assertRaises(ValueError, Collocations, self.tokens, bad_input)
+        collocations = Collocations(self.tokens)
+        self.assertRaises(ValueError, collocations.get_collocates, 'is', 'dice')
+        self.assertRaises(ValueError, collocations.get_collocates, 'is', 'pmi', -1)
+        for bad_input in [None, 9, 'unknown', '']:
+            self.assertEqual([], collocations.get_collocates(bad_input))
+        self.assertEqual([], Collocations([]).get_collocates('is'))
+        self.assertEqual([], Collocations(['one']).get_collocates('one'))
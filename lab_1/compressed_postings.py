@@ -0,0 +1,125 @@
+"""
+Lab 1
+Delta + varint compressed posting lists
+"""
+
+from array import array
+from collections.abc import Mapping
+import numpy as np
+from concordance_index import ConcordanceIndex
+
+MAX_VARINT_SIZE = 10
+
+
+def _encode_varints(values: np.ndarray) -> tuple:
+    # the varints of all the values written at once, byte by byte, and the size of every varint
+    values = values.astype(np.uint64)
+    sizes = np.ones(len(values), dtype=np.int64)
+    for size in range(1, MAX_VARINT_SIZE):
+        sizes += values >= np.uint64(1 << 7 * size)
+    starts = np.cumsum(sizes) - sizes
+    encoded = np.zeros(int(sizes.sum()), dtype=np.uint8)
+    for byte_index in range(int(sizes.max(initial=0))):
+        written = sizes > byte_index
+        chunk = (values[written] >> np.uint64(7 * byte_index)) & np.uint64(0x7f)
+        chunk |= np.where(sizes[written] > byte_index + 1, 0x80, 0).astype(np.uint64)
+        encoded[starts[written] + byte_index] = chunk
+    return encoded, sizes
+
+
+def encode_deltas(positions) -> bytes:
+    """
+    Compresses ascending positions: every position is replaced by its difference with the previous one
+    and the differences are written as varints, 7 bits per byte with the high bit set on all bytes
+    but the last, so frequent words take about one byte per position
+    :param positions: an iterable of non-negative positions in ascending order
+    :return: the encoded bytes
+    e.g. positions = [3, 10, 300]
+    --> b'\\x03\\x07\\xa2\\x02'
+    """
+    deltas = np.diff(np.fromiter(positions, dtype=np.int64), prepend=0)
+    if deltas.size and deltas.min() < 0:
+        raise ValueError
+    return _encode_varints(deltas)[0].tobytes()
+
+
+def decode_deltas(data) -> array:
+    """
+    Restores the positions compressed by encode_deltas, all the varints are decoded at once
+    :param data: bytes or any buffer
+    :return: an array of positions
+    """
+    encoded = np.frombuffer(data, dtype=np.uint8)
+    positions = array('I')
+    if not encoded.size:
+        return positions
+    if encoded[-1] & 0x80:
+        raise ValueError
+    ends = np.flatnonzero(encoded < 0x80)
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    shifts = (np.arange(encoded.size) - np.repeat(starts, ends - starts + 1)) * 7
+    chunks = (encoded & 0x7f).astype(np.uint64) << shifts.astype(np.uint64)
+    positions.frombytes(np.cumsum(np.add.reduceat(chunks, starts)).astype(np.uint32).tobytes())
+    return positions
+
+
+class CompressedPostings(Mapping):
+    """
+    Posting lists of all the words stored as one buffer of delta + varint encoded positions,
+    a list is decoded on every lookup
+    e.g. postings = CompressedPostings({'happy': array('I', [3, 10, 300])})
+    postings['happy']
+    --> array('I', [3, 10, 300])
+    """
+
+    def __init__(self, postings: Mapping):
+        if not isinstance(postings, Mapping):
+            raise ValueError
+        self._word_indexes = {word: word_index for word_index, word in enumerate(postings)}
+        posting_lists = [np.asarray(postings[word], dtype=np.int64) for word in self._word_indexes]
+        lengths = np.array([len(positions) for positions in posting_lists], dtype=np.int64)
+        values = np.concatenate(posting_lists) if posting_lists else np.zeros(0, dtype=np.int64)
+        # the lists are encoded together, the first delta of a list is its first position
+        deltas = np.diff(values, prepend=0)
+        list_starts = (np.cumsum(lengths) - lengths)[lengths > 0]
+        deltas[list_starts] = values[list_starts]
+        if deltas.size and deltas.min() < 0:
+            raise ValueError
+        encoded, sizes = _encode_varints(deltas)
+        self._data = encoded.tobytes()
+        self._offsets = array('I')
+        self._offsets.frombytes(np.concatenate(([0], np.cumsum(sizes)))[np.concatenate(([0], np.cumsum(lengths)))]
+                                .astype(np.uint32).tobytes())
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The size of the encoded positions and of their offsets in bytes
+        """
+        return len(self._data) + self._offsets.itemsize * len(self._offsets)
+
+    def __getitem__(self, word):
+        word_index = self._word_indexes[word]
+        start, end = self._offsets[word_index], self._offsets[word_index + 1]
+        return decode_deltas(memoryview(self._data)[start:end])
+
+    def __iter__(self):
+        return iter(self._word_indexes)
+
+    def __len__(self) -> int:
+        return len(self._word_indexes)
+
+
+class CompressedConcordanceIndex(ConcordanceIndex):
+    """
+    A concordance index keeping its posting lists compressed
+    e.g. index = CompressedConcordanceIndex(['the', 'man', 'is', 'happy', 'the', 'dog', 'is', 'happy'])
+    index.get_concordance('happy', 1, 1)
+    --> [['is', 'happy', 'the'], ['is', 'happy']]
+    """
+
+    def __init__(self, tokens, positions=None):
+        super().__init__(tokens, positions)
+        self.positions = CompressedPostings(self.positions)
@@ -0,0 +1,71 @@
+# pylint: skip-file
+"""
+Checks the first lab compressed posting lists
+"""
+
+import unittest
+from array import array
+from main import get_concordance
+from main import tokenize
+from main import read_from_file
+from concordance_index import ConcordanceIndex
+from compressed_postings import CompressedConcordanceIndex
+from compressed_postings import CompressedPostings
+from compressed_postings import decode_deltas
+from compressed_postings import encode_deltas
+
+
+class CompressedPostingsTest(unittest.TestCase):
+    """
+    Tests delta + varint coding and CompressedPostings and CompressedConcordanceIndex classes
+    """
+
+    tokens = ['the', 'weather', 'is', 'sunny', 'the', 'man', 'is', 'happy',
+              'the', 'dog', 'is', 'happy', 'but', 'the', 'cat', 'is', 'sad']
+
+    def test_delta_varint_coding(self):
+        """
+        Checks that positions survive encoding and small gaps take one byte
+        """
+        self.assertEqual(b'\x03\x07\xa2\x02', encode_deltas([3, 10, 300]))
+        for positions in [[], [0], [0, 0, 1], [127, 128, 16511, 2 ** 32 - 1], list(range(0, 10 ** 6, 997))]:
+            encoded = encode_deltas(positions)
+            self.assertEqual(positions, list(decode_deltas(encoded)))
+        self.assertEqual(1000, len(encode_deltas(range(1000))))
+        self.assertEqual([5, 6], list(decode_deltas(memoryview(b'\x00\x05\x01')[1:])))
+
+    def test_compressed_postings(self):
+        """
+        Checks lookups of compressed posting lists
+        """
+        positions = {'happy': array('I', [3, 10, 300]), 'sad': array('I', [1]), 'empty': array('I')}
+        postings = CompressedPostings(positions)
+        self.assertEqual(positions, dict(postings))
+        self.assertEqual(['happy', 'sad', 'empty'], list(postings))
+        self.assertEqual(5 + 4 * 4, postings.nbytes)
+        self.assertRaises(KeyError, postings.__getitem__, 'unknown')
+
+    def test_compressed_concordance_index(self):
+        """
+        Checks that a compressed index answers like main functions and is smaller than a plain one
+        """
+        tokens = tokenize(read_from_file('lab_1/data.txt'))
+        index = ConcordanceIndex(tokens)
+        compressed_index = CompressedConcordanceIndex(tokens)
+        self.assertEqual(dict(index.positions), dict(compressed_index.positions))
+        self.assertTrue(compressed_index.positions.nbytes < 4 * len(tokens))
+        self.assertEqual(get_concordance(tokens, 'sodium', 3, 3), compressed_index.get_concordance('sodium', 3, 3))
+        small_index = CompressedConcordanceIndex(self.tokens)
+        self.assertEqual(get_concordance(self.tokens, 'happy', 2, 3), small_index.get_concordance('happy', 2, 3))
+        self.assertEqual([], small_index.get_concordance('unknown', 2, 3))
+
+    def test_compressed_bad_inputs(self):
+        """
+        Checks that incorrect positions and data are rejected
+        """
+        self.assertRaises(ValueError, encode_deltas, [3, 2])
+        self.assertRaises(ValueError, encode_deltas, [-1])
+        self.assertRaises(ValueError, decode_deltas, b'\x80')
+        for bad_input in ['string', None, 9, [None]]:
+            self.assertRaises(ValueError, CompressedPostings, bad_input)
+        self.assertRaises(ValueError, CompressedPostings, {'happy': [3, 2]})
@@ -0,0 +1,164 @@
+"""
+Lab 1
+Positional inverted index for concordance queries
+"""
+
+from array import array
+from concordance_windows import iter_concordance_windows
+
+
+def _is_size(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+class ConcordanceIndex:
+    """
+    Maps every word of a text to a compact array of its positions,
+    so a concordance query costs O(occurrences * window) instead of a scan of the whole text
+    Context windows are clipped at the borders of the text
+    Precomputed positions (any mapping from words to position arrays) can be passed instead
+    of collecting them from the tokens
+    e.g. index = ConcordanceIndex(['the', 'man', 'is', 'happy', 'the', 'dog', 'is', 'happy'])
+    index.get_concordance('happy', 1, 1)
+    --> [['is', 'happy', 'the'], ['is', 'happy']]
+    """
+
+    def __init__(self, tokens, positions=None):
+        if isinstance(tokens, (str, bytes, dict)) or not hasattr(tokens, '__iter__'):
+            raise ValueError
+        self.tokens = tokens if hasattr(tokens, '__getitem__') else list(tokens)
+        if positions is None:
+            self.positions = {}
+            self._fill_positions()
+        else:
+            self.positions = positions
+
+    def _fill_positions(self):
+        positions = self.positions
+        for position, token in enumerate(self.tokens):
+            if not isinstance(token, str):
+                raise ValueError
+            if token in positions:
+                positions[token].append(position)
+            else:
+                positions[token] = array('I', (position,))
+
+    def __contains__(self, word) -> bool:
+        return word in self.positions
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def get_positions(self, word: str) -> array:
+        """
+        Returns the positions of a word in the text
+        :param word: a word
+        :return: an array of positions in ascending order
+        """
+        return self.positions.get(word, array('I'))
+
+    def count(self, word: str) -> int:
+        """
+        Returns the frequency of a word
+        """
+        return len(self.get_positions(word))
+
+    def _query_length(self, word: str) -> int:
+        # the number of tokens matched by a query, subclasses can match phrases
+        return 1
+
+    def _windows(self, word: str, left_context_size: int, right_context_size: int) -> list:
+        # (start, end, keyword offset) for every occurrence of the word
+        n_tokens = len(self.tokens)
+        length = self._query_length(word)
+        windows = []
+        for position in self.get_positions(word):
+            start = max(position - left_context_size, 0)
+            windows.append((start, min(position + length + right_context_size, n_tokens), position - start))
+        return windows
+
+    def _check_query(self, word, left_context_size, right_context_size) -> bool:
+        if not isinstance(word, str) or not word:
+            return False
+        if not _is_size(left_context_size) or not _is_size(right_context_size):
+            return False
+        if left_context_size < 0 or right_context_size < 0:
+            return False
+        return bool(left_context_size or right_context_size)
+
+    def get_concordance(self, word: str, left_context_size: int, right_context_size: int) -> list:
+        """
+        Gets a concordance of a word in the format of main.get_concordance
+        :param word: a word-base for a concordance
+        :param left_context_size: the number of words in the left context
+        :param right_context_size: the number of words in the right context
+        :return: a concordance
+        """
+        if not self._check_query(word, left_context_size, right_context_size):
+            return []
+        tokens = self.tokens
+        return [tokens[start:end] for start, end, _ in self._windows(word, left_context_size, right_context_size)]
+
+    def get_windows(self, word: str, left_context_size: int, right_context_size: int) -> list:
+        """
+        Gets a concordance of a word as lazy windows over the indexed tokens
+        :param word: a word-base for a concordance
+        :param left_context_size: the number of words in the left context
+        :param right_context_size: the number of words in the right context
+        :return: a list of windows
+        """
+        if not self._check_query(word, left_context_size, right_context_size):
+            return []
+        return list(iter_concordance_windows(self.tokens, self.get_positions(word), left_context_size,
+                                             right_context_size + self._query_length(word) - 1))
+
+    def get_adjacent_words(self, word: str, left_n: int, right_n: int) -> list:
+        """
+        Gets adjacent words from the left and right context in the format of main.get_adjacent_words
+        :param word: a word-base for the search
+        :param left_n: the distance between a word and an adjacent one in the left context
+        :param right_n: the distance between a word and an adjacent one in the right context
+        :return: a list of adjacent words
+        """
+        if not self._check_query(word, left_n, right_n):
+            return []
+        tokens = self.tokens
+        windows = self._windows(word, left_n, right_n)
+        if left_n == 0:
+            return [[tokens[end - 1]] for _, end, _ in windows]
+        if right_n == 0:
+            return [[tokens[start]] for start, _, _ in windows]
+        return [[tokens[start], tokens[end - 1]] for start, end, _ in windows]
+
+    def sort_concordance(self, word: str, left_context_size: int, right_context_size: int, left_sort: bool) -> list:
+        """
+        Gets a concordance of a word and sorts it by either the first left or the first right word
+        Unlike main.sort_concordance, lines sharing a sort key are all kept in the text order
+        :param word: a word-base for a concordance
+        :param left_context_size: the number of words in the left context
+        :param right_context_size: the number of words in the right context
+        :param left_sort: if True, sort by the left context, False – by the right context
+        :return: a concordance
+        """
+        if not isinstance(left_sort, bool):
+            return []
+        if _is_size(left_context_size) and left_context_size < 0 and not left_sort:
+            left_context_size = 0
+        if _is_size(right_context_size) and right_context_size < 0 and left_sort:
+            right_context_size = 0
+        if not self._check_query(word, left_context_size, right_context_size):
+            return []
+
+        tokens = self.tokens
+        length = self._query_length(word)
+
+        def first_right_word(window):
+            start, end, offset = window
+            return tokens[start + offset + length] if start + offset + length < end else ''
+
+        windows = self._windows(word, left_context_size, right_context_size)
+        if left_sort:
+            windows.sort(key=lambda window: tokens[window[0]])
+        else:
+            windows.sort(key=first_right_word)
+        return [tokens[start:end] for start, end, _ in windows]
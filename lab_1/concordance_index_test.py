@@ -0,0 +1,81 @@
+# pylint: skip-file
+"""
+Checks the first lab positional concordance index
+"""
+
+import unittest
+from main import get_concordance
+from main import get_adjacent_words
+from main import sort_concordance
+from main import tokenize
+from main import read_from_file
+from concordance_index import ConcordanceIndex
+
+
+class ConcordanceIndexTest(unittest.TestCase):
+    """
+    Tests ConcordanceIndex class
+    """
+
+    tokens = ['the', 'weather', 'is', 'sunny', 'the', 'man', 'is', 'happy',
+              'the', 'dog', 'is', 'happy', 'but', 'the', 'cat', 'is', 'sad']
+
+    def test_concordance_index_ideal(self):
+        """
+        Ideal concordance index scenario
+        """
+        index = ConcordanceIndex(self.tokens)
+        self.assertEqual([7, 11], list(index.get_positions('happy')))
+        self.assertEqual(4, index.count('the'))
+        self.assertEqual(0, index.count('unknown'))
+        self.assertEqual(get_concordance(self.tokens, 'happy', 2, 3), index.get_concordance('happy', 2, 3))
+        self.assertEqual(get_adjacent_words(self.tokens, 'happy', 2, 3), index.get_adjacent_words('happy', 2, 3))
+        self.assertEqual(sort_concordance(self.tokens, 'happy', 2, 3, True),
+                         index.sort_concordance('happy', 2, 3, True))
+
+    def test_concordance_index_borders(self):
+        """
+        Checks that context windows are clipped at the borders of the text
+        """
+        index = ConcordanceIndex(['one', 'happy', 'man'])
+        self.assertEqual([['happy', 'man']], index.get_concordance('happy', 0, 1000))
+        self.assertEqual([['one', 'happy']], index.get_concordance('happy', 1000, 0))
+        self.assertEqual([['one']], index.get_adjacent_words('happy', 1000, 0))
+        self.assertEqual([['happy', 'man']], index.sort_concordance('happy', -1, 1000, False))
+        self.assertEqual([], index.sort_concordance('happy', -1, 1000, True))
+
+    def test_concordance_index_keeps_same_keys(self):
+        """
+        Checks that sorted concordance lines sharing a sort key are not dropped
+        """
+        index = ConcordanceIndex(['a', 'is', 'happy', 'b', 'is', 'happy', 'c'])
+        expected = [['is', 'happy', 'b'], ['is', 'happy', 'c']]
+        self.assertEqual(expected, index.sort_concordance('happy', 1, 1, True))
+
+    def test_concordance_index_bad_inputs(self):
+        """
+        Checks that the index handles incorrect inputs
+        """
+        for bad_input in ['string', {}, None, 9, [None]]:
+            self.assertRaises(ValueError, ConcordanceIndex, bad_input)
+        index = ConcordanceIndex(self.tokens)
+        for bad_input in [(), {}, '', None, True, 8.94, [None]]:
+            self.assertEqual([], index.get_concordance(bad_input, 2, 3))
+            self.assertEqual([], index.get_concordance('happy', bad_input, bad_input))
+        for bad_input in [(), {}, '', None, 8, 8.94, [None]]:
+            self.assertEqual([], index.sort_concordance('happy', 2, 3, bad_input))
+        self.assertEqual([], index.get_concordance('happy', 0, 0))
+        self.assertEqual([], index.get_adjacent_words('happy', -1, 0))
+
+    def test_big_text_concordance_index(self):
+        """
+        Checks that the index answers like the main functions on a big text
+        """
+        tokens = tokenize(read_from_file('lab_1/data.txt'))
+        index = ConcordanceIndex(tokens)
+        for word in ['tex', 'sodium', 'world', 'happy']:
+            self.assertEqual(get_concordance(tokens, word, 3, 4), index.get_concordance(word, 3, 4))
+            self.assertEqual(get_adjacent_words(tokens, word, 1, 1), index.get_adjacent_words(word, 1, 1))
+        self.assertEqual(sort_concordance(tokens, 'sodium', 1, 1, True), index.sort_concordance('sodium', 1, 1, True))
+        self.assertEqual(sort_concordance(tokens, 'sodium', 1, 1, False),
+                         index.sort_concordance('sodium', 1, 1, False))
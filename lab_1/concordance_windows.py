@@ -0,0 +1,119 @@
+"""
+Lab 1
+Lazy concordance windows over a shared token buffer
+"""
+
+from collections.abc import Sequence
+from vocabulary import EncodedTokens
+
+
+class ConcordanceWindow(Sequence):
+    """
+    A concordance line stored as borders over a shared list of tokens or encoded tokens:
+    nothing is copied until the words are read
+    e.g. window = ConcordanceWindow(['the', 'man', 'is', 'happy'], 1, 4, 3)
+    list(window)
+    --> ['man', 'is', 'happy']
+    """
+
+    __slots__ = ('tokens', 'start', 'end', 'position')
+
+    def __init__(self, tokens, start: int, end: int, position: int):
+        self.tokens = tokens
+        self.start = start
+        self.end = end
+        self.position = position
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            start, end, step = item.indices(len(self))
+            if step == 1:
+                return self.tokens[self.start + start:self.start + max(end, start)]
+            return [self[index] for index in range(start, end, step)]
+        if not isinstance(item, int):
+            raise TypeError
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError
+        return self.tokens[self.start + item]
+
+    def __iter__(self):
+        return iter(self.tokens[self.start:self.end])
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (ConcordanceWindow, list, tuple)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'ConcordanceWindow({self.start}, {self.end}, {self.position})'
+
+    @property
+    def keyword_offset(self) -> int:
+        """
+        The index of the keyword inside the window
+        """
+        return self.position - self.start
+
+    @property
+    def ids(self) -> memoryview:
+        """
+        A zero-copy view of the word ids of the window for encoded tokens
+        """
+        if not isinstance(self.tokens, EncodedTokens):
+            raise ValueError
+        return memoryview(self.tokens.ids)[self.start:self.end]
+
+    def to_list(self) -> list:
+        """
+        Materializes the words of the window
+        """
+        return list(self)
+
+
+def iter_concordance_windows(tokens, positions, left_context_size: int, right_context_size: int):
+    """
+    Creates lazy windows around given positions, clipped at the borders of the text
+    :param tokens: a list of tokens or encoded tokens
+    :param positions: an iterable of keyword positions
+    :param left_context_size: the number of words in the left context
+    :param right_context_size: the number of words in the right context
+    :return: a generator of windows
+    """
+    n_tokens = len(tokens)
+    for position in positions:
+        yield ConcordanceWindow(tokens, max(position - left_context_size, 0),
+                                min(position + right_context_size + 1, n_tokens), position)
+
+
+def get_concordance_windows(tokens, word: str, left_context_size: int, right_context_size: int) -> list:
+    """
+    Gets a concordance of a word as lazy windows instead of copied token lists
+    The arguments are checked like in main.get_concordance
+    :param tokens: a list of tokens or encoded tokens
+    :param word: a word-base for a concordance
+    :param left_context_size: the number of words in the left context
+    :param right_context_size: the number of words in the right context
+    :return: a list of windows
+    e.g. tokens = ['the', 'man', 'is', 'happy', 'the', 'dog', 'is', 'happy']
+    word = 'happy'
+    left_context_size = 1
+    right_context_size = 1
+    --> [ConcordanceWindow(2, 5, 3), ConcordanceWindow(6, 8, 7)]
+    """
+    if not isinstance(tokens, (list, EncodedTokens)) or not isinstance(word, str) or not word:
+        return []
+    for size in (left_context_size, right_context_size):
+        if not isinstance(size, int) or isinstance(size, bool) or size < 0:
+            return []
+    if not left_context_size and not right_context_size:
+        return []
+    if isinstance(tokens, EncodedTokens):
+        positions = tokens.positions(word)
+    else:
+        positions = [position for position, token in enumerate(tokens) if token == word]
+    return list(iter_concordance_windows(tokens, positions, left_context_size, right_context_size))
@@ -0,0 +1,79 @@
+# pylint: skip-file
+"""
+Checks the first lab lazy concordance windows
+"""
+
+import unittest
+from main import get_concordance
+from main import tokenize
+from main import read_from_file
+from concordance_index import ConcordanceIndex
+from concordance_windows import ConcordanceWindow
+from concordance_windows import get_concordance_windows
+from vocabulary import Vocabulary
+
+
+class ConcordanceWindowsTest(unittest.TestCase):
+    """
+    Tests ConcordanceWindow class and get_concordance_windows function
+    """
+
+    tokens = ['the', 'weather', 'is', 'sunny', 'the', 'man', 'is', 'happy',
+              'the', 'dog', 'is', 'happy', 'but', 'the', 'cat', 'is', 'sad']
+
+    def test_concordance_windows_ideal(self):
+        """
+        Ideal lazy concordance scenario
+        """
+        expected = get_concordance(self.tokens, 'happy', 2, 3)
+        windows = get_concordance_windows(self.tokens, 'happy', 2, 3)
+        self.assertEqual(expected, windows)
+        self.assertEqual(expected, [window.to_list() for window in windows])
+        self.assertTrue(all(window.tokens is self.tokens for window in windows))
+        self.assertEqual([2, 2], [window.keyword_offset for window in windows])
+
+    def test_concordance_window_sequence(self):
+        """
+        Checks that a window behaves like a sequence of words
+        """
+        window = ConcordanceWindow(self.tokens, 5, 11, 7)
+        words = self.tokens[5:11]
+        self.assertEqual(len(words), len(window))
+        self.assertEqual(words[0], window[0])
+        self.assertEqual(words[-1], window[-1])
+        self.assertEqual(words[1:4], window[1:4])
+        self.assertEqual(words[::2], window[::2])
+        self.assertEqual(words[4:100], window[4:100])
+        self.assertEqual(words.index('happy'), window.index('happy'))
+        self.assertTrue('dog' in window)
+        self.assertRaises(IndexError, window.__getitem__, 6)
+        self.assertNotEqual(self.tokens[5:10], window)
+
+    def test_concordance_windows_encoded(self):
+        """
+        Checks that windows over encoded tokens give zero-copy id views
+        """
+        encoded = Vocabulary().encode(self.tokens)
+        windows = get_concordance_windows(encoded, 'happy', 2, 3)
+        self.assertEqual(get_concordance(self.tokens, 'happy', 2, 3), windows)
+        self.assertEqual(list(encoded.ids[5:11]), list(windows[0].ids))
+        self.assertRaises(ValueError, lambda: get_concordance_windows(self.tokens, 'happy', 2, 3)[0].ids)
+
+    def test_concordance_windows_bad_inputs(self):
+        """
+        Checks that windows handle incorrect inputs like get_concordance
+        """
+        for bad_input in [(), {}, '', None, True, 8.94, [None], -1]:
+            self.assertEqual([], get_concordance_windows(self.tokens, bad_input, 2, 3))
+            self.assertEqual([], get_concordance_windows(self.tokens, 'happy', bad_input, bad_input))
+            self.assertEqual([], get_concordance_windows(bad_input, 'happy', 2, 3))
+        self.assertEqual([], get_concordance_windows(self.tokens, 'happy', 0, 0))
+
+    def test_big_text_concordance_windows(self):
+        """
+        Checks that lazy windows of an index equal copied concordances on a big text
+        """
+        tokens = tokenize(read_from_file('lab_1/data.txt'))
+        index = ConcordanceIndex(tokens)
+        for word in ['tex', 'sodium', 'world', 'the']:
+            self.assertEqual(index.get_concordance(word, 3, 4), index.get_windows(word, 3, 4))
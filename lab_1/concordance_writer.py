@@ -0,0 +1,115 @@
+"""
+Lab 1
+Streaming buffered writing of concordance reports
+"""
+
+import bz2
+import gzip
+import importlib
+import lzma
+from functools import partial
+
+FLUSH_SIZE = 1 << 16
+
+
+def _open_zstd(path_to_file: str):
+    # zstandard is an optional dependency, the other formats come with python
+    try:
+        zstandard = importlib.import_module('zstandard')
+    except ImportError as error:
+        raise ValueError('zstd compression needs the zstandard package') from error
+    return zstandard.open(path_to_file, 'wt', encoding='utf-8')
+
+
+OPENERS = {
+    None: partial(open, mode='w', encoding='utf-8'),
+    'gzip': partial(gzip.open, mode='wt', encoding='utf-8'),
+    'bz2': partial(bz2.open, mode='wt', encoding='utf-8'),
+    'lzma': partial(lzma.open, mode='wt', encoding='utf-8'),
+    'zstd': _open_zstd,
+}
+
+
+class ConcordanceWriter:
+    """
+    Writes concordance lines one by one in the format of main.write_to_file:
+    words are joined by spaces and lines by newlines
+    Lines are collected in a buffer that is written when it reaches flush_size characters,
+    so the memory does not depend on the size of the report
+    e.g. with ConcordanceWriter('report.txt.gz', 'gzip') as writer:
+        writer.write_lines([['is', 'happy', 'the'], ['is', 'happy']])
+    """
+
+    def __init__(self, path_to_file: str, compression=None, flush_size=FLUSH_SIZE):
+        if not isinstance(path_to_file, str) or compression not in OPENERS:
+            raise ValueError
+        if not isinstance(flush_size, int) or isinstance(flush_size, bool) or flush_size < 1:
+            raise ValueError
+        self.flush_size = flush_size
+        self.n_lines = 0
+        self._buffer = []
+        self._buffered = 0
+        self._file = OPENERS[compression](path_to_file)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write_line(self, line):
+        """
+        Adds a concordance line to the report
+        :param line: an iterable of words, e.g. a list or a concordance window
+        """
+        text = ' '.join(line)
+        if self.n_lines:
+            text = '\n' + text
+        self._buffer.append(text)
+        self._buffered += len(text)
+        self.n_lines += 1
+        if self._buffered >= self.flush_size:
+            self.flush()
+
+    def write_lines(self, lines):
+        """
+        Adds concordance lines to the report
+        :param lines: an iterable of concordance lines, e.g. a generator
+        :return: the writer itself
+        """
+        for line in lines:
+            self.write_line(line)
+        return self
+
+    def flush(self):
+        """
+        Writes the buffered lines to the file
+        """
+        self._file.write(''.join(self._buffer))
+        self._buffer = []
+        self._buffered = 0
+
+    def close(self):
+        """
+        Writes the buffered lines and closes the file
+        """
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+def write_concordance(lines, path_to_file='report.txt', compression=None, flush_size=FLUSH_SIZE) -> int:
+    """
+    Streams concordance lines into a file like main.write_to_file, keeping at most flush_size
+    characters in memory
+    :param lines: an iterable of concordance lines, e.g. a generator of windows
+    :param path_to_file: a path to the report
+    :param compression: None, 'gzip', 'bz2', 'lzma' or 'zstd' (with the zstandard package)
+    :param flush_size: a number of characters collected before a write
+    :return: the number of written lines
+    """
+    if isinstance(lines, (str, bytes, dict)) or not hasattr(lines, '__iter__'):
+        raise ValueError
+    with ConcordanceWriter(path_to_file, compression, flush_size) as writer:
+        writer.write_lines(lines)
+    return writer.n_lines
@@ -0,0 +1,99 @@
+# pylint: skip-file
+"""
+Checks the first lab streaming concordance writer
+"""
+
+import bz2
+import gzip
+import importlib.util
+import lzma
+import os
+import tempfile
+import unittest
+from main import tokenize
+from main import read_from_file
+from main import write_to_file
+from concordance_index import ConcordanceIndex
+from concordance_windows import iter_concordance_windows
+from concordance_writer import ConcordanceWriter
+from concordance_writer import write_concordance
+
+
+class ConcordanceWriterTest(unittest.TestCase):
+    """
+    Tests ConcordanceWriter class and write_concordance function
+    """
+
+    lines = [['the', 'man', 'is', 'happy'], ['is', 'happy'], [], ['happy', 'the', 'dog']]
+
+    def _read(self, path_to_file, opener=open):
+        with opener(path_to_file, 'rt', encoding='utf-8') as file:
+            return file.read()
+
+    def test_write_concordance_ideal(self):
+        """
+        Ideal streaming report scenario: the same file as main.write_to_file
+        """
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            expected_path = os.path.join(path_to_dir, 'expected.txt')
+            write_to_file(self.lines, expected_path)
+            for flush_size in [1, 3, 10, 1000]:
+                path_to_file = os.path.join(path_to_dir, f'report_{flush_size}.txt')
+                self.assertEqual(4, write_concordance(iter(self.lines), path_to_file, flush_size=flush_size))
+                self.assertEqual(self._read(expected_path), self._read(path_to_file))
+
+    def test_write_concordance_compressed(self):
+        """
+        Checks that compressed reports decompress into the plain report
+        """
+        expected = '\n'.join(' '.join(line) for line in self.lines)
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            for compression, opener in [('gzip', gzip.open), ('bz2', bz2.open), ('lzma', lzma.open)]:
+                path_to_file = os.path.join(path_to_dir, f'report.{compression}')
+                write_concordance(self.lines, path_to_file, compression, 5)
+                self.assertEqual(expected, self._read(path_to_file, opener))
+
+    def test_writer_buffers_lines(self):
+        """
+        Checks that lines are written only when the buffer reaches the flush size
+        """
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            path_to_file = os.path.join(path_to_dir, 'report.txt')
+            with ConcordanceWriter(path_to_file, flush_size=20) as writer:
+                writer.write_line(self.lines[0])
+                writer._file.flush()
+                self.assertEqual('', self._read(path_to_file))
+                writer.write_line(['happy'] * 3)
+                writer._file.flush()
+                self.assertEqual('the man is happy\nhappy happy happy', self._read(path_to_file))
+            self.assertEqual(2, writer.n_lines)
+
+    def test_write_concordance_windows(self):
+        """
+        Checks writing lazy windows of a big text
+        """
+        tokens = tokenize(read_from_file('lab_1/data.txt'))
+        index = ConcordanceIndex(tokens)
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            expected_path = os.path.join(path_to_dir, 'expected.txt')
+            write_to_file(index.get_concordance('the', 3, 3), expected_path)
+            path_to_file = os.path.join(path_to_dir, 'report.txt.gz')
+            windows = iter_concordance_windows(tokens, index.get_positions('the'), 3, 3)
+            self.assertEqual(index.count('the'), write_concordance(windows, path_to_file, 'gzip'))
+            self.assertEqual(self._read(expected_path), self._read(path_to_file, gzip.open))
+
+    def test_write_concordance_bad_inputs(self):
+        """
+        Checks that the writer rejects incorrect arguments
+        """
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            path_to_file = os.path.join(path_to_dir, 'report.txt')
+            for bad_input in ['string', {}, None, 9]:
+                self.assertRaises(ValueError, write_concordance, bad_input, path_to_file)
+            for bad_input in ['zip', 9, True]:
+                self.assertRaises(ValueError, write_concordance, self.lines, path_to_file, bad_input)
+            for bad_input in [0, -1, 1.5, None, True]:
+                self.assertRaises(ValueError, write_concordance, self.lines, path_to_file, None, bad_input)
+            self.assertRaises(ValueError, ConcordanceWriter, None)
+            if importlib.util.find_spec('zstandard') is None:
+                self.assertRaises(ValueError, write_concordance, self.lines, path_to_file, 'zstd')
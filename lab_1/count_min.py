@@ -0,0 +1,181 @@
+"""
+Lab 1
+Approximate token frequencies of unbounded streams with a Count-Min sketch
+"""
+
+import math
+from collections import Counter
+from hashlib import blake2b
+from heapq import nlargest
+from itertools import islice
+import numpy as np
+from tokenizer import iter_token_chunks
+
+BATCH_SIZE = 1 << 16
+
+
+def _is_positive(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+class CountMinSketch:
+    """
+    Estimates token frequencies in a fixed depth x width table of counters:
+    every token increments one counter per row and its estimate is the minimum of them,
+    so estimates never undercount and overcount by at most e / width * total
+    with probability 1 - exp(-depth)
+    With the conservative update only the counters below the new estimate are raised,
+    which makes the overestimation smaller
+    Tokens are hashed with blake2b, so sketches built in different processes can be merged
+    The most frequent tokens are tracked among top_k candidates for top-k queries
+    e.g. sketch = CountMinSketch(1000, 4)
+    sketch.update(['happy', 'man', 'happy', 'dog'])
+    sketch['happy']
+    --> 2
+    """
+
+    def __init__(self, width: int, depth: int, conservative=False, top_k=100):
+        if not _is_positive(width) or not _is_positive(depth) or not isinstance(conservative, bool):
+            raise ValueError
+        if not isinstance(top_k, int) or isinstance(top_k, bool) or top_k < 0:
+            raise ValueError
+        self.width = width
+        self.depth = depth
+        self.conservative = conservative
+        self.top_k = top_k
+        self.total = 0
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self._candidates = {}
+
+    @classmethod
+    def from_error(cls, epsilon: float, delta: float, conservative=False, top_k=100):
+        """
+        Creates a sketch overcounting by at most epsilon * total with probability 1 - delta
+        """
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)), conservative, top_k)
+
+    def _columns(self, tokens: list) -> np.ndarray:
+        # the counter of every token in every row by double hashing one 64-bit digest
+        digests = np.array([int.from_bytes(blake2b(token.encode('utf-8', 'surrogatepass'), digest_size=8).digest(),
+                                           'little') for token in tokens], dtype=np.uint64).reshape(-1, 1)
+        first = digests & np.uint64(0xffffffff)
+        second = (digests >> np.uint64(32)) | np.uint64(1)
+        rows = np.arange(self.depth, dtype=np.uint64)
+        return ((first + rows * second) % np.uint64(self.width)).astype(np.int64)
+
+    def _estimate(self, columns: np.ndarray) -> np.ndarray:
+        return self.table[np.arange(self.depth), columns].min(axis=1)
+
+    def _add(self, counts: Counter):
+        tokens = list(counts)
+        if not tokens:
+            return
+        if not all(isinstance(token, str) for token in tokens):
+            raise ValueError
+        columns = self._columns(tokens)
+        increments = np.array([counts[token] for token in tokens], dtype=np.int64)
+        rows = np.broadcast_to(np.arange(self.depth), columns.shape)
+        if self.conservative:
+            # a batch raises every counter of a token to at least its previous estimate plus its count
+            np.maximum.at(self.table, (rows, columns),
+                          np.broadcast_to((self._estimate(columns) + increments).reshape(-1, 1), columns.shape))
+        else:
+            np.add.at(self.table, (rows, columns), np.broadcast_to(increments.reshape(-1, 1), columns.shape))
+        self.total += int(increments.sum())
+        if self.top_k:
+            self._candidates.update(zip(tokens, self._estimate(columns).tolist()))
+            self._trim_candidates()
+
+    def _trim_candidates(self):
+        if len(self._candidates) > 2 * self.top_k:
+            best = nlargest(self.top_k, self._candidates.items(), key=lambda item: item[1])
+            self._candidates = dict(best)
+
+    def update(self, tokens):
+        """
+        Feeds the tokens of a stream to the sketch by batches
+        :param tokens: an iterable of tokens
+        :return: the sketch itself
+        """
+        if isinstance(tokens, (str, bytes, dict)) or not hasattr(tokens, '__iter__'):
+            raise ValueError
+        tokens = iter(tokens)
+        while True:
+            batch = Counter(islice(tokens, BATCH_SIZE))
+            if not batch:
+                return self
+            self._add(batch)
+
+    def update_from_file(self, path_to_file: str):
+        """
+        Streams the tokens of a file into the sketch
+        :param path_to_file: a path to a text file
+        :return: the sketch itself
+        """
+        for chunk in iter_token_chunks(path_to_file):
+            self._add(Counter(chunk))
+        return self
+
+    def merge(self, other):
+        """
+        Adds the counters of a sketch with the same width and depth, e.g. built by another worker
+        :param other: a sketch
+        :return: the sketch itself
+        """
+        if not isinstance(other, CountMinSketch) or other.table.shape != self.table.shape:
+            raise ValueError
+        self.table += other.table
+        self.total += other.total
+        if self.top_k:
+            self._candidates.update(dict.fromkeys(other.get_top_n_words(other.top_k), 0))
+            self._refresh_candidates()
+            self._trim_candidates()
+        return self
+
+    def _refresh_candidates(self):
+        tokens = list(self._candidates)
+        if tokens:
+            self._candidates = dict(zip(tokens, self._estimate(self._columns(tokens)).tolist()))
+
+    def __getitem__(self, token) -> int:
+        if not isinstance(token, str):
+            raise ValueError
+        return int(self._estimate(self._columns([token]))[0])
+
+    def get(self, token, default=0) -> int:
+        """
+        Returns the estimated frequency of a token or the default for tokens never seen
+        """
+        count = self[token] if isinstance(token, str) else 0
+        return count if count else default
+
+    def __contains__(self, token) -> bool:
+        return isinstance(token, str) and self[token] > 0
+
+    @property
+    def error_bound(self) -> float:
+        """
+        The overestimation that is not exceeded with probability 1 - exp(-depth)
+        """
+        return math.e / self.width * self.total
+
+    def top(self, top_n: int) -> list:
+        """
+        Returns the most frequent candidate tokens with their estimated counts
+        :param top_n: a number of tokens to return, at most top_k
+        :return: a list of (token, count) pairs sorted by count
+        """
+        if not isinstance(top_n, int) or isinstance(top_n, bool):
+            return []
+        self._refresh_candidates()
+        return nlargest(min(top_n, self.top_k), self._candidates.items(), key=lambda item: item[1])
+
+    def get_top_n_words(self, top_n: int) -> list:
+        """
+        Returns the most frequent tokens in the format of main.get_top_n_words
+        :param top_n: a number of tokens to return, at most top_k
+        :return: a list of tokens
+        """
+        return [token for token, _ in self.top(top_n)]
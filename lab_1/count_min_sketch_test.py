@@ -0,0 +1,99 @@
+# pylint: skip-file
+"""
+Checks the first lab approximate frequencies of unbounded vocabularies
+"""
+
+import pickle
+import unittest
+from main import calculate_frequencies
+from main import get_top_n_words
+from main import tokenize
+from main import read_from_file
+from count_min import CountMinSketch
+
+
+class CountMinSketchTest(unittest.TestCase):
+    """
+    Tests CountMinSketch class
+    """
+
+    def test_count_min_sketch_ideal(self):
+        """
+        Ideal count-min scenario: a wide table without collisions gives exact counts
+        """
+        tokens = ['weather', 'sunny', 'man', 'happy', 'weather', 'man', 'man']
+        for conservative in (False, True):
+            sketch = CountMinSketch(1 << 12, 4, conservative).update(tokens)
+            self.assertEqual(3, sketch['man'])
+            self.assertEqual(2, sketch.get('weather'))
+            self.assertEqual(0, sketch['dog'])
+            self.assertEqual(-1, sketch.get('dog', -1))
+            self.assertIn('sunny', sketch)
+            self.assertNotIn('dog', sketch)
+            self.assertEqual(len(tokens), sketch.total)
+            self.assertEqual([('man', 3), ('weather', 2)], sketch.top(2))
+            self.assertEqual(get_top_n_words(calculate_frequencies(tokens), 2), sketch.get_top_n_words(2))
+
+    def test_count_min_sketch_never_undercounts(self):
+        """
+        Checks that estimates of a narrow table overcount within the error bound on a big text
+        and that the conservative update overcounts less
+        """
+        tokens = tokenize(read_from_file('lab_1/data.txt'))
+        frequencies = calculate_frequencies(tokens)
+        errors = []
+        for conservative in (False, True):
+            sketch = CountMinSketch(1 << 12, 4, conservative).update(tokens)
+            error = 0
+            for token, count in frequencies.items():
+                estimate = sketch[token]
+                self.assertTrue(count <= estimate)
+                error += estimate - count
+            self.assertTrue(error / len(frequencies) <= sketch.error_bound)
+            errors.append(error)
+        self.assertTrue(errors[1] < errors[0])
+
+    def test_count_min_sketch_top_words(self):
+        """
+        Checks that the candidates give the most frequent words of a big text
+        """
+        tokens = tokenize(read_from_file('lab_1/data.txt'))
+        expected = get_top_n_words(calculate_frequencies(tokens), 20)
+        sketch = CountMinSketch(1 << 14, 4, top_k=50)
+        sketch.update_from_file('lab_1/data.txt')
+        self.assertEqual(len(tokens), sketch.total)
+        self.assertEqual(expected, sketch.get_top_n_words(20))
+
+    def test_count_min_sketch_merge(self):
+        """
+        Checks that sketches of parts of a stream merge into the sketch of the whole stream
+        """
+        tokens = tokenize(read_from_file('lab_1/data.txt'))
+        whole = CountMinSketch(1 << 12, 3).update(tokens)
+        first = CountMinSketch(1 << 12, 3).update(tokens[:50000])
+        second = pickle.loads(pickle.dumps(CountMinSketch(1 << 12, 3).update(tokens[50000:])))
+        first.merge(second)
+        self.assertTrue((whole.table == first.table).all())
+        self.assertEqual(whole.total, first.total)
+        self.assertEqual(whole.top(10), first.top(10))
+        self.assertRaises(ValueError, first.merge, CountMinSketch(1 << 10, 3))
+
+    def test_count_min_sketch_from_error(self):
+        """
+        Checks the table size derived from the error and the failure probability
+        """
+        sketch = CountMinSketch.from_error(0.001, 0.01)
+        self.assertEqual((5, 2719), sketch.table.shape)
+        self.assertRaises(ValueError, CountMinSketch.from_error, 0, 0.01)
+
+    def test_count_min_sketch_bad_input(self):
+        """
+        Checks that bad parameters and streams are rejected
+        """
+        for width, depth in ((0, 4), (100, -1), ('100', 4), (100, True)):
+            self.assertRaises(ValueError, CountMinSketch, width, depth)
+        sketch = CountMinSketch(100, 4)
+        for bad_input in ('the man', {'man': 1}, 123, None, [1, 2]):
+            self.assertRaises(ValueError, sketch.update, bad_input)
+        self.assertEqual([], sketch.top(None))
+        self.assertEqual(0, sketch.get(None))
@@ -0,0 +1,249 @@
+"""
+Lab 1
+Memory-mapped on-disk concordance index
+
+An index directory holds five binary files of unsigned 32-bit integers
+in the native byte order of array('I'), except for the vocabulary bytes:
+    tokens.bin – the token id stream of the text
+    vocabulary.bin – utf-8 encoded words in byte order, so a word id is its rank
+    vocabulary_offsets.bin – byte offsets of every word in vocabulary.bin (plus the end)
+    postings.bin – positions of every word grouped by word id
+    posting_offsets.bin – offsets of every posting list in postings.bin (plus the end)
+"""
+
+import mmap
+import os
+from array import array
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from concordance_index import ConcordanceIndex
+from tokenizer import iter_token_chunks
+
+TOKENS_FILE = 'tokens.bin'
+VOCABULARY_FILE = 'vocabulary.bin'
+VOCABULARY_OFFSETS_FILE = 'vocabulary_offsets.bin'
+POSTINGS_FILE = 'postings.bin'
+POSTING_OFFSETS_FILE = 'posting_offsets.bin'
+
+
+def _write_array(path_to_file: str, values):
+    with open(path_to_file, 'wb') as file:
+        array('I', values).tofile(file)
+
+
+def _prefix_sums(values) -> array:
+    sums = array('I', [0])
+    for value in values:
+        sums.append(sums[-1] + value)
+    return sums
+
+
+def _build(token_chunks, path_to_dir: str):
+    # token_chunks is a callable returning a fresh iterator over lists of tokens:
+    # the first pass collects the vocabulary, the second one writes ids and positions
+    frequencies = Counter()
+    for chunk in token_chunks():
+        frequencies.update(chunk)
+    words = sorted(frequencies, key=str.encode)
+    word_ids = {word: word_id for word_id, word in enumerate(words)}
+    posting_offsets = _prefix_sums(frequencies[word] for word in words)
+
+    os.makedirs(path_to_dir, exist_ok=True)
+    postings = array('I', [0]) * posting_offsets[-1]
+    cursors = posting_offsets[:-1]
+    position = 0
+    with open(os.path.join(path_to_dir, TOKENS_FILE), 'wb') as tokens_file:
+        for chunk in token_chunks():
+            ids = array('I', [word_ids[token] for token in chunk])
+            for word_id in ids:
+                postings[cursors[word_id]] = position
+                cursors[word_id] += 1
+                position += 1
+            ids.tofile(tokens_file)
+
+    encoded_words = [word.encode('utf-8') for word in words]
+    with open(os.path.join(path_to_dir, VOCABULARY_FILE), 'wb') as vocabulary_file:
+        vocabulary_file.write(b''.join(encoded_words))
+    _write_array(os.path.join(path_to_dir, VOCABULARY_OFFSETS_FILE), _prefix_sums(map(len, encoded_words)))
+    _write_array(os.path.join(path_to_dir, POSTINGS_FILE), postings)
+    _write_array(os.path.join(path_to_dir, POSTING_OFFSETS_FILE), posting_offsets)
+
+
+def build_disk_index(tokens: list, path_to_dir: str):
+    """
+    Writes the index of a list of tokens into a directory
+    :param tokens: a list of tokens
+    :param path_to_dir: a path to the index directory
+    """
+    if not isinstance(tokens, (list, tuple)) or not isinstance(path_to_dir, str):
+        raise ValueError
+    if any(not isinstance(token, str) for token in tokens):
+        raise ValueError
+    _build(lambda: iter((tokens,)), path_to_dir)
+
+
+def build_disk_index_from_file(path_to_file: str, path_to_dir: str):
+    """
+    Tokenizes a text file by chunks and writes its index into a directory,
+    the text itself is never loaded into memory
+    :param path_to_file: a path to a text file
+    :param path_to_dir: a path to the index directory
+    """
+    if not isinstance(path_to_file, str) or not isinstance(path_to_dir, str):
+        raise ValueError
+    _build(lambda: iter_token_chunks(path_to_file), path_to_dir)
+
+
+def _map_file(path_to_file: str) -> tuple:
+    # a read-only memory map of a file and an unsigned int view over it
+    with open(path_to_file, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+    view = memoryview(mapped).cast('I') if size % array('I').itemsize == 0 else None
+    return mapped, view
+
+
+class DiskVocabulary:
+    """
+    Word <-> id lookups over the mapped vocabulary table by binary search
+    """
+
+    def __init__(self, words: bytes, offsets: memoryview):
+        self._words = words
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def _encoded_word(self, word_id: int) -> bytes:
+        return self._words[self._offsets[word_id]:self._offsets[word_id + 1]]
+
+    def get_word(self, word_id: int) -> str:
+        """
+        Returns the word of an id
+        """
+        if not isinstance(word_id, int) or isinstance(word_id, bool):
+            raise ValueError
+        if not 0 <= word_id < len(self):
+            raise KeyError
+        return self._encoded_word(word_id).decode('utf-8')
+
+    def lower_bound(self, word: str) -> int:
+        """
+        Returns the id of the first word that is not less than the given one,
+        words are sorted by their utf-8 bytes, i.e. in the order of python strings
+        """
+        encoded = word.encode('utf-8')
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self._encoded_word(middle) < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def find(self, word: str) -> int:
+        """
+        Returns the id of a word or -1 if there is no such word
+        """
+        if not isinstance(word, str):
+            return -1
+        word_id = self.lower_bound(word)
+        if word_id < len(self) and self._encoded_word(word_id) == word.encode('utf-8'):
+            return word_id
+        return -1
+
+    def get_id(self, word: str) -> int:
+        """
+        Returns the id of a word
+        """
+        if not isinstance(word, str):
+            raise ValueError
+        word_id = self.find(word)
+        if word_id == -1:
+            raise KeyError
+        return word_id
+
+
+class DiskTokens(Sequence):
+    """
+    The text as a sequence of words decoded lazily from the mapped token id stream
+    """
+
+    def __init__(self, ids: memoryview, vocabulary: DiskVocabulary):
+        self.ids = ids
+        self._vocabulary = vocabulary
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._vocabulary.get_word(word_id) for word_id in self.ids[item]]
+        return self._vocabulary.get_word(self.ids[item])
+
+
+class DiskPostings(Mapping):
+    """
+    Maps words to their posting lists, copied out of the mapped file,
+    so the lists stay valid after the index is closed
+    """
+
+    def __init__(self, vocabulary: DiskVocabulary, postings: memoryview, offsets: memoryview):
+        self._vocabulary = vocabulary
+        self._postings = postings
+        self._offsets = offsets
+
+    def __getitem__(self, word):
+        word_id = self._vocabulary.find(word)
+        if word_id == -1:
+            raise KeyError(word)
+        positions = array('I')
+        with self._postings[self._offsets[word_id]:self._offsets[word_id + 1]] as view, view.cast('B') as data:
+            positions.frombytes(data)
+        return positions
+
+    def __iter__(self):
+        return (self._vocabulary.get_word(word_id) for word_id in range(len(self._vocabulary)))
+
+    def __len__(self) -> int:
+        return len(self._vocabulary)
+
+
+class DiskConcordanceIndex(ConcordanceIndex):
+    """
+    A concordance index opened from an index directory:
+    the files are memory-mapped, so opening takes no time and no corpus data
+    is loaded into memory except the words of the requested windows
+    e.g. build_disk_index_from_file('data.txt', 'data_index')
+    with DiskConcordanceIndex('data_index') as index:
+        index.get_concordance('happy', 2, 3)
+    """
+
+    def __init__(self, path_to_dir: str):
+        if not isinstance(path_to_dir, str) or not os.path.isdir(path_to_dir):
+            raise ValueError
+        self._files = [_map_file(os.path.join(path_to_dir, name))
+                       for name in (TOKENS_FILE, VOCABULARY_FILE, VOCABULARY_OFFSETS_FILE,
+                                    POSTINGS_FILE, POSTING_OFFSETS_FILE)]
+        (_, ids), (words, _), (_, word_offsets), (_, postings), (_, posting_offsets) = self._files
+        self.vocabulary = DiskVocabulary(words, word_offsets)
+        super().__init__(DiskTokens(ids, self.vocabulary),
+                         DiskPostings(self.vocabulary, postings, posting_offsets))
+
+    def close(self):
+        """
+        Releases the views and unmaps the index files
+        """
+        for mapped, view in self._files:
+            if view is not None:
+                view.release()
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,105 @@
+# pylint: skip-file
+"""
+Checks the first lab memory-mapped concordance index
+"""
+
+import os
+import tempfile
+import unittest
+from main import tokenize
+from main import read_from_file
+from concordance_index import ConcordanceIndex
+from disk_index import build_disk_index
+from disk_index import build_disk_index_from_file
+from disk_index import DiskConcordanceIndex
+
+
+class DiskConcordanceIndexTest(unittest.TestCase):
+    """
+    Tests DiskConcordanceIndex class
+    """
+
+    tokens = ['the', 'weather', 'is', 'sunny', 'the', 'man', 'is', 'happy',
+              'the', 'dog', 'is', 'happy', 'but', 'the', 'cat', 'is', 'sad']
+
+    def test_disk_index_ideal(self):
+        """
+        Ideal disk index scenario
+        """
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            build_disk_index(self.tokens, path_to_dir)
+            memory_index = ConcordanceIndex(self.tokens)
+            with DiskConcordanceIndex(path_to_dir) as index:
+                self.assertEqual(len(self.tokens), len(index))
+                self.assertEqual(self.tokens, index.tokens[:])
+                self.assertEqual([7, 11], list(index.get_positions('happy')))
+                self.assertEqual(4, index.count('the'))
+                self.assertFalse('unknown' in index)
+                self.assertEqual(memory_index.get_concordance('happy', 2, 3), index.get_concordance('happy', 2, 3))
+                self.assertEqual(memory_index.get_adjacent_words('is', 1, 1), index.get_adjacent_words('is', 1, 1))
+                self.assertEqual(memory_index.sort_concordance('is', 1, 1, False),
+                                 index.sort_concordance('is', 1, 1, False))
+
+    def test_disk_index_close_with_posting_lists(self):
+        """
+        Checks that the index closes while posting lists are still referenced and the lists stay valid
+        """
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            build_disk_index(self.tokens, path_to_dir)
+            index = DiskConcordanceIndex(path_to_dir)
+            positions = index.get_positions('happy')
+            with DiskConcordanceIndex(path_to_dir) as other_index:
+                other_positions = other_index.positions['the']
+            index.close()
+            self.assertEqual([7, 11], list(positions))
+            self.assertEqual([0, 4, 8, 13], list(other_positions))
+
+    def test_disk_index_vocabulary(self):
+        """
+        Checks word and id lookups in the mapped vocabulary
+        """
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            build_disk_index(self.tokens, path_to_dir)
+            with DiskConcordanceIndex(path_to_dir) as index:
+                words = sorted(set(self.tokens))
+                self.assertEqual(len(words), len(index.vocabulary))
+                for word_id, word in enumerate(words):
+                    self.assertEqual(word_id, index.vocabulary.get_id(word))
+                    self.assertEqual(word, index.vocabulary.get_word(word_id))
+                self.assertRaises(KeyError, index.vocabulary.get_id, 'unknown')
+                self.assertRaises(KeyError, index.vocabulary.get_word, len(words))
+                self.assertRaises(ValueError, index.vocabulary.get_id, None)
+
+    def test_disk_index_empty_text(self):
+        """
+        Checks that an empty text gives an empty index
+        """
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            build_disk_index([], path_to_dir)
+            with DiskConcordanceIndex(path_to_dir) as index:
+                self.assertEqual(0, len(index))
+                self.assertEqual([], index.get_concordance('happy', 2, 3))
+
+    def test_disk_index_bad_inputs(self):
+        """
+        Checks that the disk index handles incorrect inputs
+        """
+        for bad_input in ['string', {}, None, 9, [None]]:
+            self.assertRaises(ValueError, build_disk_index, bad_input, 'index')
+        self.assertRaises(ValueError, DiskConcordanceIndex, None)
+        self.assertRaises(ValueError, DiskConcordanceIndex, 'lab_1/no_such_index')
+
+    def test_big_text_disk_index(self):
+        """
+        Checks that an index built from a file answers like an in-memory index
+        """
+        tokens = tokenize(read_from_file('lab_1/data.txt'))
+        memory_index = ConcordanceIndex(tokens)
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            build_disk_index_from_file('lab_1/data.txt', path_to_dir)
+            self.assertEqual(len(tokens) * 4, os.path.getsize(os.path.join(path_to_dir, 'tokens.bin')))
+            with DiskConcordanceIndex(path_to_dir) as index:
+                for word in ['tex', 'sodium', 'world', 'happy', 'the']:
+                    self.assertEqual(memory_index.get_concordance(word, 3, 4), index.get_concordance(word, 3, 4))
+                self.assertEqual(memory_index.sort_concordance('sodium', 1, 1, True),
+                                 index.sort_concordance('sodium', 1, 1, True))
@@ -0,0 +1,180 @@
+"""
+Lab 1
+Frequency counting engine
+"""
+
+from collections import Counter
+from heapq import heappop, heappush, nlargest
+from tokenizer import tokenize_file
+
+
+class FrequencyCounter:
+    """
+    Counts token frequencies in a single linear pass
+    Partial counts from several chunks or files can be merged together
+    e.g. counter = FrequencyCounter(['the', 'man', 'is', 'happy'])
+    counter.update(['the', 'dog'])
+    counter.to_dict()
+    --> {'the': 2, 'man': 1, 'is': 1, 'happy': 1, 'dog': 1}
+    """
+
+    def __init__(self, tokens=()):
+        self._counts = Counter()
+        self.update(tokens)
+
+    def update(self, tokens):
+        """
+        Adds the tokens to the counts
+        :param tokens: an iterable of tokens
+        :return: the counter itself
+        """
+        if isinstance(tokens, (str, bytes, dict)) or not hasattr(tokens, '__iter__'):
+            raise ValueError
+        self._counts.update(tokens)
+        return self
+
+    def update_from_file(self, path_to_file: str):
+        """
+        Reads the file by chunks, tokenizes and counts every chunk,
+        so the whole file never sits in memory
+        :param path_to_file: a path to a text file
+        :return: the counter itself
+        """
+        self._counts.update(tokenize_file(path_to_file))
+        return self
+
+    def merge(self, other):
+        """
+        Adds partial counts to the counter
+        :param other: another FrequencyCounter or a frequency dictionary
+        :return: the counter itself
+        """
+        if isinstance(other, FrequencyCounter):
+            other = other.to_dict()
+        if not isinstance(other, dict):
+            raise ValueError
+        self._counts.update(other)
+        return self
+
+    def to_dict(self) -> dict:
+        """
+        Returns the frequencies in the format of calculate_frequencies
+        :return: a dictionary with frequencies
+        """
+        return dict(self._counts)
+
+    def __getitem__(self, token):
+        return self._counts[token]
+
+    def __len__(self):
+        return len(self._counts)
+
+
+def count_files(paths: list) -> dict:
+    """
+    Calculates frequencies over several files
+    :param paths: a list of paths to text files
+    :return: a dictionary with frequencies
+    """
+    counter = FrequencyCounter()
+    for path_to_file in paths:
+        counter.update_from_file(path_to_file)
+    return counter.to_dict()
+
+
+class SpaceSaving:
+    """
+    Finds the most frequent tokens of a stream in fixed memory (the Space-Saving algorithm)
+    At most capacity tokens are monitored; a new token replaces the least frequent one
+    and inherits its count as an error, so the true frequency of a reported token
+    lies between count - error and count, and no error exceeds stream_length / capacity
+    e.g. sketch = SpaceSaving(2)
+    sketch.update(['happy', 'man', 'happy', 'dog'])
+    sketch.top(1)
+    --> [('happy', 2, 0)]
+    """
+
+    def __init__(self, capacity: int):
+        if not isinstance(capacity, int) or isinstance(capacity, bool) or capacity < 1:
+            raise ValueError
+        self.capacity = capacity
+        self.stream_length = 0
+        self._counts = {}
+        self._errors = {}
+        self._heap = []
+
+    def _evict(self) -> int:
+        # heap entries are refreshed lazily: a popped entry with a stale count is pushed back
+        while True:
+            count, token = heappop(self._heap)
+            if self._counts[token] == count:
+                del self._counts[token]
+                del self._errors[token]
+                return count
+            heappush(self._heap, (self._counts[token], token))
+
+    def update(self, tokens):
+        """
+        Feeds the tokens of a stream to the sketch
+        :param tokens: an iterable of tokens
+        :return: the sketch itself
+        """
+        if isinstance(tokens, (str, bytes, dict)) or not hasattr(tokens, '__iter__'):
+            raise ValueError
+        counts = self._counts
+        for token in tokens:
+            self.stream_length += 1
+            if token in counts:
+                counts[token] += 1
+                continue
+            error = self._evict() if len(counts) >= self.capacity else 0
+            counts[token] = error + 1
+            self._errors[token] = error
+            heappush(self._heap, (error + 1, token))
+        return self
+
+    def update_from_file(self, path_to_file: str):
+        """
+        Streams the tokens of a file into the sketch
+        :param path_to_file: a path to a text file
+        :return: the sketch itself
+        """
+        return self.update(tokenize_file(path_to_file))
+
+    @property
+    def error_bound(self) -> float:
+        """
+        The maximum overestimation of any reported count
+        """
+        return self.stream_length / self.capacity
+
+    def top(self, top_n: int) -> list:
+        """
+        Returns the most frequent tokens with their estimated counts and errors
+        :param top_n: a number of tokens to return
+        :return: a list of (token, count, error) tuples sorted by count
+        """
+        if not isinstance(top_n, int) or isinstance(top_n, bool):
+            return []
+        best = nlargest(top_n, self._counts, key=self._counts.get)
+        return [(token, self._counts[token], self._errors[token]) for token in best]
+
+    def get_top_n_words(self, top_n: int) -> list:
+        """
+        Returns the most frequent tokens in the format of main.get_top_n_words
+        :param top_n: a number of tokens to return
+        :return: a list of tokens
+        """
+        return [token for token, _, _ in self.top(top_n)]
+
+    def is_guaranteed(self, top_n: int) -> bool:
+        """
+        Checks whether the reported top tokens are exactly the true top tokens:
+        the lowest guaranteed count among them must reach the next estimated count
+        :param top_n: a number of tokens
+        :return: True if the top is exact
+        """
+        ranked = self.top(top_n + 1)
+        if len(ranked) <= top_n:
+            return len(self._counts) < self.capacity
+        return min(count - error for _, count, error in ranked[:top_n]) >= ranked[top_n][1]
@@ -0,0 +1,56 @@
+# pylint: skip-file
+"""
+Checks the first lab frequency counting engine
+"""
+
+import unittest
+from main import calculate_frequencies
+from main import tokenize
+from main import read_from_file
+from frequencies import FrequencyCounter
+from frequencies import count_files
+
+
+class FrequencyCounterTest(unittest.TestCase):
+    """
+    Tests FrequencyCounter class
+    """
+
+    def test_frequency_counter_ideal(self):
+        """
+        Ideal frequency counter scenario
+        """
+        expected = {'weather': 2, 'sunny': 1, 'man': 2, 'happy': 1}
+        actual = FrequencyCounter(['weather', 'sunny', 'man', 'happy', 'weather', 'man']).to_dict()
+        self.assertEqual(expected, actual)
+
+    def test_frequency_counter_merge_chunks(self):
+        """
+        Checks that partial counts of chunks sum up to the counts of the whole list
+        """
+        tokens = ['the', 'weather', 'is', 'sunny', 'the', 'man', 'is', 'happy']
+        first = FrequencyCounter(tokens[:3])
+        second = FrequencyCounter(tokens[3:])
+        expected = calculate_frequencies(tokens)
+        self.assertEqual(expected, first.merge(second).to_dict())
+        self.assertEqual(expected, FrequencyCounter(tokens[:3]).merge(calculate_frequencies(tokens[3:])).to_dict())
+
+    def test_frequency_counter_bad_input(self):
+        """
+        Frequency counter invalid input check
+        """
+        bad_inputs = ['string', {}, None, 9, True]
+        for bad_input in bad_inputs:
+            self.assertRaises(ValueError, FrequencyCounter, bad_input)
+            if not isinstance(bad_input, dict):
+                self.assertRaises(ValueError, FrequencyCounter().merge, bad_input)
+
+    def test_frequency_counter_file_equals_tokenize(self):
+        """
+        Checks that counting a file line by line gives the same result as calculate_frequencies
+        """
+        expected = calculate_frequencies(tokenize(read_from_file('lab_1/data.txt')))
+        actual = FrequencyCounter().update_from_file('lab_1/data.txt').to_dict()
+        self.assertEqual(expected, actual)
+        doubled = count_files(['lab_1/data.txt', 'lab_1/data.txt'])
+        self.assertEqual(expected['the'] * 2, doubled['the'])
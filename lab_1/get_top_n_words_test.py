@@ -66,3 +66,12 @@ class GetTopNWordsTest(unittest.TestCase):
         self.assertEqual(expected, actual)
         actual = get_top_n_words({'happy': 2}, 0)
         self.assertEqual(expected, actual)
+
+    def test_get_top_n_words_negative_number(self):
+        """
+        Get top number of words with a negative number drops the least common words like a slice
+        """
+        freq_dict = {'a': 3, 'b': 2, 'c': 1}
+        self.assertEqual(['a', 'b'], get_top_n_words(freq_dict, -1))
+        self.assertEqual(['a'], get_top_n_words(freq_dict, -2))
+        self.assertEqual([], get_top_n_words(freq_dict, -5))
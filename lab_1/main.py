@@ -4,7 +4,12 @@ A concordance extraction
 """
 
 
-import re
+from array import array
+from collections import Counter
+from heapq import nlargest
+from itertools import filterfalse
+from tokenizer import tokenize_text
+from vocabulary import EncodedTokens
 
 
 def tokenize(text: str) -> list:
@@ -17,40 +22,57 @@ def tokenize(text: str) -> list:
     """
     if not isinstance(text, str):
         return []
-    text_output = re.sub('[^a-z \n]', '', text.lower()).split()
+    text_output = tokenize_text(text)
     return text_output
 
 
 def remove_stop_words(tokens: list, stop_words: list) -> list:
     """
     Removes stop words
-    :param tokens: a list of tokens
-    :param stop_words: a list of stop words
-    :return: a list of tokens without stop words
+    :param tokens: a list of tokens or encoded tokens
+    :param stop_words: a list or another collection of stop words
+    :return: a list of tokens without stop words, encoded tokens for encoded ones
     e.g. tokens = ['the', 'weather', 'is', 'sunny', 'the', 'man', 'is', 'happy']
     stop_words = ['the', 'is']
     --> ['weather', 'sunny', 'man', 'happy']
     """
+    if isinstance(tokens, EncodedTokens):
+        word_ids = tokens.vocabulary.ids
+        try:
+            if isinstance(stop_words, str):
+                raise TypeError
+            stop_ids = frozenset(word_ids[word] for word in frozenset(stop_words) if word in word_ids)
+        except TypeError:
+            # unhashable stop words and strings are checked word by word with the membership of the collection
+            stop_ids = frozenset(word_id for word, word_id in word_ids.items() if word in stop_words)
+        return EncodedTokens(array('I', filterfalse(stop_ids.__contains__, tokens.ids)), tokens.vocabulary)
     if not isinstance(tokens, list):
         return []
-    list_words = [word for word in tokens if word not in stop_words]
+    try:
+        stop_set = frozenset(stop_words) if isinstance(stop_words, list) else stop_words
+        list_words = [word for word in tokens if word not in stop_set]
+    except TypeError:
+        # unhashable stop words or tokens are compared one by one as in a list
+        list_words = [word for word in tokens if word not in stop_words]
     return list_words
 
 
 def calculate_frequencies(tokens: list) -> dict:
     """
     Calculates frequencies of given tokens
-    :param tokens: a list of tokens without stop words
+    :param tokens: a list of tokens without stop words or encoded tokens
     :return: a dictionary with frequencies
     e.g. tokens = ['weather', 'sunny', 'man', 'happy']
     --> {'weather': 1, 'sunny': 1, 'man': 1, 'happy': 1}
     """
+    if isinstance(tokens, EncodedTokens):
+        words = tokens.vocabulary.words
+        return {words[word_id]: frequency for word_id, frequency in Counter(tokens.ids).items()}
     if not isinstance(tokens, list):
         return {}
     if len(tokens) > 0 and not isinstance(tokens[0], str):
         return {}
-    set_words = set(tokens.copy())
-    dict_freq = {word: tokens.count(word) for word in set_words}
+    dict_freq = dict(Counter(tokens))
     return dict_freq
 
 
@@ -66,8 +88,11 @@ def get_top_n_words(freq_dict: dict, top_n: int) -> list:
     """
     if not isinstance(freq_dict, dict) or not isinstance(top_n, int):
         return []
-    list_output = sorted(freq_dict, key=freq_dict.get, reverse=True)
-    return list_output[:top_n]
+    if top_n < 0:
+        # a negative number drops the least common words, as a slice of the sorted words does
+        return sorted(freq_dict, key=freq_dict.get, reverse=True)[:top_n]
+    list_output = nlargest(top_n, freq_dict, key=freq_dict.get)
+    return list_output
 
 
 def get_concordance(tokens: list, word: str, left_context_size: int, right_context_size: int) -> list:
@@ -75,7 +100,7 @@ def get_concordance(tokens: list, word: str, left_context_size: int, right_conte
     Gets a concordance of a word
     A concordance is a listing of each occurrence of a word in a text,
     presented with the words surrounding it
-    :param tokens: a list of tokens
+    :param tokens: a list of tokens or encoded tokens
     :param word: a word-base for a concordance
     :param left_context_size: the number of words in the left context
     :param right_context_size: the number of words in the right context
@@ -88,7 +113,7 @@ def get_concordance(tokens: list, word: str, left_context_size: int, right_conte
     --> [['man', 'is', 'happy', 'the', 'dog', 'is'], ['dog', 'is', 'happy', 'but', 'the', 'cat']]
     """
     stop = False
-    if not isinstance(tokens, list) or not isinstance(word, str) or len(word) == 0:
+    if not isinstance(tokens, (list, EncodedTokens)) or not isinstance(word, str) or len(word) == 0:
         return []
     if not isinstance(left_context_size, int) or isinstance(left_context_size, bool):
         stop = True
@@ -99,8 +124,10 @@ def get_concordance(tokens: list, word: str, left_context_size: int, right_conte
     if stop:
         return []
 
-    list_all_words = tokens.copy()
-    indexes = [ind for ind, char in enumerate(list_all_words) if char == word]
+    if isinstance(tokens, EncodedTokens):
+        indexes = tokens.positions(word)
+    else:
+        indexes = [ind for ind, char in enumerate(tokens) if char == word]
 
     if len(indexes) == 0 or right_context_size < 0 or left_context_size < 0:
         return []
@@ -119,7 +146,7 @@ def get_concordance(tokens: list, word: str, left_context_size: int, right_conte
 def get_adjacent_words(tokens: list, word: str, left_n: int, right_n: int) -> list:
     """
     Gets adjacent words from the left and right context
-    :param tokens: a list of tokens
+    :param tokens: a list of tokens or encoded tokens
     :param word: a word-base for the search
     :param left_n: the distance between a word and an adjacent one in the left context
     :param right_n: the distance between a word and an adjacent one in the right context
@@ -167,7 +194,7 @@ def write_to_file(content: list, path_to_file='report.txt'):
 def sort_concordance(tokens: list, word: str, left_context_size: int, right_context_size: int, left_sort: bool) -> list:
     """
     Gets a concordance of a word and sorts it by either left or right context
-    :param tokens: a list of tokens
+    :param tokens: a list of tokens or encoded tokens
     :param word: a word-base for a concordance
     :param left_context_size: the number of words in the left context
     :param right_context_size: the number of words in the right context
@@ -0,0 +1,118 @@
+"""
+Lab 1
+Parallel tokenization and frequency counting of big files
+"""
+
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from main import tokenize
+from frequencies import FrequencyCounter
+
+MIN_RANGE_SIZE = 1 << 16
+RANGES_PER_WORKER = 4
+
+
+def _find_boundary(file, offset: int, size: int) -> int:
+    # the first position after offset that follows a space or a newline byte,
+    # these bytes never occur inside multi-byte utf-8 characters
+    file.seek(offset)
+    while offset < size:
+        block = file.read(MIN_RANGE_SIZE)
+        positions = [block.find(byte) for byte in (b' ', b'\n')]
+        positions = [position for position in positions if position != -1]
+        if positions:
+            return offset + min(positions) + 1
+        offset += len(block)
+    return size
+
+
+def split_file(path_to_file: str, range_size: int) -> list:
+    """
+    Splits a file into byte ranges of about the given size that start right after whitespace,
+    so no word is cut between two ranges
+    :param path_to_file: a path to a text file
+    :param range_size: a desired number of bytes in a range
+    :return: a list of (path, start, end) tuples covering the file
+    """
+    if not isinstance(range_size, int) or isinstance(range_size, bool) or range_size < 1:
+        raise ValueError
+    size = os.path.getsize(path_to_file)
+    ranges = []
+    start = 0
+    with open(path_to_file, 'rb') as file:
+        while start < size:
+            end = _find_boundary(file, min(start + range_size, size) - 1, size)
+            ranges.append((path_to_file, start, end))
+            start = end
+    return ranges
+
+
+def tokenize_range(file_range: tuple) -> list:
+    """
+    Reads and tokenizes a byte range of a file like main.tokenize
+    :param file_range: a (path, start, end) tuple
+    :return: a list of tokens
+    """
+    path_to_file, start, end = file_range
+    with open(path_to_file, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode('utf-8')
+    # the same newline translation as reading the file in the text mode
+    return tokenize(text.replace('\r\n', '\n').replace('\r', '\n'))
+
+
+def count_range(file_range: tuple) -> dict:
+    """
+    Calculates frequencies of tokens in a byte range of a file
+    :param file_range: a (path, start, end) tuple
+    :return: a dictionary with frequencies
+    """
+    return dict(Counter(tokenize_range(file_range)))
+
+
+def _map_ranges(function, paths, workers):
+    if isinstance(paths, str):
+        paths = [paths]
+    if not isinstance(paths, (list, tuple)) or not all(isinstance(path, str) for path in paths):
+        raise ValueError
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ValueError
+
+    total_size = sum(os.path.getsize(path) for path in paths)
+    range_size = max(total_size // (workers * RANGES_PER_WORKER) + 1, MIN_RANGE_SIZE)
+    ranges = [file_range for path in paths for file_range in split_file(path, range_size)]
+    if workers == 1:
+        return map(function, ranges)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, ranges))
+
+
+def tokenize_parallel(paths, workers=None) -> list:
+    """
+    Tokenizes files in several processes
+    :param paths: a path or a list of paths to text files
+    :param workers: a number of processes, all the cpu cores by default
+    :return: a list of tokens of all the files in order
+    """
+    tokens = []
+    for range_tokens in _map_ranges(tokenize_range, paths, workers):
+        tokens.extend(range_tokens)
+    return tokens
+
+
+def calculate_frequencies_parallel(paths, workers=None) -> dict:
+    """
+    Calculates frequencies of tokens of files in several processes,
+    the partial frequencies of file ranges are merged in order,
+    so the result equals main.calculate_frequencies of all the tokens
+    :param paths: a path or a list of paths to text files
+    :param workers: a number of processes, all the cpu cores by default
+    :return: a dictionary with frequencies
+    """
+    counter = FrequencyCounter()
+    for frequencies in _map_ranges(count_range, paths, workers):
+        counter.merge(frequencies)
+    return counter.to_dict()
@@ -0,0 +1,71 @@
+# pylint: skip-file
+"""
+Checks the first lab parallel tokenization and counting
+"""
+
+import os
+import tempfile
+import unittest
+from main import calculate_frequencies
+from main import tokenize
+from main import read_from_file
+from parallel import split_file
+from parallel import tokenize_parallel
+from parallel import calculate_frequencies_parallel
+
+
+class ParallelTest(unittest.TestCase):
+    """
+    Tests parallel tokenization and counting functions
+    """
+
+    def test_split_file_ideal(self):
+        """
+        Checks that byte ranges cover the file and start after whitespace
+        """
+        text = 'The weather is sunny,\nthe man is happy. Привет мир happy'
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            path_to_file = os.path.join(path_to_dir, 'text.txt')
+            with open(path_to_file, 'w', encoding='utf-8') as file:
+                file.write(text)
+            data = text.encode('utf-8')
+            for range_size in [1, 3, 7, 100]:
+                ranges = split_file(path_to_file, range_size)
+                self.assertEqual(0, ranges[0][1])
+                self.assertEqual(len(data), ranges[-1][2])
+                for (_, _, end), (_, start, _) in zip(ranges, ranges[1:]):
+                    self.assertEqual(end, start)
+                    self.assertTrue(data[start - 1:start] in (b' ', b'\n'))
+
+    def test_tokenize_parallel_ideal(self):
+        """
+        Checks that parallel tokenization equals serial tokenization
+        """
+        text = 'The weather is sunny,\r\nthe man\ris happy. Привет мир happy'
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            path_to_file = os.path.join(path_to_dir, 'text.txt')
+            with open(path_to_file, 'w', encoding='utf-8', newline='') as file:
+                file.write(text)
+            expected = tokenize(read_from_file(path_to_file))
+            self.assertEqual(expected, tokenize_parallel(path_to_file, 1))
+            self.assertEqual(expected * 2, tokenize_parallel([path_to_file, path_to_file], 2))
+
+    def test_parallel_bad_inputs(self):
+        """
+        Checks that parallel functions handle incorrect inputs
+        """
+        for bad_input in [None, 9, [None], {}]:
+            self.assertRaises(ValueError, calculate_frequencies_parallel, bad_input)
+        for bad_input in [0, -1, True, 'string', 2.5]:
+            self.assertRaises(ValueError, calculate_frequencies_parallel, 'lab_1/data.txt', bad_input)
+            self.assertRaises(ValueError, split_file, 'lab_1/data.txt', bad_input)
+
+    def test_big_text_calculate_frequencies_parallel(self):
+        """
+        Checks that parallel counting gives the same frequencies as the serial path
+        """
+        expected = calculate_frequencies(tokenize(read_from_file('lab_1/data.txt')))
+        for workers in [1, 2]:
+            actual = calculate_frequencies_parallel('lab_1/data.txt', workers)
+            self.assertEqual(expected, actual)
+            self.assertEqual(list(expected), list(actual))
@@ -5,6 +5,7 @@ Checks the first lab stop words removal functions
 
 import unittest
 from main import remove_stop_words
+from vocabulary import EncodedTokens, Vocabulary
 
 
 class RemoveStopWordsTest(unittest.TestCase):
@@ -52,3 +53,21 @@ class RemoveStopWordsTest(unittest.TestCase):
         expected = []
         actual = remove_stop_words(['the', 'a', 'is'], RemoveStopWordsTest.STOP_WORDS)
         self.assertEqual(expected, actual)
+
+    def test_remove_stop_words_unhashable_items(self):
+        """
+        Remove stop words with unhashable stop words or tokens scenario
+        """
+        self.assertEqual(['a', 'b'], remove_stop_words(['a', ['x'], 'b'], [['x']]))
+        self.assertEqual(['a', {'k': 1}], remove_stop_words(['a', 'b', {'k': 1}], [['x'], 'b']))
+
+    def test_remove_stop_words_encoded_tokens_collections(self):
+        """
+        Remove stop words from encoded tokens with stop words of any collection scenario
+        """
+        tokens = ['the', 'man', 'is', 'happy']
+        for stop_words in [('the', 'is'), {'the', 'is'}, frozenset(['the', 'is']), ['the', 'is', ['x']]]:
+            actual = remove_stop_words(Vocabulary().encode(tokens), stop_words)
+            self.assertTrue(isinstance(actual, EncodedTokens))
+            self.assertEqual(['man', 'happy'], actual.decode())
+            self.assertEqual(remove_stop_words(tokens, stop_words), actual.decode())
@@ -0,0 +1,171 @@
+"""
+Lab 1
+Sorted concordances: multi-word sort keys and an external merge sort for huge concordances
+"""
+
+import tempfile
+from contextlib import ExitStack
+from heapq import merge
+from itertools import islice
+from vocabulary import EncodedTokens
+
+RUN_SIZE = 1 << 16
+
+
+def _is_size(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _find_positions(tokens, word: str):
+    if isinstance(tokens, EncodedTokens):
+        return iter(tokens.positions(word))
+    return (position for position, token in enumerate(tokens) if token == word)
+
+
+def _is_sequence(tokens) -> bool:
+    return not isinstance(tokens, (str, bytes, dict)) and hasattr(tokens, '__getitem__')
+
+
+def _write_run(records: list, temp_dir):
+    # a sorted run as lines of 'key words \t position \t line words'
+    records.sort(key=lambda record: record[0])
+    run = tempfile.TemporaryFile('w+', encoding='utf-8', dir=temp_dir)
+    for key, position, line in records:
+        run.write(f"{' '.join(key)}\t{position}\t{' '.join(line)}\n")
+    run.seek(0)
+    return run
+
+
+def _read_run(run):
+    for record in run:
+        key, position, line = record.rstrip('\n').split('\t')
+        yield tuple(key.split()), int(position), line.split()
+
+
+class ConcordanceSorter:
+    """
+    Sorts concordance lines by several context words: the left context words from the first word
+    of a line or the right context words from the word after the keyword, at most key_size of them
+    The keys are computed once per line; lines with equal keys are all kept in the text order
+    Context windows are clipped at the borders of the text, so their keys can be shorter
+    Huge concordances are sorted with an external merge sort: lines are sorted by runs of run_size,
+    every run is spilled to a temporary file in temp_dir and the runs are merged lazily
+    e.g. sorter = ConcordanceSorter(1, 1, False)
+    sorter.sort(['a', 'is', 'happy', 'c', 'is', 'happy', 'b'], 'happy')
+    --> [['is', 'happy', 'b'], ['is', 'happy', 'c']]
+    """
+
+    def __init__(self, left_context_size: int, right_context_size: int, left_sort: bool, key_size=None):
+        if not _is_size(left_context_size) or not _is_size(right_context_size) or \
+                not isinstance(left_sort, bool):
+            raise ValueError
+        if key_size is not None and (not _is_size(key_size) or key_size < 1):
+            raise ValueError
+        # the same corrections as in main.sort_concordance
+        if left_context_size < 0 and not left_sort:
+            left_context_size = 0
+        if right_context_size < 0 and left_sort:
+            right_context_size = 0
+        if left_context_size < 0 or right_context_size < 0 or not left_context_size + right_context_size:
+            raise ValueError
+        self.left_context_size = left_context_size
+        self.right_context_size = right_context_size
+        self.left_sort = left_sort
+        self.key_size = key_size
+        self.run_size = RUN_SIZE
+        self.temp_dir = None
+
+    def get_key(self, tokens, position: int) -> tuple:
+        """
+        Builds the sort key of the concordance line of a keyword
+        :param tokens: a sequence of tokens
+        :param position: the position of the keyword
+        :return: a tuple of words
+        e.g. ConcordanceSorter(2, 2, False).get_key(['the', 'man', 'is', 'happy', 'the', 'dog'], 3)
+        --> ('the', 'dog')
+        """
+        if self.left_sort:
+            start = max(position - self.left_context_size, 0)
+            end = position
+        else:
+            start = position + 1
+            end = min(position + self.right_context_size + 1, len(tokens))
+        if self.key_size is not None:
+            end = min(start + self.key_size, end)
+        return tuple(tokens[start:end])
+
+    def _read_records(self, tokens, positions, limit=None):
+        # (key, position, line) for the next positions
+        n_tokens = len(tokens)
+        for position in islice(positions, limit):
+            start = max(position - self.left_context_size, 0)
+            end = min(position + self.right_context_size + 1, n_tokens)
+            yield self.get_key(tokens, position), position, tokens[start:end]
+
+    def sort(self, tokens, word: str) -> list:
+        """
+        Gets a sorted concordance of a word in memory
+        :param tokens: a list of tokens or encoded tokens
+        :param word: a word-base for a concordance
+        :return: a concordance
+        """
+        if not _is_sequence(tokens) or not isinstance(word, str) or not word:
+            return []
+        records = list(self._read_records(tokens, _find_positions(tokens, word)))
+        records.sort(key=lambda record: record[0])
+        return [line for _, _, line in records]
+
+    def iter_sorted(self, tokens, word: str, positions=None):
+        """
+        Streams a sorted concordance of a word, the memory depends on run_size
+        and not on the number of lines; concordances that fit into one run are sorted in memory
+        :param tokens: a sequence of tokens, e.g. a list, encoded tokens or tokens of a disk index
+        :param word: a word-base for a concordance
+        :param positions: an iterable of the keyword positions in ascending order, e.g. from an index,
+        the tokens are scanned by default
+        :return: a generator of concordance lines
+        """
+        if not _is_sequence(tokens) or not isinstance(word, str) or not word:
+            return
+        if not _is_size(self.run_size) or self.run_size < 1:
+            raise ValueError
+        positions = _find_positions(tokens, word) if positions is None else iter(positions)
+        records = list(self._read_records(tokens, positions, self.run_size))
+        if len(records) < self.run_size:
+            records.sort(key=lambda record: record[0])
+            for _, _, line in records:
+                yield list(line)
+            return
+        with ExitStack() as stack:
+            runs = []
+            while records:
+                runs.append(stack.enter_context(_write_run(records, self.temp_dir)))
+                records = list(self._read_records(tokens, positions, self.run_size))
+            # equal keys are merged by position, so the order is the same as in memory
+            # the runs are closed and deleted on exit, even if the generator is not exhausted
+            for _, _, line in merge(*map(_read_run, runs), key=lambda record: (record[0], record[1])):
+                yield line
+
+
+def sort_concordance(tokens, word: str, left_context_size: int, right_context_size: int, left_sort: bool) -> list:
+    """
+    Gets a concordance of a word sorted by the whole left or right context
+    Unlike main.sort_concordance, lines sharing the first context word are all kept
+    :param tokens: a list of tokens or encoded tokens
+    :param word: a word-base for a concordance
+    :param left_context_size: the number of words in the left context
+    :param right_context_size: the number of words in the right context
+    :param left_sort: if True, sort by the left context, False – by the right context
+    :return: a concordance
+    e.g. tokens = ['a', 'is', 'happy', 'c', 'x', 'is', 'happy', 'c', 'a']
+    word = 'happy'
+    left_context_size = 1
+    right_context_size = 2
+    left_sort = False
+    --> [['is', 'happy', 'c', 'a'], ['is', 'happy', 'c', 'x']]
+    """
+    try:
+        sorter = ConcordanceSorter(left_context_size, right_context_size, left_sort)
+    except ValueError:
+        return []
+    return sorter.sort(tokens, word)
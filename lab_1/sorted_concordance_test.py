@@ -0,0 +1,97 @@
+# pylint: skip-file
+"""
+Checks the first lab sorted concordances
+"""
+
+import tempfile
+import unittest
+from main import sort_concordance as main_sort_concordance
+from main import tokenize
+from main import read_from_file
+from concordance_index import ConcordanceIndex
+from sorted_concordance import ConcordanceSorter
+from sorted_concordance import sort_concordance
+from vocabulary import Vocabulary
+
+
+class SortedConcordanceTest(unittest.TestCase):
+    """
+    Tests ConcordanceSorter class and sort_concordance function
+    """
+
+    tokens = ['the', 'weather', 'is', 'sunny', 'the', 'man', 'is', 'happy',
+              'the', 'dog', 'is', 'happy', 'but', 'the', 'cat', 'is', 'sad']
+
+    def test_sort_concordance_ideal(self):
+        """
+        Ideal sorted concordance scenario
+        """
+        for left_sort in (True, False):
+            expected = main_sort_concordance(self.tokens, 'happy', 2, 3, left_sort)
+            self.assertEqual(expected, sort_concordance(self.tokens, 'happy', 2, 3, left_sort))
+            self.assertEqual(expected, list(ConcordanceSorter(2, 3, left_sort).iter_sorted(self.tokens, 'happy')))
+
+    def test_sort_key(self):
+        """
+        Checks sort keys of several context words
+        """
+        self.assertEqual(('sunny', 'the'), ConcordanceSorter(2, 3, True).get_key(self.tokens, 5))
+        self.assertEqual(('sunny',), ConcordanceSorter(2, 3, True, 1).get_key(self.tokens, 5))
+        self.assertEqual(('is', 'happy', 'the'), ConcordanceSorter(2, 3, False).get_key(self.tokens, 5))
+        self.assertEqual(('is', 'sad'), ConcordanceSorter(2, 3, False).get_key(self.tokens, 14))
+        self.assertEqual(('the',), ConcordanceSorter(5, 3, True).get_key(self.tokens, 1))
+        self.assertEqual((), ConcordanceSorter(0, 3, True).get_key(self.tokens, 5))
+
+    def test_sort_concordance_keeps_same_keys(self):
+        """
+        Checks that lines sharing a key are kept in the text order and later words break ties
+        """
+        tokens = ['a', 'is', 'happy', 'c', 'x', 'is', 'happy', 'b', 'y', 'is', 'happy', 'c', 'a']
+        expected = [['is', 'happy', 'b', 'y'], ['is', 'happy', 'c', 'a'], ['is', 'happy', 'c', 'x']]
+        self.assertEqual(expected, sort_concordance(tokens, 'happy', 1, 2, False))
+        expected = [['is', 'happy', 'b', 'y'], ['is', 'happy', 'c', 'x'], ['is', 'happy', 'c', 'a']]
+        self.assertEqual(expected, ConcordanceSorter(1, 2, False, 1).sort(tokens, 'happy'))
+        self.assertEqual(3, len(sort_concordance(tokens, 'happy', 1, 2, True)))
+
+    def test_sort_concordance_encoded(self):
+        """
+        Checks that encoded tokens are sorted by words and not by ids
+        """
+        encoded = Vocabulary().encode(self.tokens)
+        self.assertEqual(sort_concordance(self.tokens, 'is', 1, 1, False), sort_concordance(encoded, 'is', 1, 1, False))
+
+    def test_external_sort_spills_runs(self):
+        """
+        Checks that the merge of runs spilled to disk gives the in-memory order
+        """
+        tokens = tokenize(read_from_file('lab_1/data.txt'))
+        expected = sort_concordance(tokens, 'the', 2, 2, False)
+        sorter = ConcordanceSorter(2, 2, False)
+        sorter.run_size = 1000
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sorter.temp_dir = temp_dir
+            lines = sorter.iter_sorted(tokens, 'the')
+            self.assertEqual(expected[0], next(lines))
+            self.assertEqual(expected[1:], list(lines))
+        index = ConcordanceIndex(tokens)
+        sorter = ConcordanceSorter(3, 1, True)
+        sorter.run_size = 500
+        self.assertEqual(sorter.sort(tokens, 'a'), list(sorter.iter_sorted(tokens, 'a', index.get_positions('a'))))
+
+    def test_sort_concordance_bad_inputs(self):
+        """
+        Checks that sorting handles incorrect inputs like main.sort_concordance
+        """
+        for bad_input in [(), {}, '', None, 8.94, [None], -1]:
+            self.assertEqual([], sort_concordance(self.tokens, bad_input, 2, 3, True))
+            self.assertEqual([], sort_concordance(self.tokens, 'happy', bad_input, bad_input, True))
+            self.assertEqual([], sort_concordance(self.tokens, 'happy', 2, 3, bad_input))
+            self.assertEqual([], ConcordanceSorter(2, 3, True).sort(bad_input, 'happy'))
+            self.assertEqual([], list(ConcordanceSorter(2, 3, True).iter_sorted(self.tokens, bad_input)))
+            self.assertRaises(ValueError, ConcordanceSorter, bad_input, 3, True)
+        for bad_input in [(), {}, '', 8.94, [None], -1, 0, True]:
+            self.assertRaises(ValueError, ConcordanceSorter, 2, 3, True, bad_input)
+        self.assertEqual([], sort_concordance(self.tokens, 'happy', 0, 0, True))
+        self.assertEqual(main_sort_concordance(self.tokens, 'happy', -1, 3, False),
+                         sort_concordance(self.tokens, 'happy', -1, 3, False))
+        self.assertEqual([], sort_concordance(self.tokens, 'happy', -1, 3, True))
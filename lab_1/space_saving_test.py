@@ -0,0 +1,52 @@
+# pylint: skip-file
+"""
+Checks the first lab streaming heavy hitters
+"""
+
+import unittest
+from main import calculate_frequencies
+from main import get_top_n_words
+from main import tokenize
+from main import read_from_file
+from frequencies import SpaceSaving
+
+
+class SpaceSavingTest(unittest.TestCase):
+    """
+    Tests SpaceSaving class
+    """
+
+    def test_space_saving_ideal(self):
+        """
+        Ideal space saving scenario: the capacity exceeds the vocabulary, so counts are exact
+        """
+        tokens = ['weather', 'sunny', 'man', 'happy', 'weather', 'man', 'man']
+        sketch = SpaceSaving(10).update(tokens)
+        expected = [('man', 3, 0), ('weather', 2, 0)]
+        self.assertEqual(expected, sketch.top(2))
+        self.assertEqual(get_top_n_words(calculate_frequencies(tokens), 2), sketch.get_top_n_words(2))
+        self.assertTrue(sketch.is_guaranteed(2))
+
+    def test_space_saving_error_bounds(self):
+        """
+        Checks that estimated counts stay within the reported error bounds on a big text
+        """
+        tokens = tokenize(read_from_file('lab_1/data.txt'))
+        frequencies = calculate_frequencies(tokens)
+        sketch = SpaceSaving(500).update(tokens)
+        self.assertEqual(len(tokens), sketch.stream_length)
+        for token, count, error in sketch.top(50):
+            self.assertTrue(count - error <= frequencies[token] <= count)
+            self.assertTrue(error <= sketch.error_bound)
+        self.assertEqual(get_top_n_words(frequencies, 5), sketch.get_top_n_words(5))
+        self.assertTrue(sketch.is_guaranteed(5))
+
+    def test_space_saving_bad_input(self):
+        """
+        Space saving invalid input check
+        """
+        for bad_capacity in [0, -1, None, 'string', True, 9.34]:
+            self.assertRaises(ValueError, SpaceSaving, bad_capacity)
+        for bad_input in ['string', {}, None, 9]:
+            self.assertRaises(ValueError, SpaceSaving(2).update, bad_input)
+        self.assertEqual([], SpaceSaving(2).top(None))
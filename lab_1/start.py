@@ -4,16 +4,17 @@ Concordance implementation starter
 
 import os
 import main
+from token_cache import TokenCache
 
 
 if __name__ == '__main__':
     #  use data.txt file to test your program
     current_dir = os.path.dirname(os.path.abspath(__file__))
-    data = main.read_from_file(os.path.join(current_dir, 'data.txt'))
     stop_words = main.read_from_file(os.path.join(current_dir, 'stop_words.txt')).split('\n')
 
     #  here goes your logic: calling methods from concordance.py
-    tokenized_data = main.tokenize(data)
+    # the tokens of data.txt are cached, so repeated runs do not tokenize it again
+    tokenized_data = TokenCache().load_tokens(os.path.join(current_dir, 'data.txt'))
     clean_data = main.remove_stop_words(tokenized_data, stop_words)
 
     top_n = main.get_top_n_words(main.calculate_frequencies(clean_data), 13)
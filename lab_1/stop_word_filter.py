@@ -0,0 +1,85 @@
+"""
+Lab 1
+Compiled stop word filter
+"""
+
+from array import array
+from itertools import compress, filterfalse
+
+
+class StopWordFilter:
+    """
+    Removes stop words from token lists, token streams and token id arrays
+    The stop words are compiled once into a frozenset for words
+    and, given a vocabulary, into a byte table with a flag per token id
+    e.g. stop_word_filter = StopWordFilter(['the', 'is'])
+    stop_word_filter.filter(['the', 'weather', 'is', 'sunny'])
+    --> ['weather', 'sunny']
+    """
+
+    def __init__(self, stop_words, word_ids=None):
+        if isinstance(stop_words, (str, bytes, dict)) or not hasattr(stop_words, '__iter__'):
+            raise ValueError
+        self.stop_words = frozenset(word for word in stop_words if word)
+        self._keep = b''
+        if word_ids is not None:
+            self.compile_ids(word_ids)
+
+    @classmethod
+    def from_file(cls, path_to_file: str, word_ids=None):
+        """
+        Reads stop words from a file with a word per line
+        :param path_to_file: a path to a file with stop words
+        :param word_ids: a dictionary of words with their ids
+        :return: a stop word filter
+        """
+        with open(path_to_file, 'r', encoding='utf-8') as file_to_read:
+            return cls(file_to_read.read().split('\n'), word_ids)
+
+    def compile_ids(self, word_ids: dict):
+        """
+        Builds the byte table for token ids: a stop word id is flagged with 0, any other id with 1
+        :param word_ids: a dictionary of words with their ids
+        :return: the filter itself
+        """
+        if not isinstance(word_ids, dict):
+            raise ValueError
+        keep = bytearray(b'\x01') * (max(word_ids.values(), default=-1) + 1)
+        for word in self.stop_words:
+            if word in word_ids:
+                keep[word_ids[word]] = 0
+        self._keep = bytes(keep)
+        return self
+
+    def __contains__(self, word) -> bool:
+        return word in self.stop_words
+
+    def filter(self, tokens):
+        """
+        Removes stop words from tokens
+        :param tokens: a list or an iterator of tokens
+        :return: a list of tokens for a list, a lazy iterator otherwise
+        """
+        if isinstance(tokens, (str, bytes, dict)) or not hasattr(tokens, '__iter__'):
+            raise ValueError
+        kept = filterfalse(self.stop_words.__contains__, tokens)
+        if isinstance(tokens, (list, tuple)):
+            return list(kept)
+        return kept
+
+    def filter_ids(self, ids) -> array:
+        """
+        Removes stop word ids from an id array
+        Ids that are not in the compiled vocabulary are kept
+        :param ids: an array('I') or any iterable of token ids
+        :return: an array('I') of ids without stop words
+        """
+        if not isinstance(ids, array):
+            ids = array('I', ids)
+        if not ids:
+            return ids
+        keep = self._keep
+        max_id = max(ids)
+        if max_id >= len(keep):
+            keep += b'\x01' * (max_id + 1 - len(keep))
+        return array(ids.typecode, compress(ids, map(keep.__getitem__, ids)))
@@ -0,0 +1,68 @@
+# pylint: skip-file
+"""
+Checks the first lab compiled stop word filter
+"""
+
+import unittest
+from array import array
+from main import remove_stop_words
+from main import tokenize
+from main import read_from_file
+from stop_word_filter import StopWordFilter
+
+
+class StopWordFilterTest(unittest.TestCase):
+    """
+    Tests StopWordFilter class
+    """
+
+    STOP_WORDS = ['the', 'a', 'is']
+    TOKENS = ['the', 'weather', 'is', 'sunny', 'the', 'man', 'is', 'happy']
+
+    def test_stop_word_filter_ideal(self):
+        """
+        Ideal stop word filter scenario
+        """
+        expected = ['weather', 'sunny', 'man', 'happy']
+        stop_word_filter = StopWordFilter(self.STOP_WORDS)
+        self.assertEqual(expected, stop_word_filter.filter(self.TOKENS))
+        self.assertTrue('the' in stop_word_filter)
+        self.assertFalse('man' in stop_word_filter)
+
+    def test_stop_word_filter_generator(self):
+        """
+        Checks that a token stream is filtered lazily
+        """
+        expected = ['weather', 'sunny', 'man', 'happy']
+        actual = StopWordFilter(self.STOP_WORDS).filter(iter(self.TOKENS))
+        self.assertFalse(isinstance(actual, list))
+        self.assertEqual(expected, list(actual))
+
+    def test_stop_word_filter_ids(self):
+        """
+        Checks that stop word ids are removed from an id array
+        """
+        word_ids = {'the': 0, 'weather': 1, 'is': 2, 'sunny': 3, 'man': 4, 'happy': 5}
+        ids = array('I', [word_ids[token] for token in self.TOKENS] + [9])
+        expected = array('I', [1, 3, 4, 5, 9])
+        self.assertEqual(expected, StopWordFilter(self.STOP_WORDS, word_ids).filter_ids(ids))
+        self.assertEqual(array('I'), StopWordFilter(self.STOP_WORDS, word_ids).filter_ids(array('I')))
+        self.assertEqual(array('I', [0, 2]), StopWordFilter(self.STOP_WORDS).filter_ids([0, 2]))
+
+    def test_stop_word_filter_bad_inputs(self):
+        """
+        Checks that the filter handles incorrect inputs
+        """
+        for bad_input in ['string', {}, None, 9]:
+            self.assertRaises(ValueError, StopWordFilter, bad_input)
+            self.assertRaises(ValueError, StopWordFilter(self.STOP_WORDS).filter, bad_input)
+        self.assertRaises(ValueError, StopWordFilter(self.STOP_WORDS).compile_ids, ['the'])
+
+    def test_big_text_stop_word_filter(self):
+        """
+        Checks that the filter gives the same tokens as remove_stop_words on a big text
+        """
+        tokens = tokenize(read_from_file('lab_1/data.txt'))
+        stop_words = read_from_file('lab_1/stop_words.txt').split('\n')
+        stop_word_filter = StopWordFilter.from_file('lab_1/stop_words.txt')
+        self.assertEqual(remove_stop_words(tokens, stop_words), stop_word_filter.filter(tokens))
@@ -0,0 +1,164 @@
+"""
+Lab 1
+Suffix array over token ids for phrase concordances
+"""
+
+from array import array
+from collections.abc import Mapping
+import numpy as np
+from concordance_index import ConcordanceIndex
+from vocabulary import EncodedTokens, Vocabulary
+
+
+def _group_starts(slots: np.ndarray, sorted_keys: np.ndarray) -> tuple:
+    # the slot of the first suffix with the same key for every sorted slot and the flags of new groups
+    new_groups = np.empty(len(sorted_keys), dtype=bool)
+    new_groups[0] = True
+    np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=new_groups[1:])
+    return np.maximum.accumulate(np.where(new_groups, slots, 0)), new_groups
+
+
+def build_suffix_array(ranks: np.ndarray) -> np.ndarray:
+    """
+    Sorts all the suffixes of a sequence of word ranks by prefix doubling:
+    after every round the suffixes are ordered by their first 2 ** round words
+    and every suffix is ranked by the first slot of its group of equal prefixes
+    Only groups of several suffixes are sorted again, each round with one vectorized sort,
+    so the construction takes O(N log N log L) time at most, where L is the length
+    of the longest repeated phrase
+    The end of the text is smaller than any word
+    :param ranks: an array of word ranks
+    :return: an array of suffix start positions in the lexicographic order of the suffixes
+    e.g. ranks = np.array([2, 0, 1, 2, 0])
+    --> array([4, 1, 2, 3, 0])
+    """
+    n_tokens = len(ranks)
+    if not n_tokens:
+        return np.zeros(0, dtype=np.uint32)
+    slots = np.arange(n_tokens, dtype=np.int64)
+    suffix_array = np.argsort(ranks, kind='stable').astype(np.int64)
+    rank = np.empty(n_tokens, dtype=np.int64)
+    starts, new_groups = _group_starts(slots, ranks[suffix_array])
+    rank[suffix_array] = starts
+    length = 1
+    while True:
+        # only the suffixes of groups bigger than one can change their order
+        single = new_groups & np.append(new_groups[1:], True)
+        slots = slots[~single]
+        if slots.size == 0 or length >= n_tokens:
+            return suffix_array.astype(np.uint32)
+        suffixes = suffix_array[slots]
+        following = suffixes + length
+        second = np.zeros(len(suffixes), dtype=np.int64)
+        inside = following < n_tokens
+        second[inside] = rank[following[inside]] + 1
+        keys = rank[suffixes] * (n_tokens + 1) + second
+        order = np.argsort(keys, kind='stable')
+        suffix_array[slots] = suffixes[order]
+        starts, new_groups = _group_starts(slots, keys[order])
+        rank[suffixes[order]] = starts
+        length *= 2
+
+
+class SuffixArray(Mapping):
+    """
+    Maps phrases, i.e. words separated by spaces, to their positions in a text
+    A lookup is two binary searches over the sorted suffixes, O(m log N) for a phrase of m words
+    The words are ranked in their lexicographic order, so equal phrases are neighbours in the array
+    e.g. suffix_array = SuffixArray(['the', 'man', 'is', 'happy', 'the', 'man', 'is', 'sad'])
+    suffix_array['the man is']
+    --> array('I', [0, 4])
+    """
+
+    def __init__(self, tokens):
+        if isinstance(tokens, (str, bytes, dict)) or not hasattr(tokens, '__iter__'):
+            raise ValueError
+        if not isinstance(tokens, EncodedTokens):
+            tokens = list(tokens)
+            if not all(isinstance(token, str) for token in tokens):
+                raise ValueError
+            tokens = Vocabulary(sorted(set(tokens))).encode(tokens)
+        self.tokens = tokens
+        vocabulary = tokens.vocabulary
+        word_ranks = np.empty(len(vocabulary), dtype=np.uint32)
+        word_ranks[sorted(range(len(vocabulary)), key=vocabulary.words.__getitem__)] = \
+            np.arange(len(vocabulary), dtype=np.uint32)
+        self._word_ranks = word_ranks
+        ids = np.frombuffer(tokens.ids, dtype=np.uint32) if len(tokens) else np.zeros(0, dtype=np.uint32)
+        self._ranks = word_ranks[ids]
+        self.suffix_array = build_suffix_array(self._ranks)
+
+    def _rank_phrase(self, phrase) -> list:
+        if not isinstance(phrase, str):
+            return []
+        ranks = []
+        for word in phrase.split():
+            if word not in self.tokens.vocabulary:
+                return []
+            ranks.append(int(self._word_ranks[self.tokens.vocabulary.ids[word]]))
+        return ranks
+
+    def _search(self, query: list, upper: bool) -> int:
+        # the first suffix which prefix is not less (or greater, if upper) than the query
+        ranks, suffix_array, length = self._ranks, self.suffix_array, len(query)
+        low, high = 0, len(suffix_array)
+        while low < high:
+            middle = (low + high) // 2
+            start = int(suffix_array[middle])
+            prefix = ranks[start:start + length].tolist()
+            if prefix < query or upper and prefix == query:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def find(self, phrase: str) -> tuple:
+        """
+        Finds the range of the suffixes starting with a phrase
+        :param phrase: words separated by spaces
+        :return: a (first, last) range in the suffix array, empty for unknown phrases
+        """
+        query = self._rank_phrase(phrase)
+        if not query:
+            return 0, 0
+        return self._search(query, False), self._search(query, True)
+
+    def count(self, phrase: str) -> int:
+        """
+        Returns the number of occurrences of a phrase
+        """
+        first, last = self.find(phrase)
+        return last - first
+
+    def __getitem__(self, phrase):
+        first, last = self.find(phrase)
+        if first == last:
+            raise KeyError(phrase)
+        positions = array('I')
+        positions.frombytes(np.sort(self.suffix_array[first:last]).tobytes())
+        return positions
+
+    def __iter__(self):
+        return iter(self.tokens.vocabulary.words)
+
+    def __len__(self) -> int:
+        return len(self.tokens.vocabulary)
+
+
+class SuffixArrayIndex(ConcordanceIndex):
+    """
+    A concordance index answering phrase queries with a suffix array:
+    every ConcordanceIndex query accepts a phrase of several words separated by spaces,
+    the context is counted from the first and the last word of the phrase
+    e.g. index = SuffixArrayIndex(['the', 'man', 'is', 'happy', 'the', 'dog', 'is', 'happy'])
+    index.get_concordance('is happy', 1, 1)
+    --> [['man', 'is', 'happy', 'the'], ['dog', 'is', 'happy']]
+    """
+
+    def __init__(self, tokens):
+        suffix_array = SuffixArray(tokens)
+        super().__init__(suffix_array.tokens, suffix_array)
+        self.suffix_array = suffix_array
+
+    def _query_length(self, word: str) -> int:
+        return len(word.split())
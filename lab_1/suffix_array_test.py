@@ -0,0 +1,102 @@
+# pylint: skip-file
+"""
+Checks the first lab suffix array phrase index
+"""
+
+import random
+import unittest
+import numpy as np
+from main import get_adjacent_words
+from main import get_concordance
+from main import tokenize
+from main import read_from_file
+from suffix_array import SuffixArray
+from suffix_array import SuffixArrayIndex
+from suffix_array import build_suffix_array
+from vocabulary import Vocabulary
+
+
+class SuffixArrayTest(unittest.TestCase):
+    """
+    Tests build_suffix_array function, SuffixArray and SuffixArrayIndex classes
+    """
+
+    tokens = ['the', 'weather', 'is', 'sunny', 'the', 'man', 'is', 'happy',
+              'the', 'dog', 'is', 'happy', 'but', 'the', 'cat', 'is', 'sad']
+
+    def test_build_suffix_array(self):
+        """
+        Checks that suffixes are sorted like the lists of their words
+        """
+        for ranks in [[2, 0, 1, 2, 0], [0, 0, 0, 0], [3], [1, 0, 1, 0, 1, 0, 2]]:
+            expected = sorted(range(len(ranks)), key=lambda start: ranks[start:])
+            self.assertEqual(expected, build_suffix_array(np.array(ranks)).tolist())
+        self.assertEqual([], build_suffix_array(np.array([], dtype=np.uint32)).tolist())
+        generator = random.Random(0)
+        for _ in range(200):
+            ranks = [generator.randrange(3) for _ in range(generator.randint(1, 50))]
+            expected = sorted(range(len(ranks)), key=lambda start: ranks[start:])
+            self.assertEqual(expected, build_suffix_array(np.array(ranks)).tolist())
+
+    def test_suffix_array_phrases(self):
+        """
+        Ideal phrase lookup scenario
+        """
+        suffix_array = SuffixArray(self.tokens)
+        self.assertEqual([7, 11], list(suffix_array['happy']))
+        self.assertEqual([6, 10], list(suffix_array['is happy']))
+        self.assertEqual([5], list(suffix_array['man is happy']))
+        self.assertEqual(4, suffix_array.count('the'))
+        self.assertEqual(0, suffix_array.count('happy man'))
+        self.assertEqual(0, suffix_array.count('unknown'))
+        self.assertTrue('cat is sad' in suffix_array)
+        self.assertFalse('cat is sad but' in suffix_array)
+        self.assertEqual(len(set(self.tokens)), len(suffix_array))
+
+    def test_suffix_array_index_formats(self):
+        """
+        Checks that single words give the formats of main functions and phrases extend the keyword
+        """
+        index = SuffixArrayIndex(self.tokens)
+        self.assertEqual(get_concordance(self.tokens, 'happy', 2, 3), index.get_concordance('happy', 2, 3))
+        self.assertEqual(get_adjacent_words(self.tokens, 'happy', 2, 3), index.get_adjacent_words('happy', 2, 3))
+        self.assertEqual([['sunny', 'the', 'man', 'is', 'happy', 'the']], index.get_concordance('the man is', 1, 2))
+        self.assertEqual([['sunny', 'happy'], ['happy', 'happy']], index.get_adjacent_words('the man is', 1, 1) +
+                         index.get_adjacent_words('the dog is', 1, 1))
+        self.assertEqual([['man', 'is', 'happy', 'the'], ['dog', 'is', 'happy', 'but']],
+                         index.get_windows('is happy', 1, 1))
+        self.assertEqual([['dog', 'is', 'happy', 'but'], ['man', 'is', 'happy', 'the']],
+                         index.sort_concordance('is happy', 1, 1, True))
+
+    def test_suffix_array_encoded(self):
+        """
+        Checks that encoded tokens with ids in the text order are ranked by words
+        """
+        encoded = Vocabulary().encode(self.tokens)
+        suffix_array = SuffixArray(encoded)
+        self.assertTrue(suffix_array.tokens is encoded)
+        self.assertEqual([6, 10], list(suffix_array['is happy']))
+
+    def test_suffix_array_big_text(self):
+        """
+        Checks phrase lookups against a scan of a big text
+        """
+        tokens = tokenize(read_from_file('lab_1/data.txt'))
+        index = SuffixArrayIndex(tokens)
+        for phrase in ['of the', 'the man', 'in the world', 'sodium']:
+            words = phrase.split()
+            expected = [position for position in range(len(tokens) - len(words) + 1)
+                        if tokens[position:position + len(words)] == words]
+            self.assertEqual(expected, list(index.get_positions(phrase)))
+        self.assertEqual(get_concordance(tokens, 'sodium', 3, 3), index.get_concordance('sodium', 3, 3))
+
+    def test_suffix_array_bad_inputs(self):
+        """
+        Checks that the suffix array handles incorrect inputs
+        """
+        for bad_input in ['string', {}, None, 9, [None]]:
+            self.assertRaises(ValueError, SuffixArray, bad_input)
+        index = SuffixArrayIndex(self.tokens)
+        for bad_input in [(), {}, '', None, 8.94, [None], -1, '  ']:
+            self.assertEqual([], index.get_concordance(bad_input, 2, 3))
+            self.assertEqual(0, index.suffix_array.count(bad_input))
@@ -0,0 +1,87 @@
+"""
+Lab 1
+Tokens with their offsets for rendering concordances from the original text
+"""
+
+import mmap
+import os
+from collections.abc import Sequence
+from tokenizer import tokenize_with_offsets
+
+
+class TextTokens(Sequence):
+    """
+    The tokens of a text together with the text and the offsets of every token in it
+    It behaves as the list of tokens, so it can be indexed or passed to main functions,
+    and renders any range of tokens as the original fragment of the text
+    e.g. text_tokens = TextTokens('The man is "happy". The dog is sad.')
+    text_tokens.render(2, 5)
+    --> 'is "happy". The'
+    """
+
+    def __init__(self, text):
+        if not isinstance(text, (str, bytes, mmap.mmap)):
+            raise ValueError
+        self.text = text
+        self.tokens, self.starts, self.ends = tokenize_with_offsets(text)
+
+    @classmethod
+    def from_file(cls, path_to_file: str):
+        """
+        Maps a utf-8 file into memory and tokenizes it with byte offsets,
+        the fragments are read from the mapping on rendering
+        :param path_to_file: a path to a text file
+        :return: text tokens to be closed after use
+        """
+        if not isinstance(path_to_file, str):
+            raise ValueError
+        with open(path_to_file, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            # an empty file can not be mapped
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        return cls(mapped)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def __getitem__(self, item):
+        return self.tokens[item]
+
+    def __iter__(self):
+        return iter(self.tokens)
+
+    def render(self, start: int, end: int) -> str:
+        """
+        Slices the original text from the first letter of the token start to the last letter
+        of the token end - 1, line breaks are replaced with spaces
+        :param start: the index of the first token
+        :param end: the index after the last token
+        :return: a fragment of the text
+        """
+        if not 0 <= start < end <= len(self.tokens):
+            return ''
+        fragment = self.text[self.starts[start]:self.ends[end - 1]]
+        if not isinstance(fragment, str):
+            fragment = str(fragment, 'utf-8')
+        return fragment.replace('\r\n', ' ').replace('\n', ' ').replace('\r', ' ')
+
+    def render_windows(self, windows) -> list:
+        """
+        Renders concordance windows of these tokens, e.g. from ConcordanceIndex.get_windows
+        :param windows: an iterable of windows with start and end attributes
+        :return: a list of text fragments
+        """
+        return [self.render(window.start, window.end) for window in windows]
+
+    def close(self):
+        """
+        Unmaps the file opened by from_file
+        """
+        if isinstance(self.text, mmap.mmap):
+            self.text.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,96 @@
+# pylint: skip-file
+"""
+Checks the first lab offset-preserving tokenization
+"""
+
+import os
+import tempfile
+import unittest
+from main import get_concordance
+from main import tokenize
+from main import read_from_file
+from concordance_index import ConcordanceIndex
+from text_offsets import TextTokens
+from tokenizer import tokenize_with_offsets
+
+
+class TextOffsetsTest(unittest.TestCase):
+    """
+    Tests tokenize_with_offsets function and TextTokens class
+    """
+
+    text = 'The weather is sunny, the man is "happy".\nThe dog is happy, but the cat is sad!'
+
+    def test_tokenize_with_offsets_ideal(self):
+        """
+        Ideal offsets scenario: spans from the first to the last letter of every token
+        """
+        tokens, starts, ends = tokenize_with_offsets(self.text)
+        self.assertEqual(tokenize(self.text), tokens)
+        self.assertEqual(['The', 'weather', 'is', 'sunny', 'the', 'man', 'is', 'happy', 'The'],
+                         [self.text[start:end] for start, end in zip(starts[:9], ends[:9])])
+        self.assertEqual('I', starts.typecode)
+
+    def test_tokenize_with_offsets_like_tokenize(self):
+        """
+        Checks that tokens equal main.tokenize ones for tricky texts and for bytes
+        """
+        for text in ['a\tb c', "don't... ,, x", 'été abé', 'İstanbul K', '', '!!!', 'a-b\nc\n\n']:
+            self.assertEqual(tokenize(text), tokenize_with_offsets(text)[0])
+            tokens, starts, ends = tokenize_with_offsets(text.encode('utf-8'))
+            self.assertEqual(tokenize(text), tokens)
+        text = 'été Abé!'
+        tokens, starts, ends = tokenize_with_offsets(text.encode('utf-8'))
+        self.assertEqual(['t', 'ab'], tokens)
+        self.assertEqual([(2, 3), (6, 8)], list(zip(starts, ends)))
+
+    def test_text_tokens_render(self):
+        """
+        Checks rendering of concordance windows as original fragments
+        """
+        text_tokens = TextTokens(self.text)
+        self.assertEqual(tokenize(self.text), list(text_tokens))
+        self.assertEqual('man is "happy".\nThe'.replace('\n', ' '), text_tokens.render(5, 9))
+        index = ConcordanceIndex(text_tokens)
+        self.assertEqual(get_concordance(text_tokens.tokens, 'happy', 1, 1), index.get_concordance('happy', 1, 1))
+        self.assertEqual(['is "happy". The', 'is happy, but'],
+                         text_tokens.render_windows(index.get_windows('happy', 1, 1)))
+        self.assertEqual('', text_tokens.render(3, 3))
+        self.assertEqual('', text_tokens.render(0, 100))
+
+    def test_text_tokens_from_file(self):
+        """
+        Checks byte offsets over a memory-mapped file
+        """
+        text = read_from_file('lab_1/data.txt')
+        with TextTokens.from_file('lab_1/data.txt') as text_tokens:
+            self.assertEqual(tokenize(text), text_tokens.tokens)
+            characters = TextTokens(text)
+            for start in range(0, len(text_tokens) - 10, 10007):
+                self.assertEqual(characters.render(start, start + 10), text_tokens.render(start, start + 10))
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            path_to_file = os.path.join(path_to_dir, 'empty.txt')
+            open(path_to_file, 'w').close()
+            with TextTokens.from_file(path_to_file) as text_tokens:
+                self.assertEqual(0, len(text_tokens))
+
+    def test_text_tokens_from_file_carriage_returns(self):
+        """
+        Checks that carriage returns separate tokens of a mapped file as in the file read in text mode
+        """
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            path_to_file = os.path.join(path_to_dir, 'lines.txt')
+            with open(path_to_file, 'wb') as file:
+                file.write('The man\ris happy.\r\nThe dog,\r\r is\nsad'.encode('utf-8'))
+            with TextTokens.from_file(path_to_file) as text_tokens:
+                self.assertEqual(tokenize(read_from_file(path_to_file)), text_tokens.tokens)
+                self.assertEqual(['the', 'man', 'is', 'happy', 'the', 'dog', 'is', 'sad'], text_tokens.tokens)
+                self.assertEqual('man is happy. The', text_tokens.render(1, 5))
+
+    def test_text_tokens_bad_inputs(self):
+        """
+        Checks that incorrect texts are rejected
+        """
+        for bad_input in [None, 9, [None], {}]:
+            self.assertRaises(ValueError, TextTokens, bad_input)
+        self.assertRaises(ValueError, TextTokens.from_file, None)
@@ -0,0 +1,187 @@
+"""
+Lab 1
+Persistent cache of tokenized files
+"""
+
+import hashlib
+import os
+import stat
+import struct
+import tempfile
+import time
+from array import array
+from tokenizer import TOKENIZER_VERSION, tokenize_file
+from vocabulary import EncodedTokens, Vocabulary
+
+# a per-user directory: a shared one could be taken or filled with forged entries by other users
+DEFAULT_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                                 'lab_1_token_cache')
+DEFAULT_MAX_SIZE = 1 << 30
+ENTRY_SUFFIX = '.tokens'
+HEADER = struct.Struct('=4sII')
+MAGIC = b'TKN1'
+READ_SIZE = 1 << 20
+TEMP_SUFFIX = '.tokens-temp'
+# a temporary entry older than this is left by a crashed writer
+TEMP_MAX_AGE = 60 * 60
+
+
+def _check_owner(path_to_dir: str):
+    # the entries are trusted, so only a directory of the current user that others cannot write to is used
+    status = os.lstat(path_to_dir)
+    if not stat.S_ISDIR(status.st_mode):
+        raise NotADirectoryError(path_to_dir)
+    if hasattr(os, 'getuid') and (status.st_uid != os.getuid() or status.st_mode & (stat.S_IWGRP | stat.S_IWOTH)):
+        raise PermissionError(path_to_dir)
+
+
+def _remove(path: str):
+    # another process may have deleted the file already
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class TokenCache:
+    """
+    Keeps the encoded tokens of files in a directory, one entry per file content:
+    an entry is named by the sha256 hash of the content and of the tokenizer version,
+    so edited files and tokenizer changes never reuse stale tokens
+    An entry stores the vocabulary and the array of word ids, from which both the encoded
+    and the plain tokens are restored without tokenizing the file
+    When the entries exceed max_size bytes, the least recently used ones are deleted
+    A damaged entry is deleted and the file is tokenized again
+    The directory is created readable by its owner only, and a directory of another user
+    or writable by others is refused with PermissionError
+    e.g. cache = TokenCache()
+    cache.load_tokens('data.txt')  # tokenizes the file and stores the entry
+    cache.load_tokens('data.txt')  # reads the entry
+    """
+
+    def __init__(self, path_to_dir=DEFAULT_CACHE_DIR, max_size=DEFAULT_MAX_SIZE):
+        if not isinstance(path_to_dir, str) or not isinstance(max_size, int) or \
+                isinstance(max_size, bool) or max_size < 0:
+            raise ValueError
+        os.makedirs(path_to_dir, mode=0o700, exist_ok=True)
+        _check_owner(path_to_dir)
+        self.path_to_dir = path_to_dir
+        self.max_size = max_size
+
+    def get_key(self, path_to_file: str) -> str:
+        """
+        Hashes the content of a file together with the tokenizer version
+        :param path_to_file: a path to a text file
+        :return: a hexadecimal key
+        """
+        if not isinstance(path_to_file, str):
+            raise ValueError
+        content_hash = hashlib.sha256(f'tokenizer {TOKENIZER_VERSION}\n'.encode('utf-8'))
+        with open(path_to_file, 'rb') as file:
+            for block in iter(lambda: file.read(READ_SIZE), b''):
+                content_hash.update(block)
+        return content_hash.hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.path_to_dir, key + ENTRY_SUFFIX)
+
+    def __contains__(self, path_to_file) -> bool:
+        return isinstance(path_to_file, str) and os.path.exists(self._entry_path(self.get_key(path_to_file)))
+
+    def _entries(self) -> list:
+        # (last use time, size, path) of every entry
+        entries = []
+        for entry in os.scandir(self.path_to_dir):
+            if entry.name.endswith(ENTRY_SUFFIX) and entry.is_file():
+                status = entry.stat()
+                entries.append((status.st_mtime, status.st_size, entry.path))
+        return entries
+
+    @property
+    def total_size(self) -> int:
+        """
+        The size of all the entries in bytes
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def _remove_stale_temp_files(self):
+        # the temporary files of writers that crashed before renaming them into entries
+        now = time.time()
+        for entry in os.scandir(self.path_to_dir):
+            if entry.name.endswith(TEMP_SUFFIX) and entry.is_file() and \
+                    now - entry.stat().st_mtime > TEMP_MAX_AGE:
+                _remove(entry.path)
+
+    def _evict(self, kept_path: str):
+        self._remove_stale_temp_files()
+        entries = sorted(self._entries())
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            if path != kept_path:
+                _remove(path)
+                total_size -= size
+
+    def _read_entry(self, path: str) -> EncodedTokens:
+        with open(path, 'rb') as file:
+            header = file.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise ValueError
+            magic, vocabulary_size, n_tokens = HEADER.unpack(header)
+            ids = array('I')
+            if magic != MAGIC or os.fstat(file.fileno()).st_size != \
+                    HEADER.size + vocabulary_size + n_tokens * ids.itemsize:
+                raise ValueError
+            words = file.read(vocabulary_size).decode('utf-8').split('\n') if vocabulary_size else []
+            ids.fromfile(file, n_tokens)
+        if ids and max(ids) >= len(words):
+            raise ValueError
+        return EncodedTokens(ids, Vocabulary(words))
+
+    def _write_entry(self, path: str, encoded: EncodedTokens):
+        vocabulary = '\n'.join(encoded.vocabulary.words).encode('utf-8')
+        file_descriptor, temp_path = tempfile.mkstemp(suffix=TEMP_SUFFIX, dir=self.path_to_dir)
+        with os.fdopen(file_descriptor, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, len(vocabulary), len(encoded.ids)))
+            file.write(vocabulary)
+            encoded.ids.tofile(file)
+        # the entry appears at once, so a concurrent reader never sees half of it
+        os.replace(temp_path, path)
+
+    def load_encoded(self, path_to_file: str) -> EncodedTokens:
+        """
+        Returns the encoded tokens of a file from the cache,
+        the file is tokenized and stored on the first request or when its entry is damaged
+        :param path_to_file: a path to a text file
+        :return: encoded tokens
+        """
+        path = self._entry_path(self.get_key(path_to_file))
+        if os.path.exists(path):
+            try:
+                encoded = self._read_entry(path)
+            except (OSError, ValueError, EOFError):
+                _remove(path)
+            else:
+                os.utime(path)
+                return encoded
+        encoded = Vocabulary().encode(tokenize_file(path_to_file))
+        self._write_entry(path, encoded)
+        self._evict(path)
+        return encoded
+
+    def load_tokens(self, path_to_file: str) -> list:
+        """
+        Returns the tokens of a file like main.tokenize of its content, using the cache
+        :param path_to_file: a path to a text file
+        :return: a list of tokens
+        """
+        return self.load_encoded(path_to_file).decode()
+
+    def clear(self):
+        """
+        Deletes all the entries and the temporary files left by crashed writers
+        """
+        self._remove_stale_temp_files()
+        for _, _, path in self._entries():
+            _remove(path)
@@ -0,0 +1,156 @@
+# pylint: skip-file
+"""
+Checks the first lab persistent token cache
+"""
+
+import importlib
+import os
+import tempfile
+import unittest
+from unittest import mock
+from main import tokenize
+from main import read_from_file
+import token_cache
+from token_cache import TokenCache
+
+
+class TokenCacheTest(unittest.TestCase):
+    """
+    Tests TokenCache class
+    """
+
+    def _write(self, path_to_dir, name, text):
+        path_to_file = os.path.join(path_to_dir, name)
+        with open(path_to_file, 'w', encoding='utf-8') as file:
+            file.write(text)
+        return path_to_file
+
+    def test_token_cache_ideal(self):
+        """
+        Ideal cache scenario: the second request reads the stored tokens without tokenizing
+        """
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            cache = TokenCache(os.path.join(path_to_dir, 'cache'))
+            path_to_file = 'lab_1/data.txt'
+            expected = tokenize(read_from_file(path_to_file))
+            self.assertFalse(path_to_file in cache)
+            self.assertEqual(expected, cache.load_tokens(path_to_file))
+            self.assertTrue(path_to_file in cache)
+            with mock.patch.object(token_cache, 'tokenize_file', side_effect=AssertionError):
+                self.assertEqual(expected, cache.load_tokens(path_to_file))
+                encoded = cache.load_encoded(path_to_file)
+            self.assertEqual(len(expected), len(encoded.ids))
+            self.assertEqual(len(set(expected)), len(encoded.vocabulary))
+
+    def test_token_cache_keys(self):
+        """
+        Checks that keys depend on the content and the tokenizer version only
+        """
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            cache = TokenCache(os.path.join(path_to_dir, 'cache'))
+            first = self._write(path_to_dir, 'first.txt', 'The man is happy.')
+            second = self._write(path_to_dir, 'second.txt', 'The man is happy.')
+            self.assertEqual(cache.get_key(first), cache.get_key(second))
+            self.assertEqual(['the', 'man', 'is', 'happy'], cache.load_tokens(first))
+            self.assertTrue(second in cache)
+            self._write(path_to_dir, 'second.txt', 'The dog is sad.')
+            self.assertNotEqual(cache.get_key(first), cache.get_key(second))
+            self.assertEqual(['the', 'dog', 'is', 'sad'], cache.load_tokens(second))
+            key = cache.get_key(first)
+            with mock.patch.object(token_cache, 'TOKENIZER_VERSION', -1):
+                self.assertNotEqual(key, cache.get_key(first))
+                self.assertFalse(first in cache)
+
+    def test_token_cache_eviction(self):
+        """
+        Checks that the least recently used entries are deleted when the cache is too big
+        """
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            cache = TokenCache(os.path.join(path_to_dir, 'cache'))
+            paths = [self._write(path_to_dir, f'{index}.txt', f'text number {index} ' * 10) for index in range(3)]
+            for use_time, path_to_file in enumerate(paths):
+                cache.load_tokens(path_to_file)
+                entry = cache._entry_path(cache.get_key(path_to_file))
+                os.utime(entry, (use_time, use_time))
+            entry_size = cache.total_size // 3
+            cache.load_tokens(paths[0])
+            cache.max_size = entry_size * 3
+            self._write(path_to_dir, '3.txt', 'text number 3 ' * 10)
+            cache.load_tokens(os.path.join(path_to_dir, '3.txt'))
+            self.assertEqual([True, False, True], [path_to_file in cache for path_to_file in paths])
+            cache.max_size = 0
+            cache.load_tokens(paths[1])
+            self.assertEqual([False, True, False], [path_to_file in cache for path_to_file in paths])
+            cache.clear()
+            self.assertEqual(0, cache.total_size)
+
+    def test_token_cache_damaged_entries(self):
+        """
+        Checks that a damaged entry is replaced by tokenizing the file again
+        """
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            cache = TokenCache(os.path.join(path_to_dir, 'cache'))
+            path_to_file = self._write(path_to_dir, 'text.txt', 'The man is happy. The dog is sad.')
+            expected = tokenize(read_from_file(path_to_file))
+            cache.load_tokens(path_to_file)
+            entry = cache._entry_path(cache.get_key(path_to_file))
+            with open(entry, 'rb') as file:
+                data = file.read()
+            for damaged in (data[:-3], data[:5], b'', b'XXXX' + data[4:], data + b'\x00' * 4,
+                            data[:-4] + b'\xff' * 4, data.replace(b'happy', b'\xff\xfe\xfdpy')):
+                with open(entry, 'wb') as file:
+                    file.write(damaged)
+                self.assertEqual(expected, cache.load_tokens(path_to_file))
+                with open(entry, 'rb') as file:
+                    self.assertEqual(data, file.read())
+
+    def test_token_cache_temp_files(self):
+        """
+        Checks that the temporary files of crashed writers are deleted once they are old
+        """
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            cache = TokenCache(os.path.join(path_to_dir, 'cache'))
+            stale = self._write(cache.path_to_dir, 'stale' + token_cache.TEMP_SUFFIX, 'x' * 100)
+            os.utime(stale, (0, 0))
+            fresh = self._write(cache.path_to_dir, 'fresh' + token_cache.TEMP_SUFFIX, 'x' * 100)
+            cache.load_tokens(self._write(path_to_dir, 'text.txt', 'The man is happy.'))
+            self.assertFalse(os.path.exists(stale))
+            self.assertTrue(os.path.exists(fresh))
+            self.assertEqual([], [name for name in os.listdir(cache.path_to_dir)
+                                  if name.endswith(token_cache.TEMP_SUFFIX) and name != 'fresh' + token_cache.TEMP_SUFFIX])
+            os.utime(fresh, (0, 0))
+            cache.clear()
+            self.assertEqual([], os.listdir(cache.path_to_dir))
+
+    def test_token_cache_bad_inputs(self):
+        """
+        Checks that the cache rejects incorrect arguments
+        """
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            for bad_input in [None, 9, [None]]:
+                self.assertRaises(ValueError, TokenCache, bad_input)
+                self.assertRaises(ValueError, TokenCache(path_to_dir).load_tokens, bad_input)
+            for bad_input in [None, -1, 1.5, True]:
+                self.assertRaises(ValueError, TokenCache, path_to_dir, bad_input)
+            self.assertFalse(None in TokenCache(path_to_dir))
+
+    def test_token_cache_private_directory(self):
+        """
+        Checks that the cache directory is private to its user and that other directories are refused
+        """
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            cache = TokenCache(os.path.join(path_to_dir, 'cache'))
+            self.assertEqual(0o700, os.stat(cache.path_to_dir).st_mode & 0o777)
+            with mock.patch('os.getuid', return_value=os.getuid() + 1):
+                self.assertRaises(PermissionError, TokenCache, cache.path_to_dir)
+            shared = os.path.join(path_to_dir, 'shared')
+            os.mkdir(shared)
+            os.chmod(shared, 0o777)
+            self.assertRaises(PermissionError, TokenCache, shared)
+            with open(os.path.join(path_to_dir, 'file'), 'w', encoding='utf-8'):
+                pass
+            self.assertRaises(OSError, TokenCache, os.path.join(path_to_dir, 'file'))
+        with mock.patch.dict('os.environ', {'XDG_CACHE_HOME': '/cache'}):
+            self.assertEqual(os.path.join('/cache', 'lab_1_token_cache'),
+                             importlib.reload(token_cache).DEFAULT_CACHE_DIR)
+        importlib.reload(token_cache)
@@ -0,0 +1,61 @@
+# pylint: skip-file
+"""
+Checks the first lab streaming tokenizer
+"""
+
+import os
+import tempfile
+import unittest
+from main import tokenize
+from main import read_from_file
+from tokenizer import iter_token_chunks
+from tokenizer import tokenize_file
+
+
+class TokenizeFileTest(unittest.TestCase):
+    """
+    Tests tokenize_file and iter_token_chunks functions
+    """
+
+    def _write(self, path_to_dir, text):
+        path_to_file = os.path.join(path_to_dir, 'text.txt')
+        with open(path_to_file, 'w', encoding='utf-8') as file:
+            file.write(text)
+        return path_to_file
+
+    def test_tokenize_file_ideal(self):
+        """
+        Ideal streaming tokenization scenario with words cut by chunk borders
+        """
+        text = 'The weather is sunny, the man is happy.\nThe dog\tis glad!'
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            path_to_file = self._write(path_to_dir, text)
+            for chunk_size in [1, 2, 3, 5, 8, 1000]:
+                self.assertEqual(tokenize(text), list(tokenize_file(path_to_file, chunk_size)))
+
+    def test_tokenize_file_chunks(self):
+        """
+        Checks that chunks are not empty and have no more characters than the chunk size allows
+        """
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            path_to_file = self._write(path_to_dir, 'one two three four five six')
+            chunks = list(iter_token_chunks(path_to_file, 8))
+            self.assertTrue(all(chunks))
+            self.assertEqual(['one', 'two', 'three', 'four', 'five', 'six'], sum(chunks, []))
+            self.assertEqual([], list(tokenize_file(self._write(path_to_dir, ''))))
+
+    def test_tokenize_file_bad_inputs(self):
+        """
+        Checks that the streaming tokenizer handles incorrect inputs
+        """
+        for bad_input in [None, 9.5, [], 0, -1, True]:
+            self.assertRaises(ValueError, tokenize_file, 'lab_1/data.txt', bad_input)
+        self.assertRaises(ValueError, tokenize_file, None)
+
+    def test_big_text_tokenize_file(self):
+        """
+        Checks that streaming tokenization gives the same tokens as tokenize on a big text
+        """
+        expected = tokenize(read_from_file('lab_1/data.txt'))
+        self.assertEqual(expected, list(tokenize_file('lab_1/data.txt')))
+        self.assertEqual(expected, list(tokenize_file('lab_1/data.txt', 1000)))
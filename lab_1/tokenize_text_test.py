@@ -0,0 +1,66 @@
+# pylint: skip-file
+"""
+Checks the first lab tokenizer backends
+"""
+
+import re
+import unittest
+from main import read_from_file
+from tokenizer import tokenize_text
+from tokenizer import BACKENDS
+
+
+def reference_tokenize(text: str) -> list:
+    return re.sub('[^a-z \n]', '', text.lower()).split()
+
+
+class TokenizeTextTest(unittest.TestCase):
+    """
+    Tests tokenize_text function and its backends
+    """
+
+    texts = ['The weather is sunny, the man is happy.',
+             'word',
+             'The first\tsentence.\nThe second\r\nsentence!',
+             'Straße İstanbul KELVIN K Ünïcödé 123 e-mail',
+             'lone surrogate \ud800inside',
+             '']
+
+    def test_tokenize_text_backends_identical(self):
+        """
+        Checks that every backend gives the same tokens as the reference tokenizer
+        """
+        for text in self.texts:
+            expected = reference_tokenize(text)
+            self.assertEqual(expected, tokenize_text(text))
+            for backend in BACKENDS:
+                self.assertEqual(expected, tokenize_text(text, backend))
+
+    def test_tokenize_text_bytes_input(self):
+        """
+        Checks that bytes are tokenized like the decoded text
+        """
+        for text in self.texts[:4]:
+            expected = reference_tokenize(text)
+            data = text.encode('utf-8')
+            self.assertEqual(expected, tokenize_text(data))
+            for backend in BACKENDS:
+                self.assertEqual(expected, tokenize_text(data, backend))
+
+    def test_tokenize_text_bad_inputs(self):
+        """
+        Checks that the tokenizer handles incorrect inputs
+        """
+        for bad_input in [None, 9, [], {}, ()]:
+            self.assertEqual([], tokenize_text(bad_input))
+        self.assertRaises(ValueError, tokenize_text, 'text', 'unknown')
+
+    def test_big_text_tokenize_text(self):
+        """
+        Checks that every backend gives the same tokens as the reference tokenizer on a big text
+        """
+        text = read_from_file('lab_1/data.txt')
+        expected = reference_tokenize(text)
+        for backend in BACKENDS:
+            self.assertEqual(expected, tokenize_text(text, backend))
+        self.assertEqual(expected, tokenize_text(text.encode('utf-8')))
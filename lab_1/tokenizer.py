@@ -0,0 +1,163 @@
+"""
+Lab 1
+Tokenizer backends and streaming tokenization of big files
+"""
+
+import re
+from array import array
+from itertools import chain
+
+# bump it whenever the tokens of a text change, it invalidates cached tokens
+TOKENIZER_VERSION = 1
+CHUNK_SIZE = 1 << 16
+SHORT_TEXT_LENGTH = 16
+KEPT_CHARACTERS = 'abcdefghijklmnopqrstuvwxyz \n'
+NON_LETTERS = re.compile('[^a-z \n]')
+DELETED_BYTES = bytes(byte for byte in range(256) if chr(byte) not in KEPT_CHARACTERS)
+# a token spans from its first to its last letter inside a run of characters between spaces and line breaks,
+# '\r' is a line break as in a file read in text mode,
+# besides latin letters only 'İ' and the kelvin sign lowercase into latin letters
+TOKEN_SPAN = re.compile('[a-zA-Z\u0130\u212a](?:[^ \n\r]*[a-zA-Z\u0130\u212a])?')
+TOKEN_BYTES_SPAN = re.compile(b'(?:[a-zA-Z]|\xc4\xb0|\xe2\x84\xaa)(?:[^ \n\r]*(?:[a-zA-Z]|\xc4\xb0|\xe2\x84\xaa))?')
+
+
+class _DeletionTable(dict):
+    """
+    A str.translate table keeping lowercase latin letters, spaces and newlines:
+    any other character is deleted and cached on the first lookup
+    """
+
+    def __missing__(self, code):
+        self[code] = None
+
+
+DELETION_TABLE = _DeletionTable({ord(character): ord(character) for character in KEPT_CHARACTERS})
+
+
+def tokenize_regex(text: str) -> list:
+    """
+    Tokenizes a text with a precompiled regular expression
+    """
+    return NON_LETTERS.sub('', text.lower()).split()
+
+
+def tokenize_translate(text: str) -> list:
+    """
+    Tokenizes a text deleting characters with str.translate
+    """
+    return text.lower().translate(DELETION_TABLE).split()
+
+
+def tokenize_bytes(text) -> list:
+    """
+    Tokenizes a text at the bytes level: every non-ascii character becomes bytes above 127 in utf-8,
+    so deleting all bytes except latin letters, spaces and newlines gives the same tokens
+    Non-ascii bytes are decoded first, as they need unicode lowercasing
+    :param text: a string or utf-8 encoded bytes
+    """
+    if isinstance(text, str):
+        data = text.lower().encode('utf-8', 'surrogatepass')
+    elif text.isascii():
+        data = text.lower()
+    else:
+        data = text.decode('utf-8').lower().encode('utf-8', 'surrogatepass')
+    return data.translate(None, DELETED_BYTES).decode('ascii').split()
+
+
+BACKENDS = {
+    'regex': tokenize_regex,
+    'translate': tokenize_translate,
+    'bytes': tokenize_bytes,
+}
+
+
+def tokenize_text(text, backend='auto') -> list:
+    """
+    Splits a text into lowercased tokens without punctuation, exactly like main.tokenize
+    The automatic backend is the bytes one, except for short strings where the regex one is faster
+    :param text: a string or utf-8 encoded bytes
+    :param backend: 'auto', 'regex', 'translate' or 'bytes'
+    :return: a list of tokens
+    e.g. text = 'The weather is sunny, the man is happy.'
+    --> ['the', 'weather', 'is', 'sunny', 'the', 'man', 'is', 'happy']
+    """
+    if not isinstance(text, (str, bytes)):
+        return []
+    if backend == 'auto':
+        backend = 'regex' if isinstance(text, str) and len(text) < SHORT_TEXT_LENGTH else 'bytes'
+    if backend not in BACKENDS:
+        raise ValueError
+    if isinstance(text, bytes) and backend != 'bytes':
+        text = text.decode('utf-8')
+    return BACKENDS[backend](text)
+
+
+def tokenize_with_offsets(text) -> tuple:
+    """
+    Tokenizes a text like main.tokenize and keeps where every token is in the text,
+    so the original words with their case and punctuation can be sliced from it
+    Offsets are in characters for strings and in bytes for utf-8 encoded buffers, e.g. a mmap
+    Carriage returns separate tokens as newlines do, so the tokens of a raw file are the ones
+    of main.tokenize of the file read in text mode, which translates them into newlines
+    :param text: a string or a utf-8 encoded bytes-like object
+    :return: a list of tokens, an array of token starts and an array of token ends
+    e.g. text = 'The man is "happy".'
+    --> ['the', 'man', 'is', 'happy'], array('I', [0, 4, 8, 12]), array('I', [3, 7, 10, 17])
+    """
+    if isinstance(text, str):
+        pattern, separator = TOKEN_SPAN, ' '
+    else:
+        pattern, separator = TOKEN_BYTES_SPAN, b' '
+    matches = list(pattern.finditer(text))
+    # every span holds exactly one token, so the spans are tokenized at once
+    tokens = tokenize_text(separator.join([match.group() for match in matches]))
+    return tokens, array('I', [match.start() for match in matches]), array('I', [match.end() for match in matches])
+
+
+def iter_token_chunks(path_to_file: str, chunk_size=CHUNK_SIZE):
+    """
+    Reads a file by chunks of a fixed size and tokenizes every chunk like main.tokenize
+    A word cut by the end of a chunk is carried over to the next one,
+    so the peak memory depends on the chunk size only
+    :param path_to_file: a path to a text file
+    :param chunk_size: a number of characters read at once
+    :return: a generator of token lists
+    """
+    if not isinstance(path_to_file, str) or not isinstance(chunk_size, int) or \
+            isinstance(chunk_size, bool) or chunk_size < 1:
+        raise ValueError
+    return _read_token_chunks(path_to_file, chunk_size)
+
+
+def _read_token_chunks(path_to_file: str, chunk_size: int):
+    carry = ''
+    with open(path_to_file, 'r', encoding='utf-8') as file_to_read:
+        while True:
+            chunk = file_to_read.read(chunk_size)
+            if not chunk:
+                break
+            text = carry + chunk
+            # main.tokenize splits words by spaces and newlines only
+            cut = max(text.rfind(' '), text.rfind('\n'))
+            if cut == -1:
+                carry = text
+                continue
+            carry = text[cut:]
+            tokens = tokenize_text(text[:cut])
+            if tokens:
+                yield tokens
+    tokens = tokenize_text(carry)
+    if tokens:
+        yield tokens
+
+
+def tokenize_file(path_to_file: str, chunk_size=CHUNK_SIZE):
+    """
+    Streams the tokens of a file, giving the same tokens as main.tokenize of the whole file
+    :param path_to_file: a path to a text file
+    :param chunk_size: a number of characters read at once
+    :return: an iterator of tokens
+    e.g. a file with 'The weather is sunny, the man is happy.'
+    --> 'the', 'weather', 'is', 'sunny', 'the', 'man', 'is', 'happy'
+    """
+    return chain.from_iterable(iter_token_chunks(path_to_file, chunk_size))
@@ -0,0 +1,137 @@
+"""
+Lab 1
+Integer-interned token representation
+"""
+
+from array import array
+from collections.abc import Sequence
+
+
+class Vocabulary:
+    """
+    Interns words: every distinct word is stored once and gets an integer id
+    e.g. vocabulary = Vocabulary()
+    vocabulary.encode(['the', 'man', 'is', 'the', 'dog']).ids
+    --> array('I', [0, 1, 2, 0, 3])
+    """
+
+    def __init__(self, tokens=()):
+        self.ids = {}
+        self.words = []
+        self.update(tokens)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word) -> bool:
+        return word in self.ids
+
+    def intern(self, word: str) -> int:
+        """
+        Returns the id of a word, adding the word if it is new
+        """
+        if not isinstance(word, str):
+            raise ValueError
+        if word not in self.ids:
+            self.ids[word] = len(self.words)
+            self.words.append(word)
+        return self.ids[word]
+
+    def update(self, tokens):
+        """
+        Adds the words of tokens
+        :param tokens: an iterable of tokens
+        :return: the vocabulary itself
+        """
+        if isinstance(tokens, (str, bytes, dict)) or not hasattr(tokens, '__iter__'):
+            raise ValueError
+        for token in tokens:
+            self.intern(token)
+        return self
+
+    def get_id(self, word: str) -> int:
+        """
+        Returns the id of a known word
+        """
+        if not isinstance(word, str):
+            raise ValueError
+        if word not in self.ids:
+            raise KeyError
+        return self.ids[word]
+
+    def get_word(self, word_id: int) -> str:
+        """
+        Returns the word of an id
+        """
+        if not isinstance(word_id, int) or isinstance(word_id, bool):
+            raise ValueError
+        if not 0 <= word_id < len(self.words):
+            raise KeyError
+        return self.words[word_id]
+
+    def encode(self, tokens):
+        """
+        Converts tokens into an array of ids, interning new words
+        :param tokens: an iterable of tokens
+        :return: encoded tokens
+        """
+        if isinstance(tokens, (str, bytes, dict)) or not hasattr(tokens, '__iter__'):
+            raise ValueError
+        return EncodedTokens(array('I', map(self.intern, tokens)), self)
+
+    def decode(self, ids) -> list:
+        """
+        Converts ids back into words
+        :param ids: an iterable of ids
+        :return: a list of words
+        """
+        return list(map(self.words.__getitem__, ids))
+
+
+class EncodedTokens(Sequence):
+    """
+    A text stored as an array('I') of word ids (4 bytes per token) with its vocabulary
+    It behaves as a sequence of words: indexing and slicing decode the ids
+    """
+
+    def __init__(self, ids: array, vocabulary: Vocabulary):
+        if not isinstance(ids, array) or not isinstance(vocabulary, Vocabulary):
+            raise ValueError
+        self.ids = ids
+        self.vocabulary = vocabulary
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.vocabulary.decode(self.ids[item])
+        return self.vocabulary.words[self.ids[item]]
+
+    def __iter__(self):
+        return map(self.vocabulary.words.__getitem__, self.ids)
+
+    def positions(self, word: str) -> list:
+        """
+        Finds all the positions of a word by searching its id in the array
+        :param word: a word
+        :return: a list of positions
+        """
+        if word not in self.vocabulary:
+            return []
+        word_id = self.vocabulary.ids[word]
+        ids = self.ids
+        positions = []
+        position = -1
+        while True:
+            try:
+                position = ids.index(word_id, position + 1)
+            except ValueError:
+                return positions
+            positions.append(position)
+
+    def decode(self) -> list:
+        """
+        Converts the ids back into a list of words
+        """
+        return self.vocabulary.decode(self.ids)
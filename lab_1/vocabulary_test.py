@@ -0,0 +1,83 @@
+# pylint: skip-file
+"""
+Checks the first lab integer-interned token representation
+"""
+
+import unittest
+from main import tokenize
+from main import read_from_file
+from main import remove_stop_words
+from main import calculate_frequencies
+from main import get_concordance
+from main import get_adjacent_words
+from main import sort_concordance
+from vocabulary import Vocabulary
+from vocabulary import EncodedTokens
+
+
+class VocabularyTest(unittest.TestCase):
+    """
+    Tests Vocabulary and EncodedTokens classes with main functions
+    """
+
+    tokens = ['the', 'weather', 'is', 'sunny', 'the', 'man', 'is', 'happy',
+              'the', 'dog', 'is', 'happy', 'but', 'the', 'cat', 'is', 'sad']
+
+    def test_vocabulary_ideal(self):
+        """
+        Ideal vocabulary scenario
+        """
+        vocabulary = Vocabulary()
+        encoded = vocabulary.encode(self.tokens)
+        self.assertEqual(4, encoded.ids.itemsize)
+        self.assertEqual([0, 1, 2, 3, 0], list(encoded.ids[:5]))
+        self.assertEqual(self.tokens, encoded.decode())
+        self.assertEqual(self.tokens[3:7], encoded[3:7])
+        self.assertEqual('man', encoded[5])
+        self.assertEqual(self.tokens, list(encoded))
+        self.assertEqual(4, vocabulary.get_id('man'))
+        self.assertEqual('man', vocabulary.get_word(4))
+        self.assertEqual([7, 11], encoded.positions('happy'))
+        self.assertEqual([], encoded.positions('unknown'))
+
+    def test_vocabulary_bad_inputs(self):
+        """
+        Checks that the vocabulary handles incorrect inputs
+        """
+        vocabulary = Vocabulary(self.tokens)
+        self.assertRaises(KeyError, vocabulary.get_id, 'unknown')
+        self.assertRaises(KeyError, vocabulary.get_word, 100)
+        self.assertRaises(ValueError, vocabulary.get_id, None)
+        self.assertRaises(ValueError, vocabulary.get_word, '1')
+        for bad_input in ['string', {}, None, 9, [None]]:
+            self.assertRaises(ValueError, vocabulary.encode, bad_input)
+        self.assertRaises(ValueError, EncodedTokens, [1, 2], vocabulary)
+
+    def test_main_functions_encoded_tokens(self):
+        """
+        Checks that main functions accept encoded tokens and decode words only in the output
+        """
+        encoded = Vocabulary().encode(self.tokens)
+        clean = remove_stop_words(encoded, ['the', 'is', 'unknown'])
+        self.assertTrue(isinstance(clean, EncodedTokens))
+        self.assertEqual(remove_stop_words(self.tokens, ['the', 'is']), clean.decode())
+        self.assertEqual(calculate_frequencies(self.tokens), calculate_frequencies(encoded))
+        self.assertEqual(get_concordance(self.tokens, 'happy', 2, 3), get_concordance(encoded, 'happy', 2, 3))
+        self.assertEqual(get_adjacent_words(self.tokens, 'happy', 2, 3), get_adjacent_words(encoded, 'happy', 2, 3))
+        self.assertEqual(sort_concordance(self.tokens, 'happy', 2, 3, False),
+                         sort_concordance(encoded, 'happy', 2, 3, False))
+
+    def test_big_text_encoded_tokens(self):
+        """
+        Checks main functions on an encoded big text
+        """
+        tokens = tokenize(read_from_file('lab_1/data.txt'))
+        stop_words = read_from_file('lab_1/stop_words.txt').split('\n')
+        encoded = Vocabulary().encode(tokens)
+        clean_tokens = remove_stop_words(tokens, stop_words)
+        clean_encoded = remove_stop_words(encoded, stop_words)
+        self.assertEqual(clean_tokens, clean_encoded.decode())
+        self.assertEqual(calculate_frequencies(clean_tokens), calculate_frequencies(clean_encoded))
+        for word in ['tex', 'sodium', 'world']:
+            self.assertEqual(get_concordance(clean_tokens, word, 2, 2), get_concordance(clean_encoded, word, 2, 2))
+        self.assertEqual(sort_concordance(tokens, 'sodium', 1, 1, True), sort_concordance(encoded, 'sodium', 1, 1, True))
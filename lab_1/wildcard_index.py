@@ -0,0 +1,141 @@
+"""
+Lab 1
+Prefix and wildcard concordances over a sorted vocabulary
+"""
+
+import re
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from fnmatch import translate
+from heapq import merge
+from concordance_index import ConcordanceIndex
+from disk_index import DiskVocabulary
+
+WILDCARDS = '*?['
+
+
+class SortedVocabulary:
+    """
+    Words in lexicographic order, the id of a word is its index
+    e.g. vocabulary = SortedVocabulary(['the', 'happy', 'man', 'happen'])
+    vocabulary.lower_bound('happ')
+    --> 0
+    """
+
+    def __init__(self, words):
+        if isinstance(words, (str, bytes)) or not hasattr(words, '__iter__'):
+            raise ValueError
+        self.words = sorted(set(words))
+        if not all(isinstance(word, str) for word in self.words):
+            raise ValueError
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def get_word(self, word_id: int) -> str:
+        """
+        Returns the word of an id
+        """
+        return self.words[word_id]
+
+    def lower_bound(self, word: str) -> int:
+        """
+        Returns the id of the first word that is not less than the given one
+        """
+        return bisect_left(self.words, word)
+
+
+def _prefix_end(prefix: str) -> str:
+    # the smallest string greater than all the strings starting with the prefix
+    while prefix and ord(prefix[-1]) == 0x10ffff:
+        prefix = prefix[:-1]
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1) if prefix else ''
+
+
+class WildcardPostings(Mapping):
+    """
+    Maps wildcard patterns to the merged positions of all the matching words
+    A pattern is a word with shell-style wildcards: * matches any characters and ? – one character
+    The words starting with the literal prefix of a pattern are found by binary search
+    in the sorted vocabulary, only they are checked against the rest of the pattern
+    e.g. postings = WildcardPostings({'happen': array('I', [4]), 'happy': array('I', [1, 7])},
+                                     SortedVocabulary(['happen', 'happy']))
+    postings['happ*']
+    --> array('I', [1, 4, 7])
+    """
+
+    def __init__(self, postings: Mapping, vocabulary):
+        self._postings = postings
+        self._vocabulary = vocabulary
+
+    def match_ids(self, pattern: str) -> list:
+        """
+        Resolves a pattern to the ids of its words in the sorted vocabulary
+        :param pattern: a word with wildcards
+        :return: a list of ids in ascending order
+        """
+        if not isinstance(pattern, str) or not pattern:
+            return []
+        vocabulary = self._vocabulary
+        literal_end = min((pattern.find(wildcard) for wildcard in WILDCARDS if wildcard in pattern),
+                          default=len(pattern))
+        prefix = pattern[:literal_end]
+        first = vocabulary.lower_bound(prefix)
+        prefix_end = _prefix_end(prefix)
+        last = vocabulary.lower_bound(prefix_end) if prefix_end else len(vocabulary)
+        if literal_end == len(pattern):
+            return [first] if first < last and vocabulary.get_word(first) == pattern else []
+        if pattern[literal_end:] == '*':
+            return list(range(first, last))
+        is_match = re.compile(translate(pattern)).match
+        return [word_id for word_id in range(first, last) if is_match(vocabulary.get_word(word_id))]
+
+    def match(self, pattern: str) -> list:
+        """
+        Resolves a pattern to its words
+        :param pattern: a word with wildcards
+        :return: a list of words in lexicographic order
+        """
+        return [self._vocabulary.get_word(word_id) for word_id in self.match_ids(pattern)]
+
+    def __getitem__(self, pattern):
+        posting_lists = [self._postings[word] for word in self.match(pattern)]
+        if not posting_lists:
+            raise KeyError(pattern)
+        if len(posting_lists) == 1:
+            return posting_lists[0]
+        return array('I', merge(*posting_lists))
+
+    def __iter__(self):
+        return (self._vocabulary.get_word(word_id) for word_id in range(len(self._vocabulary)))
+
+    def __len__(self) -> int:
+        return len(self._vocabulary)
+
+
+class WildcardIndex(ConcordanceIndex):
+    """
+    A concordance index over the tokens and postings of another index, where every query
+    is a wildcard pattern: the concordance of all the matching words comes in the text order
+    The vocabulary of a disk index is sorted already, other indexes get a sorted copy of their words
+    e.g. index = WildcardIndex(ConcordanceIndex(['the', 'man', 'is', 'happy', 'it', 'happened']))
+    index.get_concordance('happ*', 1, 0)
+    --> [['is', 'happy'], ['it', 'happened']]
+    """
+
+    def __init__(self, index: ConcordanceIndex):
+        if not isinstance(index, ConcordanceIndex):
+            raise ValueError
+        vocabulary = getattr(index, 'vocabulary', None)
+        if not isinstance(vocabulary, DiskVocabulary):
+            vocabulary = SortedVocabulary(index.positions)
+        super().__init__(index.tokens, WildcardPostings(index.positions, vocabulary))
+
+    def match(self, pattern: str) -> list:
+        """
+        Resolves a pattern to its words
+        :param pattern: a word with wildcards
+        :return: a list of words in lexicographic order
+        """
+        return self.positions.match(pattern)
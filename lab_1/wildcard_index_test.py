@@ -0,0 +1,89 @@
+# pylint: skip-file
+"""
+Checks the first lab wildcard concordances
+"""
+
+import tempfile
+import unittest
+from main import get_concordance
+from main import tokenize
+from main import read_from_file
+from concordance_index import ConcordanceIndex
+from disk_index import DiskConcordanceIndex
+from disk_index import build_disk_index
+from wildcard_index import SortedVocabulary
+from wildcard_index import WildcardIndex
+
+
+class WildcardIndexTest(unittest.TestCase):
+    """
+    Tests SortedVocabulary and WildcardIndex classes
+    """
+
+    tokens = ['the', 'man', 'is', 'happy', 'it', 'happened', 'the', 'dog', 'is', 'happy',
+              'but', 'unhappy', 'the', 'cat', 'is', 'sad', 'happiness']
+
+    def test_wildcard_concordance_ideal(self):
+        """
+        Ideal wildcard concordance scenario: lines of all the words in the text order
+        """
+        index = WildcardIndex(ConcordanceIndex(self.tokens))
+        self.assertEqual(['happened', 'happiness', 'happy'], index.match('happ*'))
+        self.assertEqual([3, 5, 9, 16], list(index.get_positions('happ*')))
+        expected = [['is', 'happy'], ['it', 'happened'], ['is', 'happy'], ['sad', 'happiness']]
+        self.assertEqual(expected, index.get_concordance('happ*', 1, 0))
+        self.assertEqual([['is'], ['it'], ['is'], ['sad']], index.get_adjacent_words('happ*', 1, 0))
+
+    def test_wildcard_patterns(self):
+        """
+        Checks literal words, inner and single character wildcards
+        """
+        index = WildcardIndex(ConcordanceIndex(self.tokens))
+        self.assertEqual(['happy'], index.match('happy'))
+        self.assertEqual([], index.match('happ'))
+        self.assertEqual(['happy', 'unhappy'], index.match('*happy'))
+        self.assertEqual(['happened', 'happiness'], index.match('happ*e*'))
+        self.assertEqual(['but', 'cat', 'dog', 'man', 'sad', 'the'], index.match('???'))
+        self.assertEqual(['is', 'it'], index.match('i?'))
+        self.assertEqual(sorted(set(self.tokens)), index.match('*'))
+        self.assertEqual(list(range(len(self.tokens))), list(index.get_positions('*')))
+        self.assertEqual(get_concordance(self.tokens, 'happy', 2, 2), index.get_concordance('happy', 2, 2))
+
+    def test_sorted_vocabulary(self):
+        """
+        Checks binary search in the sorted vocabulary
+        """
+        vocabulary = SortedVocabulary(['the', 'happy', 'man', 'happen', 'the'])
+        self.assertEqual(4, len(vocabulary))
+        self.assertEqual(0, vocabulary.lower_bound('happ'))
+        self.assertEqual(2, vocabulary.lower_bound('hb'))
+        self.assertEqual('man', vocabulary.get_word(2))
+
+    def test_wildcard_disk_index(self):
+        """
+        Checks that the sorted vocabulary of a disk index is searched directly
+        """
+        tokens = tokenize(read_from_file('lab_1/data.txt'))
+        index = ConcordanceIndex(tokens)
+        words = sorted(word for word in index.positions if word.startswith('happ'))
+        expected = sorted((position for word in words for position in index.get_positions(word)))
+        with tempfile.TemporaryDirectory() as path_to_dir:
+            build_disk_index(tokens, path_to_dir)
+            with DiskConcordanceIndex(path_to_dir) as disk_index:
+                wildcard_index = WildcardIndex(disk_index)
+                self.assertTrue(wildcard_index.positions._vocabulary is disk_index.vocabulary)
+                self.assertEqual(words, wildcard_index.match('happ*'))
+                self.assertEqual(expected, list(wildcard_index.get_positions('happ*')))
+                self.assertEqual([tokens[position - 2:position + 3] for position in expected],
+                                 wildcard_index.get_concordance('happ*', 2, 2))
+
+    def test_wildcard_bad_inputs(self):
+        """
+        Checks that the wildcard index handles incorrect inputs
+        """
+        for bad_input in ['string', {}, None, 9, [None]]:
+            self.assertRaises(ValueError, WildcardIndex, bad_input)
+        index = WildcardIndex(ConcordanceIndex(self.tokens))
+        for bad_input in [(), {}, '', None, 8.94, [None], -1, 'zz*', 'a?']:
+            self.assertEqual([], index.get_concordance(bad_input, 2, 3))
+            self.assertEqual([], index.match(bad_input))
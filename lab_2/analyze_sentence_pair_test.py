@@ -0,0 +1,78 @@
+"""
+Tests analyze_sentence_pair function
+"""
+
+import os
+import random
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+from lab_2.main import analyze_sentence_pair, accumulate_diff_stats, calculate_plagiarism_score, \
+    fill_lcs_matrix, find_diff_in_sentence, find_lcs, find_lcs_length
+
+
+class AnalyzeSentencePairTest(unittest.TestCase):
+    """
+    Checks for analyze_sentence_pair function
+    """
+
+    def test_analyze_sentence_pair_ideal(self):
+        """
+        Tests that analyze_sentence_pair function
+            can handle simple ideal input
+        """
+        expected = (3, ('his', 'name', 'is'), ((3, 4), (3, 4)), 0.75)
+        actual = analyze_sentence_pair(('his', 'name', 'is', 'bruno'), ('his', 'name', 'is', 'paw'))
+        self.assertEqual(expected, actual)
+
+    def test_analyze_sentence_pair_same_as_functions(self):
+        """
+        Tests that analyze_sentence_pair function
+            gives the results of the separate functions for short and long sentences
+        """
+        generator = random.Random(6)
+        for length in (8, 8, 8, 100):
+            for _ in range(50):
+                original = tuple(generator.choice('abcde') for _ in range(generator.randint(0, length)))
+                suspicious = tuple(generator.choice('abcde') for _ in range(generator.randint(1, length)))
+                lcs_length = find_lcs_length(original, suspicious, 0.3)
+                lcs = find_lcs(original, suspicious, fill_lcs_matrix(original, suspicious))
+                expected = (lcs_length, lcs, find_diff_in_sentence(original, suspicious, lcs),
+                            calculate_plagiarism_score(lcs_length, suspicious))
+                actual = analyze_sentence_pair(original, suspicious, 0.3)
+                self.assertEqual(expected, actual)
+                self.assertIsInstance(actual[0], int)
+
+    @patch('lab_2.main.fill_lcs_matrix', side_effect=fill_lcs_matrix)
+    def test_accumulate_diff_stats_one_matrix_per_pair(self, mock):
+        """
+        Tests that accumulate_diff_stats function
+            fills one matrix for every aligned pair of sentences only
+        """
+        original_text = (('i', 'have', 'a', 'cat'), ('his', 'name', 'is', 'bruno'), ('he', 'is', 'happy'))
+        suspicious_text = (('i', 'have', 'a', 'cat'), ('his', 'name', 'is', 'paw'))
+        actual = accumulate_diff_stats(original_text, suspicious_text)
+        self.assertEqual(2, mock.call_count)
+        self.assertEqual([4, 3], actual['sentence_lcs_length'])
+        self.assertEqual(0.875, actual['text_plagiarism'])
+
+    def test_analyze_sentence_pair_incorrect_inputs(self):
+        """
+        Tests that analyze_sentence_pair function
+            gives zero scores for incorrect inputs
+        """
+        self.assertEqual((-1, (), (), 0.0), analyze_sentence_pair(('his', None), ('his', 'name')))
+        self.assertEqual((0, (), ((), (0, 2)), 0.0), analyze_sentence_pair((), ('his', 'name')))
+
+    def test_main_imports_without_numpy(self):
+        """
+        Tests that lab_2.main
+            loads NumPy only when a long pair is compared
+        """
+        code = ('import sys, lab_2.main; assert "numpy" not in sys.modules; '
+                'lab_2.main.analyze_sentence_pair(tuple(range(100)), tuple(range(100))); '
+                'assert "numpy" in sys.modules')
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        environment = dict(os.environ, PYTHONPATH=root)
+        self.assertEqual(0, subprocess.run([sys.executable, '-c', code], env=environment, check=False).returncode)
@@ -0,0 +1,71 @@
+"""
+Performance benchmarks for the longest common subsequence functions
+Run: python -m lab_2.benchmark [benchmark name]
+"""
+
+import argparse
+import random
+import timeit
+import tracemalloc
+from lab_2.bit_parallel_lcs import bit_parallel_lcs_length
+
+# the budgets of bit_parallel_lcs_length for 30000 x 30000 tokens
+MAX_SECONDS = 10
+MAX_PEAK_MEGABYTES = 4
+
+
+def measure(function, *args) -> float:
+    """
+    Runs the function once and returns the elapsed time in seconds
+    """
+    start_time = timeit.default_timer()
+    function(*args)
+    return timeit.default_timer() - start_time
+
+
+def measure_peak_memory(function, *args) -> float:
+    """
+    Runs the function once and returns the peak of traced allocations in megabytes
+    """
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2 ** 20
+
+
+def get_random_sentences(length: int, vocabulary_size=2000, seed=2) -> tuple:
+    """
+    Generates two random sequences of token ids of the same length
+    """
+    generator = random.Random(seed)
+    return tuple(tuple(generator.randrange(vocabulary_size) for _ in range(length)) for _ in range(2))
+
+
+def benchmark_bit_parallel(length: int):
+    """
+    Measures the time and the peak memory of bit_parallel_lcs_length on random sentences
+    """
+    first_sentence, second_sentence = get_random_sentences(length)
+    elapsed = measure(bit_parallel_lcs_length, first_sentence, second_sentence)
+    print(f'bit_parallel_lcs_length {length} x {length}: {elapsed:.4f} s (budget {MAX_SECONDS} s)')
+    # the masks go along the longer sequence, so a shorter second one keeps tracemalloc quick
+    peak = measure_peak_memory(bit_parallel_lcs_length, first_sentence, second_sentence[:length // 10])
+    print(f'bit_parallel_lcs_length {length} x {length // 10} peak: {peak:.2f} MB '
+          f'(budget {MAX_PEAK_MEGABYTES} MB)')
+
+
+BENCHMARKS = {
+    'bit_parallel': benchmark_bit_parallel,
+}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Runs lab_2 performance benchmarks on random sentences')
+    parser.add_argument('names', nargs='*', default=list(BENCHMARKS), help='benchmarks to run')
+    parser.add_argument('--length', type=int, default=30000, help='the number of tokens of a sentence')
+    options = parser.parse_args()
+
+    for benchmark_name in options.names:
+        print(f'--- {benchmark_name} ---')
+        BENCHMARKS[benchmark_name](options.length)
@@ -0,0 +1,59 @@
+"""
+Bit-parallel longest common subsequence length
+"""
+
+
+# the column is split into blocks of bits, so a mask never has more bits than a block
+BLOCK_SIZE = 1 << 12
+
+
+def get_match_masks(tokens, alphabet=None) -> dict:
+    """
+    Builds a bit mask of the positions of every distinct token
+    :param tokens: a sequence of tokens
+    :param alphabet: a set of tokens to build the masks of, all the tokens by default
+    :return: a dictionary token: mask, where bit i is set when tokens[i] is the token
+    e.g. tokens = ('the', 'cat', 'the')
+    --> {'the': 0b101, 'cat': 0b10}
+    """
+    masks = {}
+    for index, token in enumerate(tokens):
+        if alphabet is None or token in alphabet:
+            masks[token] = masks.get(token, 0) | 1 << index
+    return masks
+
+
+def bit_parallel_lcs_length(first_sentence_tokens, second_sentence_tokens) -> int:
+    """
+    Finds a length of the longest common subsequence with the bit-vector algorithm of Hyyrö:
+    a column of the lcs matrix is kept as the bits of Python integers,
+    so every token of the second sequence takes a few big integer operations instead of a loop over the first
+    The bits go along the longer sequence, so the loop runs over the shorter one
+    The column is processed by blocks of BLOCK_SIZE bits, from the lowest one, passing the carries
+    of the additions of every step to the next block, so the masks of only one block are kept at a time
+    and only for the tokens of the shorter sequence
+    :param first_sentence_tokens: a sequence of tokens
+    :param second_sentence_tokens: a sequence of tokens
+    :return: a length of the longest common subsequence
+    e.g. first_sentence_tokens = ('the', 'dog', 'is', 'running')
+    second_sentence_tokens = ('the', 'cat', 'is', 'sleeping')
+    --> 2
+    """
+    if len(first_sentence_tokens) < len(second_sentence_tokens):
+        first_sentence_tokens, second_sentence_tokens = second_sentence_tokens, first_sentence_tokens
+    alphabet = set(second_sentence_tokens)
+    carries = bytearray(len(second_sentence_tokens))
+    lcs_length = 0
+    for block_start in range(0, len(first_sentence_tokens), BLOCK_SIZE):
+        block = first_sentence_tokens[block_start:block_start + BLOCK_SIZE]
+        masks = get_match_masks(block, alphabet)
+        all_bits = (1 << len(block)) - 1
+        # a set bit of the column is a row where the lcs length does not grow
+        column = all_bits
+        for step, token in enumerate(second_sentence_tokens):
+            matches = column & masks.get(token, 0)
+            total = column + matches + carries[step]
+            carries[step] = total >> len(block)
+            column = (total | (column - matches)) & all_bits
+        lcs_length += len(block) - bin(column).count('1')
+    return lcs_length
@@ -0,0 +1,89 @@
+"""
+Tests bit_parallel_lcs_length function
+"""
+
+import random
+import unittest
+from lab_2.bit_parallel_lcs import bit_parallel_lcs_length, get_match_masks
+from lab_2.main import find_lcs_length_optimized
+
+
+def reference_lcs_length(first_sentence_tokens: tuple, second_sentence_tokens: tuple) -> int:
+    """
+    Finds the lcs length with a plain row by row dynamic programming
+    """
+    previous_row = [0] * (len(second_sentence_tokens) + 1)
+    for token_1 in first_sentence_tokens:
+        current_row = [0]
+        for column, token_2 in enumerate(second_sentence_tokens):
+            if token_1 == token_2:
+                current_row.append(previous_row[column] + 1)
+            else:
+                current_row.append(max(current_row[column], previous_row[column + 1]))
+        previous_row = current_row
+    return previous_row[-1]
+
+
+class BitParallelLcsLengthTest(unittest.TestCase):
+    """
+    Checks for bit_parallel_lcs_length function
+    """
+
+    def test_bit_parallel_lcs_length_ideal_case(self):
+        """
+        Tests that bit_parallel_lcs_length function
+            can handle ideal case
+        """
+        first_sentence = ('the', 'dog', 'is', 'running')
+        second_sentence = ('the', 'cat', 'is', 'sleeping')
+        self.assertEqual(2, bit_parallel_lcs_length(first_sentence, second_sentence))
+        self.assertEqual(4, bit_parallel_lcs_length(first_sentence, first_sentence))
+        self.assertEqual(0, bit_parallel_lcs_length(first_sentence, ()))
+        self.assertEqual({'the': 0b101, 'cat': 0b10}, get_match_masks(('the', 'cat', 'the')))
+        self.assertEqual({'cat': 0b10}, get_match_masks(('the', 'cat', 'the'), {'cat', 'dog'}))
+
+    def test_bit_parallel_lcs_length_same_as_matrix(self):
+        """
+        Tests that bit_parallel_lcs_length function
+            gives the lengths of the dynamic programming for random sentences of any lengths
+        """
+        generator = random.Random(1)
+        for _ in range(300):
+            first_sentence = tuple(generator.choice('abcde') for _ in range(generator.randint(1, 40)))
+            second_sentence = tuple(generator.choice('abcde') for _ in range(generator.randint(1, 40)))
+            expected = reference_lcs_length(first_sentence, second_sentence)
+            self.assertEqual(expected, bit_parallel_lcs_length(first_sentence, second_sentence))
+            self.assertEqual(expected, bit_parallel_lcs_length(second_sentence, first_sentence))
+        for _ in range(3):
+            # longer than a block of bits, so the carries pass between the blocks
+            first_sentence = tuple(generator.choice('abcde') for _ in range(generator.randint(4000, 9000)))
+            second_sentence = tuple(generator.choice('abcde') for _ in range(generator.randint(1, 100)))
+            expected = reference_lcs_length(first_sentence, second_sentence)
+            self.assertEqual(expected, bit_parallel_lcs_length(first_sentence, second_sentence))
+            self.assertEqual(expected, bit_parallel_lcs_length(second_sentence, first_sentence))
+
+    def test_find_lcs_length_optimized_threshold(self):
+        """
+        Tests that find_lcs_length_optimized function
+            keeps the threshold of the suspicious sentence
+        """
+        first_sentence = (1, 2, 3, 4, 5)
+        second_sentence = (1, 9, 9, 9, 5)
+        self.assertEqual(2, find_lcs_length_optimized(first_sentence, second_sentence, 0.3))
+        self.assertEqual(0, find_lcs_length_optimized(first_sentence, second_sentence, 0.5))
+        self.assertEqual(0, find_lcs_length_optimized(first_sentence, (), 0.3))
+
+    def test_bit_parallel_lcs_length_big_sequences(self):
+        """
+        Tests that bit_parallel_lcs_length function handles 30000 x 30000 tokens,
+            its time and memory are measured by lab_2/benchmark.py
+        """
+        generator = random.Random(2)
+        first_text = tuple(generator.randrange(2000) for _ in range(30000))
+        second_text = tuple(generator.randrange(2000) for _ in range(30000))
+        actual = bit_parallel_lcs_length(first_text, second_text)
+        prefix_length = reference_lcs_length(first_text[:500], second_text[:500])
+        self.assertEqual(prefix_length, bit_parallel_lcs_length(first_text[:500], second_text[:500]))
+        self.assertTrue(prefix_length <= actual)
+        self.assertEqual(bit_parallel_lcs_length(first_text[:3000], second_text),
+                         bit_parallel_lcs_length(second_text, first_text[:3000]))
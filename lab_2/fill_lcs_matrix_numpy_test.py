@@ -0,0 +1,74 @@
+"""
+Tests fill_lcs_matrix_numpy function
+"""
+
+import random
+import unittest
+import numpy as np
+from lab_2.main import fill_lcs_matrix, find_lcs
+from lab_2.numpy_lcs import encode_sentences, fill_lcs_matrix_numpy
+
+
+class FillLcsMatrixNumpyTest(unittest.TestCase):
+    """
+    Checks for fill_lcs_matrix_numpy function
+    """
+
+    def test_fill_lcs_matrix_numpy_ideal(self):
+        """
+        Tests that fill_lcs_matrix_numpy function
+            can handle ideal case
+        """
+        expected = [[1, 1, 1, 1, 1],
+                    [1, 1, 1, 1, 1],
+                    [1, 1, 2, 2, 2],
+                    [1, 1, 2, 2, 2],
+                    [1, 1, 2, 2, 3]]
+        sentence_first = ('the', 'dog', 'is', 'running', 'here')
+        sentence_second = ('the', 'cat', 'is', 'sleeping', 'here')
+        actual = fill_lcs_matrix_numpy(sentence_first, sentence_second)
+        self.assertEqual(np.uint16, actual.dtype)
+        self.assertEqual(expected, actual.tolist())
+        self.assertEqual(('the', 'is', 'here'), find_lcs(sentence_first, sentence_second, actual))
+
+    def test_fill_lcs_matrix_numpy_same_as_python(self):
+        """
+        Tests that fill_lcs_matrix_numpy function
+            gives the matrix of fill_lcs_matrix for random sentences, including one row or column matrices
+        """
+        generator = random.Random(3)
+        for _ in range(1000):
+            sentence_first = tuple(generator.choice('abc') for _ in range(generator.randint(1, 15)))
+            sentence_second = tuple(generator.choice('abcd') for _ in range(generator.randint(1, 15)))
+            expected = fill_lcs_matrix(sentence_first, sentence_second)
+            actual = fill_lcs_matrix_numpy(sentence_first, sentence_second)
+            self.assertEqual(expected, actual.tolist())
+            self.assertEqual(find_lcs(sentence_first, sentence_second, expected),
+                             find_lcs(sentence_first, sentence_second, actual))
+
+    def test_fill_lcs_matrix_numpy_empty(self):
+        """
+        Tests that fill_lcs_matrix_numpy function
+            gives an empty matrix for empty sentences
+        """
+        self.assertEqual((0, 0), fill_lcs_matrix_numpy((), ('the', 'cat')).shape)
+        self.assertEqual((), find_lcs((), ('the', 'cat'), fill_lcs_matrix_numpy((), ('the', 'cat'))))
+
+    def test_fill_lcs_matrix_numpy_wide_values(self):
+        """
+        Tests that fill_lcs_matrix_numpy function
+            switches to uint32 when the values may not fit into uint16
+        """
+        sentence = tuple(range(70000))
+        actual = fill_lcs_matrix_numpy(sentence[:1], sentence)
+        self.assertEqual(np.uint32, actual.dtype)
+        self.assertEqual(1, actual[0, -1])
+
+    def test_encode_sentences(self):
+        """
+        Tests that encode_sentences function
+            gives shared ids to the tokens of both sentences
+        """
+        first_ids, second_ids = encode_sentences(('the', 'dog'), ('the', 'cat'))
+        self.assertEqual([0, 1], first_ids.tolist())
+        self.assertEqual([0, 2], second_ids.tolist())
@@ -0,0 +1,109 @@
+"""
+Tests find_lcs_linear_space function
+"""
+
+import random
+import unittest
+from lab_2.hirschberg import find_lcs_linear_space, get_lcs_row
+from lab_2.main import fill_lcs_matrix, find_lcs
+
+
+def reference_lcs(first_sentence_tokens: tuple, second_sentence_tokens: tuple) -> tuple:
+    """
+    Traces a full lcs matrix with a zero border by the rule of find_lcs
+    """
+    lcs_matrix = [[0] * (len(second_sentence_tokens) + 1) for _ in range(len(first_sentence_tokens) + 1)]
+    for row, token_1 in enumerate(first_sentence_tokens, 1):
+        for column, token_2 in enumerate(second_sentence_tokens, 1):
+            if token_1 == token_2:
+                lcs_matrix[row][column] = lcs_matrix[row - 1][column - 1] + 1
+            else:
+                lcs_matrix[row][column] = max(lcs_matrix[row - 1][column], lcs_matrix[row][column - 1])
+    lcs = []
+    row, column = len(first_sentence_tokens), len(second_sentence_tokens)
+    while row > 0 and column > 0:
+        if first_sentence_tokens[row - 1] == second_sentence_tokens[column - 1]:
+            lcs.append(first_sentence_tokens[row - 1])
+            row -= 1
+            column -= 1
+        elif lcs_matrix[row - 1][column] > lcs_matrix[row][column - 1]:
+            row -= 1
+        else:
+            column -= 1
+    return tuple(lcs[::-1])
+
+
+class FindLcsLinearSpaceTest(unittest.TestCase):
+    """
+    Checks for find_lcs_linear_space function
+    """
+
+    def test_find_lcs_linear_space_ideal_case(self):
+        """
+        Tests that find_lcs_linear_space function
+            gives the subsequence of find_lcs when the first row and column do not take part
+        """
+        for first_sentence, second_sentence in ((('the', 'dog', 'is', 'running'), ('the', 'cat', 'is', 'sleeping')),
+                                                (('the', 'dog', 'is', 'running', 'here'),
+                                                 ('the', 'cat', 'is', 'sleeping', 'here'))):
+            expected = find_lcs(first_sentence, second_sentence, fill_lcs_matrix(first_sentence, second_sentence))
+            self.assertEqual(expected, find_lcs_linear_space(first_sentence, second_sentence))
+
+    def test_find_lcs_linear_space_differs_from_matrix_pair(self):
+        """
+        Tests that find_lcs_linear_space function
+            finds the full lcs where fill_lcs_matrix without a zero border makes find_lcs return a shorter one
+        """
+        first_sentence = ('a', 'b', 'a')
+        second_sentence = ('b', 'a', 'b', 'a')
+        lcs_matrix = fill_lcs_matrix(first_sentence, second_sentence)
+        self.assertEqual([[0, 1, 1, 1], [2, 2, 2, 2], [2, 3, 3, 3]], lcs_matrix)
+        self.assertEqual(('b', 'a'), find_lcs(first_sentence, second_sentence, lcs_matrix))
+        self.assertEqual(('a', 'b', 'a'), find_lcs_linear_space(first_sentence, second_sentence))
+        self.assertEqual(('a', 'b', 'a'), reference_lcs(first_sentence, second_sentence))
+
+    def test_find_lcs_linear_space_tie_breaking(self):
+        """
+        Tests that find_lcs_linear_space function
+            chooses the same subsequence as the traceback of a full matrix among equally long ones
+        """
+        generator = random.Random(4)
+        for _ in range(2000):
+            alphabet = generator.choice(('ab', 'abc', 'abcdef'))
+            first_sentence = tuple(generator.choice(alphabet) for _ in range(generator.randint(0, 20)))
+            second_sentence = tuple(generator.choice(alphabet) for _ in range(generator.randint(0, 20)))
+            self.assertEqual(reference_lcs(first_sentence, second_sentence),
+                             find_lcs_linear_space(first_sentence, second_sentence))
+        self.assertEqual(('b', 'a'), find_lcs_linear_space(('a', 'b', 'a'), ('b', 'a', 'b')))
+
+    def test_find_lcs_linear_space_long_sentences(self):
+        """
+        Tests that find_lcs_linear_space function
+            handles sentences too long for a full matrix
+        """
+        generator = random.Random(5)
+        first_sentence = tuple(generator.randrange(300) for _ in range(20000))
+        second_sentence = first_sentence[::2] + tuple(generator.randrange(300) for _ in range(10000))
+        actual = find_lcs_linear_space(first_sentence, second_sentence)
+        self.assertTrue(len(actual) >= 10000)
+        iterator = iter(second_sentence)
+        self.assertTrue(all(token in iterator for token in actual))
+
+    def test_find_lcs_linear_space_incorrect_inputs(self):
+        """
+        Tests that find_lcs_linear_space function
+            can handle incorrect inputs
+        """
+        for bad_input in ([], None, 'the cat', ('the', None)):
+            self.assertEqual((), find_lcs_linear_space(bad_input, ('the', 'cat')))
+            self.assertEqual((), find_lcs_linear_space(('the', 'cat'), bad_input))
+        self.assertEqual((), find_lcs_linear_space((), ('the', 'cat')))
+
+    def test_get_lcs_row(self):
+        """
+        Tests that get_lcs_row function
+            gives the last row of a matrix with a zero border
+        """
+        self.assertEqual([0, 1, 1, 2], get_lcs_row(('the', 'is'), ('the', 'cat', 'is')))
+        self.assertEqual([0], get_lcs_row(('the', 'is'), ()))
+        self.assertEqual([0, 0, 0], get_lcs_row((), ('the', 'cat')))
@@ -0,0 +1,79 @@
+"""
+Longest common subsequence recovered in linear space with the Hirschberg algorithm
+"""
+
+from itertools import accumulate
+from lab_2.bit_parallel_lcs import get_match_masks
+
+
+def get_lcs_row(first_sentence_tokens, second_sentence_tokens) -> list:
+    """
+    Finds the last row of the lcs matrix with a zero border: the lcs lengths of the first sequence
+    and of every prefix of the second one, computed with bit vectors along the second sequence
+    :param first_sentence_tokens: a sequence of tokens
+    :param second_sentence_tokens: a sequence of tokens
+    :return: a list of len(second_sentence_tokens) + 1 lengths
+    e.g. first_sentence_tokens = ('the', 'is'), second_sentence_tokens = ('the', 'cat', 'is')
+    --> [0, 1, 1, 2]
+    """
+    if not second_sentence_tokens:
+        return [0]
+    masks = get_match_masks(second_sentence_tokens)
+    all_bits = (1 << len(second_sentence_tokens)) - 1
+    column = all_bits
+    for token in first_sentence_tokens:
+        matches = column & masks.get(token, 0)
+        column = ((column + matches) | (column - matches)) & all_bits
+    # a zero bit is a column where the lcs length grows
+    bits = bin(column)[2:].zfill(len(second_sentence_tokens))[::-1]
+    return list(accumulate((bit == '0' for bit in bits), initial=0))
+
+
+def _split_column(first_half, second_half, second_sentence_tokens) -> int:
+    # the first column where an lcs path crosses from the first half of the rows to the second one
+    forward = get_lcs_row(first_half, second_sentence_tokens)
+    backward = get_lcs_row(second_half[::-1], second_sentence_tokens[::-1])[::-1]
+    lengths = [forward_length + backward_length for forward_length, backward_length in zip(forward, backward)]
+    return lengths.index(max(lengths))
+
+
+def find_lcs_linear_space(first_sentence_tokens: tuple, second_sentence_tokens: tuple) -> tuple:
+    """
+    Finds the longest common subsequence without the lcs matrix: the first sentence is halved,
+    the column where the halves meet is found from the lcs rows of the halves computed forward and backward,
+    and both parts are solved the same way, so only a few rows are kept at a time
+    When several columns are possible, the first one is taken; then the subsequence is the one of
+    the traceback rule of find_lcs applied to a matrix with a zero border: from the last cell, equal tokens
+    are taken, the upper cell is chosen when it is greater than the left one, otherwise the left one
+    The result differs from find_lcs over fill_lcs_matrix when the first row or column takes part:
+    fill_lcs_matrix has no zero border, so its first column continues the last values of the previous rows,
+    and find_lcs stops at the first row or column, so that pair may return another or a shorter subsequence,
+    e.g. ('a', 'b', 'a') and ('b', 'a', 'b', 'a') give ('b', 'a') there and ('a', 'b', 'a') here
+    :param first_sentence_tokens: a tuple of tokens
+    :param second_sentence_tokens: a tuple of tokens
+    :return: the longest common subsequence
+    e.g. first_sentence_tokens = ('the', 'dog', 'is', 'running')
+    second_sentence_tokens = ('the', 'cat', 'is', 'sleeping')
+    --> ('the', 'is')
+    """
+    if not isinstance(first_sentence_tokens, tuple) or not isinstance(second_sentence_tokens, tuple) or \
+            None in first_sentence_tokens or None in second_sentence_tokens:
+        return ()
+    lcs = []
+    # the parts are (first start, first end, second start, second end), solved from the left
+    parts = [(0, len(first_sentence_tokens), 0, len(second_sentence_tokens))]
+    while parts:
+        first_start, first_end, second_start, second_end = parts.pop()
+        if first_start == first_end or second_start == second_end:
+            continue
+        if first_end - first_start == 1:
+            if first_sentence_tokens[first_start] in second_sentence_tokens[second_start:second_end]:
+                lcs.append(first_sentence_tokens[first_start])
+            continue
+        middle = (first_start + first_end) // 2
+        split = second_start + _split_column(first_sentence_tokens[first_start:middle],
+                                             first_sentence_tokens[middle:first_end],
+                                             second_sentence_tokens[second_start:second_end])
+        parts.append((middle, first_end, split, second_end))
+        parts.append((first_start, middle, second_start, split))
+    return tuple(lcs)
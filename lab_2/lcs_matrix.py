@@ -0,0 +1,55 @@
+"""
+Compact lcs matrix stored in one typed array
+"""
+
+from array import array
+from collections.abc import Sequence
+
+MAX_SHORT = (1 << 16) - 1
+
+
+class LcsMatrix(Sequence):
+    """
+    A zero matrix rows * columns kept as one flat array of unsigned integers instead of nested lists:
+    two or four bytes per cell instead of a pointer per cell
+    The type is 'H' when the lengths of the sentences, and so any lcs length, fit into two bytes, otherwise 'I'
+    A row is a writable memoryview of the array, so the matrix is indexed as nested lists
+    e.g. lcs_matrix = LcsMatrix(2, 3)
+    lcs_matrix[1][2] = 1
+    lcs_matrix.tolist()
+    --> [[0, 0, 0], [0, 0, 1]]
+    """
+
+    def __init__(self, rows: int, columns: int):
+        for size in (rows, columns):
+            if not isinstance(size, int) or isinstance(size, bool) or size < 0:
+                raise ValueError
+        self.rows = rows
+        self.columns = columns
+        self.typecode = 'H' if max(rows, columns) <= MAX_SHORT else 'I'
+        self.data = array(self.typecode, [0]) * (rows * columns)
+        self._view = memoryview(self.data)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The size of the values in bytes
+        """
+        return self.data.itemsize * len(self.data)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[index] for index in range(*row.indices(self.rows))]
+        if not -self.rows <= row < self.rows:
+            raise IndexError
+        start = (row % self.rows) * self.columns
+        return self._view[start:start + self.columns]
+
+    def tolist(self) -> list:
+        """
+        Exports the matrix as nested lists, the format of create_zero_matrix and fill_lcs_matrix
+        """
+        return [row.tolist() for row in self]
@@ -0,0 +1,78 @@
+"""
+Tests LcsMatrix class
+"""
+
+import random
+import unittest
+from lab_2.lcs_matrix import LcsMatrix
+from lab_2.main import fill_lcs_matrix, find_lcs, find_lcs_length
+
+
+class LcsMatrixTest(unittest.TestCase):
+    """
+    Checks for LcsMatrix class
+    """
+
+    def test_lcs_matrix_ideal(self):
+        """
+        Tests that LcsMatrix class
+            creates a zero matrix with writable rows
+        """
+        lcs_matrix = LcsMatrix(2, 3)
+        self.assertEqual([[0, 0, 0], [0, 0, 0]], lcs_matrix.tolist())
+        lcs_matrix[1][2] = 1
+        lcs_matrix[-2][0] = 2
+        self.assertEqual([[2, 0, 0], [0, 0, 1]], lcs_matrix.tolist())
+        self.assertEqual(2, len(lcs_matrix))
+        self.assertEqual('H', lcs_matrix.typecode)
+        self.assertEqual(12, lcs_matrix.nbytes)
+        self.assertRaises(IndexError, lcs_matrix.__getitem__, 2)
+
+    def test_lcs_matrix_wide_values(self):
+        """
+        Tests that LcsMatrix class
+            switches to four byte values for long sentences
+        """
+        self.assertEqual('I', LcsMatrix(1, 70000).typecode)
+        self.assertEqual('H', LcsMatrix(1, 65535).typecode)
+
+    def test_fill_lcs_matrix_compact(self):
+        """
+        Tests that fill_lcs_matrix and find_lcs functions
+            give the same results with a compact matrix as with nested lists
+        """
+        expected = [[1, 1, 1, 1, 1],
+                    [1, 1, 1, 1, 1],
+                    [1, 1, 2, 2, 2],
+                    [1, 1, 2, 2, 2],
+                    [1, 1, 2, 2, 3]]
+        sentence_first = ('the', 'dog', 'is', 'running', 'here')
+        sentence_second = ('the', 'cat', 'is', 'sleeping', 'here')
+        lcs_matrix = LcsMatrix(5, 5)
+        self.assertIs(lcs_matrix, fill_lcs_matrix(sentence_first, sentence_second, lcs_matrix))
+        self.assertEqual(expected, lcs_matrix.tolist())
+        self.assertEqual(('the', 'is', 'here'), find_lcs(sentence_first, sentence_second, lcs_matrix))
+        self.assertEqual(3, find_lcs_length(sentence_first, sentence_second, 0.3, lcs_matrix))
+
+        generator = random.Random(7)
+        for _ in range(500):
+            sentence_first = tuple(generator.choice('abc') for _ in range(generator.randint(1, 12)))
+            sentence_second = tuple(generator.choice('abcd') for _ in range(generator.randint(1, 12)))
+            expected = fill_lcs_matrix(sentence_first, sentence_second)
+            actual = fill_lcs_matrix(sentence_first, sentence_second,
+                                     LcsMatrix(len(sentence_first), len(sentence_second)))
+            self.assertEqual(expected, actual.tolist())
+            self.assertEqual(find_lcs(sentence_first, sentence_second, expected),
+                             find_lcs(sentence_first, sentence_second, actual))
+
+    def test_fill_lcs_matrix_compact_incorrect_inputs(self):
+        """
+        Tests that fill_lcs_matrix function
+            rejects matrices of other sizes or types
+        """
+        sentence = ('the', 'cat')
+        self.assertEqual([], fill_lcs_matrix(sentence, sentence, LcsMatrix(2, 3)))
+        self.assertEqual([], fill_lcs_matrix(sentence, sentence, [[0, 0], [0, 0]]))
+        self.assertEqual((), find_lcs(sentence, (), fill_lcs_matrix(sentence, (), LcsMatrix(2, 0))))
+        for bad_input in ((-1, 2), (2, None), (True, 2)):
+            self.assertRaises(ValueError, LcsMatrix, *bad_input)
@@ -4,8 +4,13 @@ Longest common subsequence problem
 import pickle
 import os
 import re
+from lab_2.bit_parallel_lcs import bit_parallel_lcs_length
+from lab_2.lcs_matrix import LcsMatrix
 from lab_2.tokenizer import tokenize
 
+# below this number of cells the per-row NumPy calls cost more than the Python loops of fill_lcs_matrix
+MIN_NUMPY_CELLS = 1 << 12
+
 
 def tokenize_by_lines(text: str) -> tuple:
     """
@@ -44,33 +49,44 @@ def create_zero_matrix(rows: int, columns: int) -> list:
     return zero_matrix
 
 
-def fill_lcs_matrix(first_sentence_tokens: tuple, second_sentence_tokens: tuple) -> list:
+def fill_lcs_matrix(first_sentence_tokens: tuple, second_sentence_tokens: tuple, lcs_matrix=None) -> list:
     """
     Fills a longest common subsequence matrix using the Needleman–Wunsch algorithm
     :param first_sentence_tokens: a tuple of tokens
     :param second_sentence_tokens: a tuple of tokens
+    :param lcs_matrix: a zero matrix of the sentence lengths to fill, e.g. a compact LcsMatrix,
+    a matrix of create_zero_matrix by default
     :return: a lcs matrix
     """
     if not isinstance(first_sentence_tokens, tuple) or not isinstance(second_sentence_tokens, tuple) or \
             None in first_sentence_tokens or None in second_sentence_tokens:
         return []
-    lcs_matrix = create_zero_matrix(len(first_sentence_tokens), len(second_sentence_tokens))
+    if lcs_matrix is None:
+        lcs_matrix = create_zero_matrix(len(first_sentence_tokens), len(second_sentence_tokens))
+    elif not isinstance(lcs_matrix, LcsMatrix) or \
+            (lcs_matrix.rows, lcs_matrix.columns) != (len(first_sentence_tokens), len(second_sentence_tokens)):
+        return []
+    if not second_sentence_tokens:
+        return lcs_matrix
     for row, word_1 in enumerate(first_sentence_tokens):
+        current_row, previous_row = lcs_matrix[row], lcs_matrix[row - 1]
         for column, word_2 in enumerate(second_sentence_tokens):
             if word_1 == word_2:
-                lcs_matrix[row][column] = lcs_matrix[row - 1][column - 1] + 1
+                current_row[column] = previous_row[column - 1] + 1
             else:
-                lcs_matrix[row][column] = max((lcs_matrix[row][column - 1], lcs_matrix[row - 1][column]))
+                current_row[column] = max((current_row[column - 1], previous_row[column]))
     return lcs_matrix
 
 
-def find_lcs_length(first_sentence_tokens: tuple, second_sentence_tokens: tuple, plagiarism_threshold: float) -> int:
+def find_lcs_length(first_sentence_tokens: tuple, second_sentence_tokens: tuple, plagiarism_threshold: float,
+                    lcs_matrix=None) -> int:
     """
     Finds a length of the longest common subsequence using the Needleman–Wunsch algorithm
     When a length is less than the threshold, it becomes 0
     :param first_sentence_tokens: a tuple of tokens
     :param second_sentence_tokens: a tuple of tokens
     :param plagiarism_threshold: a threshold
+    :param lcs_matrix: a matrix already filled for the sentences, it is filled when not given
     :return: a length of the longest common subsequence
     """
     if not isinstance(first_sentence_tokens, tuple) or not isinstance(second_sentence_tokens, tuple) or \
@@ -81,7 +97,8 @@ def find_lcs_length(first_sentence_tokens: tuple, second_sentence_tokens: tuple,
         return -1
     if len(first_sentence_tokens) == 0 or len(second_sentence_tokens) == 0:
         return 0
-    lcs_matrix = fill_lcs_matrix(first_sentence_tokens, second_sentence_tokens)
+    if lcs_matrix is None:
+        lcs_matrix = fill_lcs_matrix(first_sentence_tokens, second_sentence_tokens)
     if len(first_sentence_tokens) > len(second_sentence_tokens):
         lcs_length = max(lcs_matrix[len(second_sentence_tokens)-1])
     else:
@@ -96,20 +113,21 @@ def find_lcs(first_sentence_tokens: tuple, second_sentence_tokens: tuple, lcs_ma
     Finds the longest common subsequence itself using the Needleman–Wunsch algorithm
     :param first_sentence_tokens: a tuple of tokens
     :param second_sentence_tokens: a tuple of tokens
-    :param lcs_matrix: a filled lcs matrix
+    :param lcs_matrix: a filled lcs matrix: nested lists, an LcsMatrix or a NumPy array of fill_lcs_matrix_numpy
     :return: the longest common subsequence
     """
     if not isinstance(first_sentence_tokens, tuple) or not isinstance(second_sentence_tokens, tuple) or \
             None in first_sentence_tokens or None in second_sentence_tokens:
         return ()
-    if not isinstance(lcs_matrix, list) or None in lcs_matrix or \
-            (isinstance(lcs_matrix, list) and None in lcs_matrix):
+    # a NumPy matrix is recognized without importing NumPy
+    is_array = isinstance(lcs_matrix, LcsMatrix) or getattr(lcs_matrix, 'ndim', None) == 2
+    if not is_array and (not isinstance(lcs_matrix, list) or None in lcs_matrix):
         return ()
     if isinstance(lcs_matrix, list) and len(lcs_matrix) > 0:
         if isinstance(lcs_matrix[0], list) and None in lcs_matrix[0]:
             return ()
     lcs = []
-    if lcs_matrix:
+    if len(lcs_matrix) > 0 and len(lcs_matrix[0]) > 0:
         if len(lcs_matrix) == len(first_sentence_tokens) and \
                 len(lcs_matrix[0]) == len(second_sentence_tokens):
             if lcs_matrix[0][0] > 1:
@@ -223,6 +241,38 @@ def find_diff_in_sentence(original_sentence_tokens: tuple, suspicious_sentence_t
     return tuple([tuple(diff_indexes), tuple(diff_indexes)])
 
 
+def analyze_sentence_pair(original_sentence_tokens: tuple, suspicious_sentence_tokens: tuple,
+                          plagiarism_threshold=0.3) -> tuple:
+    """
+    Compares a pair of sentences with one lcs matrix that gives both the lcs length and the lcs itself,
+    long sentences are compared with fill_lcs_matrix_numpy, which fills the same matrix
+    :param original_sentence_tokens: a tuple of tokens
+    :param suspicious_sentence_tokens: a tuple of tokens
+    :param plagiarism_threshold: a threshold
+    :return: a tuple of the lcs length, the lcs, the indexes of differences and the plagiarism score
+    e.g. original_sentence_tokens = ('his', 'name', 'is', 'bruno')
+    suspicious_sentence_tokens = ('his', 'name', 'is', 'paw')
+    --> (3, ('his', 'name', 'is'), ((3, 4), (3, 4)), 0.75)
+    """
+    fill = fill_lcs_matrix
+    if isinstance(original_sentence_tokens, tuple) and isinstance(suspicious_sentence_tokens, tuple) and \
+            None not in original_sentence_tokens and None not in suspicious_sentence_tokens and \
+            len(original_sentence_tokens) * len(suspicious_sentence_tokens) >= MIN_NUMPY_CELLS:
+        # a local import: NumPy takes memory and time to load, so it is loaded only for long sentences
+        # and the other functions of the lab, measured without NumPy, do not load it
+        from lab_2.numpy_lcs import fill_lcs_matrix_numpy  # pylint: disable=import-outside-toplevel
+        fill = fill_lcs_matrix_numpy
+    lcs_matrix = fill(original_sentence_tokens, suspicious_sentence_tokens)
+    lcs_length = int(find_lcs_length(original_sentence_tokens, suspicious_sentence_tokens, plagiarism_threshold,
+                                     lcs_matrix))
+    lcs = find_lcs(original_sentence_tokens, suspicious_sentence_tokens, lcs_matrix)
+    diff_indexes = find_diff_in_sentence(original_sentence_tokens, suspicious_sentence_tokens, lcs)
+    plagiarism_score = calculate_plagiarism_score(lcs_length, suspicious_sentence_tokens)
+    if plagiarism_score == -1:
+        plagiarism_score = 0.0
+    return lcs_length, lcs, diff_indexes, plagiarism_score
+
+
 def accumulate_diff_stats(original_text_tokens: tuple, suspicious_text_tokens: tuple,
                           plagiarism_threshold=0.3) -> dict:
     """
@@ -239,19 +289,13 @@ def accumulate_diff_stats(original_text_tokens: tuple, suspicious_text_tokens: t
      'difference_indexes': list}
     """
     diff_stats = {'sentence_plagiarism': [], 'sentence_lcs_length': [], 'difference_indexes': []}
-    for original_number, original_sentence in enumerate(original_text_tokens):
-        for suspicious_number, suspicious_sentence in enumerate(suspicious_text_tokens):
-            if original_number == suspicious_number:
-                lcs_length = int(find_lcs_length(original_sentence, suspicious_sentence, plagiarism_threshold))
-                lcs_matrix = fill_lcs_matrix(original_sentence, suspicious_sentence)
-                lcs = find_lcs(original_sentence, suspicious_sentence, lcs_matrix)
-                diff_stats['sentence_lcs_length'] += [lcs_length]
-                diff_stats['difference_indexes'] += [find_diff_in_sentence(original_sentence, suspicious_sentence, lcs)]
-                plagiarism_score = calculate_plagiarism_score(lcs_length, suspicious_sentence)
-                if plagiarism_score == -1:
-                    diff_stats['sentence_plagiarism'] += [0.0]
-                else:
-                    diff_stats['sentence_plagiarism'] += [plagiarism_score]
+    for original_sentence, suspicious_sentence in zip(original_text_tokens, suspicious_text_tokens):
+        lcs_length, _, diff_indexes, plagiarism_score = analyze_sentence_pair(original_sentence, suspicious_sentence,
+                                                                              plagiarism_threshold)
+        diff_stats['sentence_lcs_length'] += [lcs_length]
+        diff_stats['difference_indexes'] += [diff_indexes]
+        diff_stats['sentence_plagiarism'] += [plagiarism_score]
+    if original_text_tokens:
         diff_stats['text_plagiarism'] = sum(diff_stats['sentence_plagiarism']) / len(suspicious_text_tokens)
     return diff_stats
 
@@ -299,26 +343,19 @@ def create_diff_report(original_text_tokens: tuple, suspicious_text_tokens: tupl
 def find_lcs_length_optimized(first_sentence_tokens: tuple, second_sentence_tokens: tuple,
                               plagiarism_threshold: float) -> int:
     """
-    Finds a length of the longest common subsequence using an optimized algorithm
+    Finds a length of the longest common subsequence using the bit-parallel algorithm
     When a length is less than the threshold, it becomes 0
     :param first_sentence_tokens: a tuple of tokens
     :param second_sentence_tokens: a tuple of tokens
     :param plagiarism_threshold: a threshold
     :return: a length of the longest common subsequence
     """
-    len_search = min(len(first_sentence_tokens), len(second_sentence_tokens))
-    cur_row = [0] * (len_search + 1)
-    for w_1 in first_sentence_tokens:
-        prev_row = cur_row[:]
-        for col, w_2 in enumerate(second_sentence_tokens):
-            if w_1 == w_2:
-                cur_row[col + 1] = prev_row[col] + 1
-            else:
-                cur_row[col + 1] = max((cur_row[col], prev_row[col + 1]))
-    lcs_len = cur_row[-1]
+    if not second_sentence_tokens:
+        return 0
+    lcs_len = bit_parallel_lcs_length(first_sentence_tokens, second_sentence_tokens)
     if lcs_len / len(second_sentence_tokens) < plagiarism_threshold:
         return 0
-    return lcs_len if not lcs_len / len(second_sentence_tokens) < plagiarism_threshold else 0
+    return lcs_len
 
 
 def tokenize_big_file(path_to_file: str, ids=0) -> tuple:
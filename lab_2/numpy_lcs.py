@@ -0,0 +1,60 @@
+"""
+Longest common subsequence matrix filled with NumPy
+"""
+
+import numpy as np
+
+
+def encode_sentences(first_sentence_tokens: tuple, second_sentence_tokens: tuple) -> tuple:
+    """
+    Replaces the tokens of two sentences with integer ids shared by both sentences
+    :param first_sentence_tokens: a tuple of tokens
+    :param second_sentence_tokens: a tuple of tokens
+    :return: a tuple of two arrays of ids
+    e.g. first_sentence_tokens = ('the', 'dog'), second_sentence_tokens = ('the', 'cat')
+    --> (array([0, 1]), array([0, 2]))
+    """
+    ids = {}
+    first_ids = np.array([ids.setdefault(token, len(ids)) for token in first_sentence_tokens], dtype=np.int64)
+    second_ids = np.array([ids.setdefault(token, len(ids)) for token in second_sentence_tokens], dtype=np.int64)
+    return first_ids, second_ids
+
+
+def get_matrix_dtype(rows: int, columns: int) -> type:
+    """
+    Chooses the narrowest unsigned type for the values of a lcs matrix rows * columns
+    """
+    return np.uint16 if max(rows, columns) <= np.iinfo(np.uint16).max else np.uint32
+
+
+def fill_lcs_matrix_numpy(first_sentence_tokens: tuple, second_sentence_tokens: tuple) -> np.ndarray:
+    """
+    Fills the same matrix as main.fill_lcs_matrix row by row with vectorized operations
+    A cell of a row is either a match, the previous row diagonal value + 1, or the running maximum
+    of the previous row since the last match, so a row is one segmented prefix maximum over
+    the equality row built by broadcasting the token ids
+    As in main.fill_lcs_matrix, the matrix has no zero border: the diagonal value of the first column
+    is the last value of the previous row and a matrix of one row counts the matches of its row
+    :param first_sentence_tokens: a tuple of tokens
+    :param second_sentence_tokens: a tuple of tokens
+    :return: a lcs matrix of uint16 or uint32 values, an empty array for empty sentences
+    """
+    rows, columns = len(first_sentence_tokens), len(second_sentence_tokens)
+    dtype = get_matrix_dtype(rows, columns)
+    if not rows or not columns:
+        return np.zeros((0, 0), dtype=dtype)
+    first_ids, second_ids = encode_sentences(first_sentence_tokens, second_sentence_tokens)
+    matches = first_ids[:, np.newaxis] == second_ids[np.newaxis, :]
+    lcs_matrix = np.zeros((rows, columns), dtype=dtype)
+    if rows == 1:
+        lcs_matrix[0] = np.cumsum(matches[0])
+        return lcs_matrix
+    # a segment starts at every match, the offsets keep the running maximum inside a segment
+    offset = rows + 1
+    previous_row = np.zeros(columns, dtype=np.int64)
+    for row, row_matches in enumerate(matches):
+        values = np.where(row_matches, np.roll(previous_row, 1) + 1, previous_row)
+        segments = np.cumsum(row_matches) * offset
+        previous_row = np.maximum.accumulate(values + segments) - segments
+        lcs_matrix[row] = previous_row
+    return lcs_matrix
@@ -4,6 +4,8 @@ Tokenizer out of lab_1 for usage in lab_2
 
 import re
 
+NON_LETTERS = re.compile('[^a-z \n]')
+
 
 def tokenize(text: str) -> list:
     """
@@ -15,5 +17,5 @@ def tokenize(text: str) -> list:
     """
     if not isinstance(text, str):
         return []
-    text_output = re.sub('[^a-z \n]', '', text.lower()).split()
+    text_output = NON_LETTERS.sub('', text.lower()).split()
     return text_output